@@ -9,13 +9,16 @@ from flask.json import JSONEncoder
 from admin.service import (
     ProductService,
     OrderService,
-    AccountService
+    AccountService,
+    ProductImportService
 )
 
 from admin.view import create_endpoints
 
 from utils.error_handler import error_handle
 from utils.formatter import CustomJSONEncoder
+from utils.query_detector import init_query_detector
+from utils.compression import init_compression
 
 class Service:
     pass
@@ -30,6 +33,7 @@ def create_app():
     services.product_service = ProductService()
     services.order_service = OrderService()
     services.account_service = AccountService()
+    services.product_import_service = ProductImportService()
 
     app.json_encoder = CustomJSONEncoder
 
@@ -39,4 +43,8 @@ def create_app():
     
     error_handle(app)
 
+    init_query_detector(app)
+
+    init_compression(app)
+
     return app
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""할인 기간 시작, 종료 시점에 상품 적용 할인율, 할인가를 갱신하는 scheduler
+
+웹 서버와 별도 프로세스로 한 개만 실행합니다. (여러 개를 실행해도 결과는 같지만 같은 갱신을 중복 실행)
+
+    cd backend/admin
+    python discount_scheduler.py
+"""
+import sys
+sys.path.insert(1, '../')
+
+import logging
+import signal
+import threading
+
+from admin.service import DiscountService
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s %(message)s')
+
+    # SIGTERM, SIGINT를 받으면 종료
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *args: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *args: stop_event.set())
+
+    DiscountService().run_scheduler(stop_event)
+
+
+if __name__ == '__main__':
+    main()
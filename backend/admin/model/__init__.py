@@ -1,9 +1,15 @@
 from .product_dao import ProductDao
 from .order_dao import OrderDao
 from .account_dao import AccountDao
+from .product_import_dao import ProductImportDao
+from .job_dao import JobDao
+from .version_dao import VersionDao
 
 __all__ = [
     "ProductDao",
     "OrderDao",
-    "AccountDao"
+    "AccountDao",
+    "ProductImportDao",
+    "JobDao",
+    "VersionDao"
 ]
\ No newline at end of file
@@ -1,7 +1,34 @@
 
 import pymysql
 
+from utils.projection import select_columns, join_clause
+
 class AccountDao:
+    # 셀러 리스트 출력 field -> (SELECT 컬럼, 필요한 join)
+    LIST_FIELDS = {
+        'seller_id' : (('s.id as seller_id',), ()),
+        'seller_identification' : (('s.seller_identification',), ()),
+        'english_brand_name' : (('s.english_brand_name',), ()),
+        'korean_brand_name' : (('s.korean_brand_name',), ()),
+        'manager_name' : (('m.name as manager_name',), ('managers',)),
+        'seller_status_type' : (('sst.name as seller_status_type',), ('seller_status_type',)),
+        'seller_status_type_button' : (('sst.name as seller_status_type',), ('seller_status_type',)),
+        'manager_phone' : (('m.phone as manager_phone',), ('managers',)),
+        'manager_email' : (('m.email as manager_email',), ('managers',)),
+        'sub_property' : (('sb.name as sub_property',), ('sub_property',)),
+        'seller_created_date' : (('s.created_at as seller_created_date',), ())
+    }
+
+    # 셀러 리스트 join 이름 -> (JOIN 절, 먼저 필요한 join)
+    LIST_JOINS = {
+        'managers' : ("INNER JOIN managers as m ON m.id = (SELECT MIN(id) FROM managers WHERE seller_id = s.id)", ()),
+        'sub_property' : ("INNER JOIN sub_property as sb ON s.sub_property_id = sb.id", ()),
+        'seller_status_type' : ("INNER JOIN seller_status_type as sst ON sst.id = s.seller_status_type_id", ())
+    }
+
+    # fields와 관계없이 항상 사용하는 join (managers는 담당자가 없는 셀러를 제외)
+    BASE_JOINS = ('managers',)
+
     def __new__(cls, *args, **kwargs):
         if not hasattr(cls, '_instance'):
             cls._instance = super().__new__(cls)
@@ -287,25 +314,26 @@ class AccountDao:
             return cursor.fetchone()
 
     # id도 함께 날려준다.
-    def get_seller_status(self, conn, seller_status_type):
-        """ 셀러 계정 상태 가져오는 함수
+    def get_seller_status(self, conn):
+        """ 셀러 계정 상태별 상태 변경 버튼을 가져오는 함수
 
-        셀러 계정 상태(입점, 입점신청 등)와 변화될 상태 id를 가져오는 함수
+        모든 셀러 계정 상태(입점, 입점신청 등)와 변화될 상태 id를 한 번에 가져오는 함수 (셀러 리스트에서 행마다 조회하지 않음)
 
         Args:
             conn (Connection): DB 커넥션 객체
-            seller_status_type (dict) :                 
-                "seller_status_type_button": [
-                        {
-                            "button_name": 상태 변경 버튼
-                            "to_status_type_id": 상태 변경 후 변경될 seller_status_type_id
-                        },
-                        {
-                            "button_name": 상태 변경 버튼
-                            "to_status_type_id": 상태 변경 후 변경될 seller_status_type_id
-                        }
-                    ],
 
+        Returns:
+            list : 
+                [
+                    {
+                        "status_name": 셀러 상태 이름,
+                        "seller_status_type_id": 셀러 상태 id,
+                        "seller_status_button_id": 상태 변경 버튼 id (없으면 None),
+                        "button_name": 상태 변경 버튼 (없으면 None),
+                        "to_status_type_id": 상태 변경 후 변경될 seller_status_type_id (없으면 None)
+                    },
+                    ...
+                ]
         """
 
         sql = """
@@ -322,13 +350,13 @@ class AccountDao:
             LEFT OUTER JOIN
                 seller_status_button AS ssb
                 ON ssb.id = sstb.seller_status_button_id
-            WHERE
-                sst.name = %(seller_status_type)s
-            ORDER BY sst.id ASC;
+            ORDER BY
+                sst.id ASC,
+                sstb.seller_status_button_id ASC;
         """
 
         with conn.cursor() as cursor:
-            cursor.execute(sql, {"seller_status_type":seller_status_type})
+            cursor.execute(sql)
             return cursor.fetchall()
             
 
@@ -336,6 +364,7 @@ class AccountDao:
         """ 셀러 계정 리스트
 
         셀러 계정 관리에서 셀러 리스트를 가져오는 함수
+        params['fields']에 있는 field의 컬럼과, 그 컬럼 및 검색 조건에 필요한 join, 행 수가 달라지는 join(BASE_JOINS)만 사용
 
         Args:
             conn (Connection): DB 커넥션 객체
@@ -350,38 +379,13 @@ class AccountDao:
                     "manager_email": 담당자 이메일,
                     "sub_property": 셀러 속성,
                     "seller_created_date": 셀러 계정 생성 날짜
-                }
-
-        """
-        select = """
-            SELECT 
-        """
-
-        seller_info = """
-                sst.id AS seller_status_type_id,
-                s.id as seller_id, 
-                s.seller_identification, 
-                s.english_brand_name, 
-                s.korean_brand_name, 
-                m.name as manager_name, 
-                sst.name as seller_status_type, 
-                m.phone as manager_phone, 
-                m.email as manager_email, 
-                sb.name as sub_property, 
-                s.created_at as seller_created_date
+                },
+                fields (parse_fields 결과, 없으면 전체)
         """
+        fields = params.get('fields') or tuple(self.LIST_FIELDS)
+        filter_joins = set()
 
         condition = """
-            FROM 
-                sellers as s
-            INNER JOIN
-                managers as m ON m.id = (
-                    SELECT MIN(id) FROM managers WHERE seller_id = s.id
-                )
-            INNER JOIN
-                sub_property as sb ON s.sub_property_id = sb.id
-            INNER JOIN
-                seller_status_type as sst ON sst.id = s.seller_status_type_id
             WHERE
                     s.created_at BETWEEN '0000-00-00 00:00:00' AND '9999-12-30 00:00:00'
                 AND 
@@ -389,8 +393,6 @@ class AccountDao:
         """
         # is_deleted가 1인 것은 표출 안되도록 추가
 
-        sql_1 = select + seller_info + condition
-
         if 'id' in params:
             condition += """
                 AND
@@ -417,6 +419,7 @@ class AccountDao:
             """
         
         if 'manager_name' in params:
+            filter_joins.add('managers')
             condition += """
                 AND
                     m.name LIKE %(manager_name)s
@@ -429,6 +432,7 @@ class AccountDao:
             """
         
         if 'manager_phone' in params:
+            filter_joins.add('managers')
             condition += """
                 AND
                     m.phone LIKE %(manager_phone)s
@@ -453,12 +457,28 @@ class AccountDao:
                     %(offset)s
         """
 
-        count = """
-                COUNT(*) as count 
+        # 행 수가 달라지는 join(BASE_JOINS)은 항상 사용하고, 개수는 fields와 관계없이 BASE_JOINS와 검색 조건 join만 사용
+        tables = f"""
+            FROM 
+                sellers as s
+            {join_clause(fields, self.LIST_FIELDS, self.LIST_JOINS, {*self.BASE_JOINS, *filter_joins})}
+        """
+
+        count_tables = f"""
+            FROM 
+                sellers as s
+            {join_clause((), self.LIST_FIELDS, self.LIST_JOINS, {*self.BASE_JOINS, *filter_joins})}
         """
 
-        sql_select_seller_info = select + seller_info + condition + limit
-        sql_select_seller_count = select + count + condition + limit
+        sql_select_seller_info = f"""
+            SELECT
+                {select_columns(fields, self.LIST_FIELDS)}
+        """ + tables + condition + limit
+        sql_select_seller_count = """
+            SELECT
+                COUNT(*) as count
+        """ + count_tables + condition
+
         with conn.cursor() as cursor:
             cursor.execute(sql_select_seller_info, params)
             seller_info_list = cursor.fetchall()
@@ -0,0 +1,170 @@
+class JobDao:
+    def __new__(cls, *args, **kwargs):
+        if not hasattr(cls, '_instance'):
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def create_job(self, conn, params: dict):
+        """작업 생성
+
+        같은 idempotency_key의 작업이 이미 있으면 새로 만들지 않음
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (dict): {'job_type', 'payload', 'idempotency_key', 'max_attempts', 'delay': 실행까지 대기 시간(초)}
+
+        Returns:
+            int: 생성된 작업 id (이미 있으면 0)
+        """
+        sql = """
+            INSERT INTO
+            job_outbox (
+                job_type,
+                payload,
+                idempotency_key,
+                max_attempts,
+                run_at
+            )
+            VALUES (
+                %(job_type)s,
+                %(payload)s,
+                %(idempotency_key)s,
+                %(max_attempts)s,
+                NOW() + INTERVAL %(delay)s SECOND
+            )
+            ON DUPLICATE KEY UPDATE
+                id = id
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.lastrowid
+
+    def create_jobs(self, conn, params: list):
+        """바로 실행할 작업 여러 개를 multi-row INSERT로 생성 (같은 idempotency_key의 작업은 건너뜀)
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (list): [{'job_type', 'payload', 'idempotency_key', 'max_attempts'}, ...]
+        """
+        sql = """
+            INSERT INTO
+            job_outbox (
+                job_type,
+                payload,
+                idempotency_key,
+                max_attempts
+            )
+            VALUES (
+                %(job_type)s,
+                %(payload)s,
+                %(idempotency_key)s,
+                %(max_attempts)s
+            )
+            ON DUPLICATE KEY UPDATE
+                id = id
+        """
+        with conn.cursor() as cursor:
+            cursor.executemany(sql, params)
+
+    def get_runnable_job(self, conn, params: dict):
+        """실행할 작업 한 개를 lock을 잡고 조회
+
+        실행 시간이 된 대기 작업 또는 lock_timeout 보다 오래 실행 중인(worker가 종료된) 작업
+        SKIP LOCKED로 다른 worker가 잡고 있는 작업은 건너뜀 (MySQL 8.0 이상)
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (dict): {'job_types': 실행할 작업 종류 list, 'lock_timeout': 실행 중 상태 유지 시간(초)}
+        """
+        sql = """
+            SELECT
+                j.id AS job_id,
+                j.job_type,
+                j.payload,
+                j.attempts,
+                j.max_attempts
+            FROM
+                job_outbox AS j
+            WHERE
+                j.job_type IN %(job_types)s
+                AND (
+                    (j.status = 'PENDING' AND j.run_at <= NOW())
+                    OR (j.status = 'RUNNING' AND j.locked_at <= NOW() - INTERVAL %(lock_timeout)s SECOND)
+                )
+            ORDER BY
+                j.run_at
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()
+
+    def lock_job(self, conn, params: dict):
+        sql = """
+            UPDATE job_outbox
+            SET
+                status = 'RUNNING',
+                attempts = attempts + 1,
+                locked_at = NOW()
+            WHERE
+                id = %(job_id)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def touch_job(self, conn, params: dict):
+        """실행 중인 작업의 locked_at 갱신 (오래 실행되는 작업을 다른 worker가 다시 가져가지 않도록)"""
+        sql = """
+            UPDATE job_outbox
+            SET
+                locked_at = NOW()
+            WHERE
+                idempotency_key = %(idempotency_key)s
+                AND status = 'RUNNING'
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def complete_job(self, conn, params: dict):
+        sql = """
+            UPDATE job_outbox
+            SET
+                status = 'DONE',
+                locked_at = NULL,
+                finished_at = NOW()
+            WHERE
+                id = %(job_id)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def retry_job(self, conn, params: dict):
+        """실패한 작업을 delay(초) 후에 다시 실행하도록 변경"""
+        sql = """
+            UPDATE job_outbox
+            SET
+                status = 'PENDING',
+                locked_at = NULL,
+                run_at = NOW() + INTERVAL %(delay)s SECOND,
+                last_error = %(last_error)s
+            WHERE
+                id = %(job_id)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def fail_job(self, conn, params: dict):
+        """최대 시도 횟수를 넘은 작업은 실패 처리 (다시 실행하지 않음)"""
+        sql = """
+            UPDATE job_outbox
+            SET
+                status = 'FAILED',
+                locked_at = NULL,
+                last_error = %(last_error)s,
+                finished_at = NOW()
+            WHERE
+                id = %(job_id)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
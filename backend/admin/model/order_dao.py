@@ -1,6 +1,10 @@
 import pymysql
 from flask import g
 
+from utils.projection import select_columns, join_clause
+from utils.query_detector import QueryCountingSSCursor
+from utils.constant import ORDER_EXPORT_NET_WRITE_TIMEOUT, SELLER
+
 from flask import g
 
 class OrderDao:
@@ -9,179 +13,245 @@ class OrderDao:
             cls._instance = super().__new__(cls)
         return cls._instance
 
+    # 주문 리스트 출력 field -> (SELECT 컬럼, 필요한 join)
+    LIST_FIELDS = {
+        'orders_detail_id' : (('d.id AS orders_detail_id',), ()),
+        'order_created_at' : (('o.created_at AS order_created_at',), ()),
+        'order_number' : (('o.order_number',), ()),
+        'order_detail_number' : (('d.detail_order_number AS order_detail_number',), ()),
+        'brand_name' : (('s.korean_brand_name AS brand_name',), ('sellers',)),
+        'product_name' : (('p.title AS product_name',), ('products',)),
+        'color' : (('c.name AS color',), ('color',)),
+        'size' : (('si.name AS size',), ('size',)),
+        'quantity' : (('d.quantity',), ()),
+        'order_username' : (('o.order_username',), ()),
+        'orderer_phone' : (('u.phone AS orderer_phone',), ('users',)),
+        'order_status_type' : (('ost.name AS order_status_type',), ('order_status_type',)),
+        # 주문 금액은 주문 당시 가격(price)과 주문 시점에 저장된 할인율(discount_rate_bp)로 utils.money에서 계산
+        'total_price' : (('d.price', 'd.discount_rate_bp', 'd.quantity'), ())
+    }
+
+    # 주문 리스트 join 이름 -> (JOIN 절, 먼저 필요한 join)
+    LIST_JOINS = {
+        'products' : ("INNER JOIN products AS p ON p.id = d.product_id", ()),
+        'sellers' : ("INNER JOIN sellers AS s ON s.id = p.seller_id", ('products',)),
+        'options' : ("INNER JOIN options AS op ON op.product_id = p.id", ('products',)),
+        'color' : ("INNER JOIN color AS c ON op.color_id = c.id", ('options',)),
+        'size' : ("INNER JOIN size AS si ON si.id = op.size_id", ('options',)),
+        'users' : ("INNER JOIN users AS u ON u.id = o.user_id", ()),
+        'order_status_type' : ("INNER JOIN order_status_type AS ost ON ost.id = d.order_status_type_id", ())
+    }
+
+    # fields와 관계없이 항상 사용하는 join (options는 상품 옵션 수만큼 행이 늘고, 나머지는 join 대상이 없는 주문을 제외)
+    BASE_JOINS = ('options', 'color', 'size', 'users', 'order_status_type')
+
     def __init__(self):
         pass
     
-    def get_order_list(self, conn, params):
-        """ 주문 조회 리스트 dao
+    def make_order_list_condition(self, params):
+        """ 주문 리스트 검색 조건 (주문 상태 조건 제외)
 
-        주문 조회 리스트 정보를 DB에서 가져오기 위한 함수
+        셀러 계정은 자신의 상품 주문만 조회 (리스트, 개수, 파일 export 모두 이 조건 사용), 마스터 계정은 전체
 
         Args:
-            conn (Connection): DB 커넥션 객체
             params (dict) : query parameter로 받은 정보 (셀러명, 조회 기간 등)
-        
-        Returns:
-            order_list_info (dict) : 주문 리스트 정보
-            orders_count (dict) : 주문 전체 개수
-        """
 
-        select = """ 
-            SELECT 
-        """
-        order_info = """
-                o.created_at AS created_at,
-                o.order_number, 
-                d.id AS orders_detail_id,
-                d.detail_order_number, 
-                s.korean_brand_name,
-                p.title,  
-                p.discount_rate,
-                p.discount_start_date,
-                p.discount_end_date,
-                si.name AS size_name, 
-                c.name AS color_name, 
-                d.quantity,
-                o.order_username,
-                u.phone AS orderer_phone,
-                d.price,
-                ost.name AS order_status_type
+        Returns:
+            condition (str) : WHERE 절
+            filter_joins (set) : 검색 조건에 필요한 join 이름 (LIST_JOINS)
         """
-
-        condition = """    
-            FROM 
-                orders as o
-            INNER JOIN 
-                orders_detail as d ON o.id = d.order_id
-            INNER JOIN 
-                products as p ON p.id = d.product_id 
-            INNER JOIN 
-                sellers as s ON s.id = p.seller_id 
-            INNER JOIN 
-                options as op ON op.product_id = p.id
-            INNER JOIN 
-                users AS u ON u.id = o.user_id
-            INNER JOIN 
-                sub_property as sp ON sp.id = s.sub_property_id
-            INNER JOIN
-                color as c ON op.color_id = c.id
-            INNER JOIN
-                size as si ON si.id = op.size_id
-            INNER JOIN 
-                order_status_type as ost ON ost.id = d.order_status_type_id
+        condition = """
             WHERE 
                     o.created_at BETWEEN %(start_date)s AND %(end_date)s
-                AND 
-                    d.order_status_type_id=%(order_status_type_id)s
-        """ 
-        
-        sql_select_info = select + order_info + condition
+        """
+        filter_joins = set()
+
+        if g.account_type_id == SELLER:
+            params['account_id'] = g.account_id
+            filter_joins.add('sellers')
+            condition += """
+                AND
+                    s.account_id = %(account_id)s
+            """
 
         if "sub_property_id" in params:
-            sql_select_info += """
+            filter_joins.add('sellers')
+            condition += """
                 AND 
-                    sp.id = %(sub_property_id)s
+                    s.sub_property_id IN %(sub_property_id)s
             """
         
         if "order_number" in params:
-            sql_select_info += """
+            condition += """
                 AND 
-                    o.order_number = %(order_number)s
+                    o.order_number IN %(order_number)s
             """
         
         if "order_detail_number" in params:
-            sql_select_info += """
+            condition += """
                 AND
-                    d.detail_order_number = %(order_detail_number)s
+                    d.detail_order_number IN %(order_detail_number)s
             """
 
         if "seller_name" in params:
-            sql_select_info += """
+            filter_joins.add('sellers')
+            condition += """
                 AND
-                    s.korean_brand_name = %(seller_name)s
+                    s.korean_brand_name IN %(seller_name)s
             """
         
         if "order_username" in params:
-            sql_select_info += """
+            condition += """
                 AND 
                     o.order_username = %(order_username)s
             """
         
-        if "phone" in params:
-            sql_select_info += """
+        if "orderer_phone" in params:
+            filter_joins.add('users')
+            condition += """
                 AND
                     u.phone = %(orderer_phone)s
             """
         
         if "product_name" in params:
-            sql_select_info += """
+            filter_joins.add('products')
+            condition += """
                 AND
                     p.title = %(product_name)s
             """
+
+        return condition, filter_joins
+
+    def get_order_list(self, conn, params):
+        """ 주문 조회 리스트 dao
+
+        주문 조회 리스트 정보를 DB에서 가져오기 위한 함수
+        params['fields']에 있는 field의 컬럼과, 그 컬럼 및 검색 조건에 필요한 join, 행 수가 달라지는 join(BASE_JOINS)만 사용
+        주문 상태, 셀러 속성, 셀러명, 주문 번호, 주문 상세 번호는 여러 값(tuple)을 IN 조건으로 검색
+
+        group_counts가 'status'이면 주문 상태 조건을 뺀 나머지 조건으로 주문 상태별 개수를 GROUP BY 한 번으로 조회하고,
+        전체 개수는 그중 요청한 주문 상태의 개수 합으로 계산 (COUNT 쿼리를 따로 실행하지 않음)
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (dict) : query parameter로 받은 정보 (셀러명, 조회 기간 등), fields (parse_fields 결과, 없으면 전체)
         
-        sql_select_info += """
+        Returns:
+            order_list_info (dict) : 주문 리스트 정보
+            orders_count (dict) : 주문 전체 개수
+            status_counts (list) : [{'order_status_type_id': 주문 상태 아이디, 'count': 개수}, ...], group_counts가 없으면 None
+        """
+        fields = params.get('fields') or tuple(self.LIST_FIELDS)
+
+        condition, filter_joins = self.make_order_list_condition(params)
+
+        status_condition = """
+                AND 
+                    d.order_status_type_id IN %(order_status_type_id)s
+        """
+
+        # 리스트와 개수가 같은 행을 세도록 행 수가 달라지는 join(BASE_JOINS)은 항상 사용하고,
+        # 개수, 주문 상태별 개수는 fields와 관계없이 BASE_JOINS와 검색 조건 join만 사용
+        tables = f"""
+            FROM 
+                orders as o
+            INNER JOIN 
+                orders_detail as d ON o.id = d.order_id
+            {join_clause(fields, self.LIST_FIELDS, self.LIST_JOINS, {*self.BASE_JOINS, *filter_joins})}
+        """
+
+        count_tables = f"""
+            FROM 
+                orders as o
+            INNER JOIN 
+                orders_detail as d ON o.id = d.order_id
+            {join_clause((), self.LIST_FIELDS, self.LIST_JOINS, {*self.BASE_JOINS, *filter_joins})}
+        """
+
+        sql_select_info = f"""
+            SELECT
+                {select_columns(fields, self.LIST_FIELDS)}
+            {tables}
+            {condition}
+            {status_condition}
                 LIMIT
                     %(limit)s
                 OFFSET
                     %(page)s
         """
 
-        count = """
-                COUNT(*) as count 
+        sql_select_count = f"""
+            SELECT
+                COUNT(*) as count
+            {count_tables}
+            {condition}
+            {status_condition}
         """
-        
-        sql_select_count = select + count + condition
-
-        if "sub_property_id" in params:
-            sql_select_count += """
-                AND 
-                    sp.id = %(sub_property_id)s
-            """
-        
-        if "order_number" in params:
-            sql_select_count += """
-                AND 
-                    o.order_number = %(order_number)s
-            """
-        
-        if "order_detail_number" in params:
-            sql_select_count += """
-                AND
-                    d.detail_order_number = %(order_detail_number)s
-            """
 
-        if "seller_name" in params:
-            sql_select_count += """
-                AND
-                    s.korean_brand_name = %(seller_name)s
-            """
-        
-        if "order_username" in params:
-            sql_select_count += """
-                AND 
-                    o.order_username = %(order_username)s
-            """
-        
-        if "phone" in params:
-            sql_select_count += """
-                AND
-                    u.phone = %(orderer_phone)s
-            """
-        
-        if "product_name" in params:
-            sql_select_count += """
-                AND
-                    p.title = %(product_name)s
-            """
+        sql_select_status_counts = f"""
+            SELECT
+                d.order_status_type_id,
+                COUNT(*) as count
+            {count_tables}
+            {condition}
+            GROUP BY
+                d.order_status_type_id
+        """
 
         with conn.cursor() as cursor:
             cursor.execute(sql_select_info, params)
             order_list_info = cursor.fetchall()
 
+            if params.get('group_counts') == 'status':
+                cursor.execute(sql_select_status_counts, params)
+                status_counts = cursor.fetchall()
+                order_counts = {
+                    'count' : sum(row['count'] for row in status_counts if row['order_status_type_id'] in params['order_status_type_id'])
+                }
+                return order_list_info, order_counts, status_counts
+
             cursor.execute(sql_select_count, params)
             order_counts = cursor.fetchone()
             
-            return order_list_info, order_counts
+            return order_list_info, order_counts, None
+
+    def get_order_export(self, conn, params):
+        """ 주문 리스트 파일 export 조회
+
+        get_order_list와 같은 검색 조건(페이지 조건 제외)의 전체 행을 unbuffered cursor로 조회
+        결과를 한 번에 메모리에 올리지 않고 iterate 할 때 DB에서 한 행씩 읽음
+        cursor는 conn을 닫을 때 같이 정리되므로 iterate가 끝난 뒤 conn을 닫아야 하고, 그동안 같은 conn으로 다른 쿼리를 실행할 수 없음
+        정렬하면 전체 행을 정렬한 뒤에야 첫 행이 오므로 ORDER BY 없이 조회
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (dict) : get_order_list와 같은 검색 조건, fields (parse_fields 결과, 없으면 전체)
+
+        Returns:
+            cursor (QueryCountingSSCursor) : iterate 하면 주문 리스트 행(dict)
+        """
+        fields = params.get('fields') or tuple(self.LIST_FIELDS)
+
+        condition, filter_joins = self.make_order_list_condition(params)
+
+        sql = f"""
+            SELECT
+                {select_columns(fields, self.LIST_FIELDS)}
+            FROM 
+                orders as o
+            INNER JOIN 
+                orders_detail as d ON o.id = d.order_id
+            {join_clause(fields, self.LIST_FIELDS, self.LIST_JOINS, {*self.BASE_JOINS, *filter_joins})}
+            {condition}
+                AND 
+                    d.order_status_type_id IN %(order_status_type_id)s
+        """
+
+        cursor = conn.cursor(QueryCountingSSCursor)
+        # 다운로드가 느려 결과 전송이 멈춰도 서버가 연결을 끊지 않도록 이 연결에서만 늘림
+        cursor.execute("SET SESSION net_write_timeout = %s", ORDER_EXPORT_NET_WRITE_TIMEOUT)
+        cursor.execute(sql, params)
+        return cursor
         
     def get_status_type(self, conn):
         """ 주문 상태 데이터
@@ -255,6 +325,7 @@ class OrderDao:
         """ 주문 상태를 변경할 수 있는지 확인
 
         구매확정, 환불완료 등 이미 변경할 수 없는 상태인지 확인하기 위한 함수
+        요청한 주문을 IN 조건으로 한 번에 조회 (DB에 없는 주문은 결과에 없음)
 
         Args:   
             conn (Connection): DB커넥션 객체
@@ -276,49 +347,62 @@ class OrderDao:
                 ]
         """
         
-        order_detail_results = list()
-        for data in body:
-            sql = """
-                SELECT
-                    id AS orders_detail_id,
-                    order_status_type_id
-                FROM
-                    orders_detail
-                WHERE
-                    id = %(orders_detail_id)s
-            """
+        if not body:
+            return list()
+
+        sql = """
+            SELECT
+                id AS orders_detail_id,
+                order_status_type_id
+            FROM
+                orders_detail
+            WHERE
+                id IN %(orders_detail_ids)s
+        """
 
-            with conn.cursor() as cursor:
-                cursor.execute(sql, data)
-                order_detail_results.append(cursor.fetchone())
-        return order_detail_results
+        with conn.cursor() as cursor:
+            cursor.execute(sql, {'orders_detail_ids': tuple(data['orders_detail_id'] for data in body)})
+            return cursor.fetchall()
 
 
     def patch_order_status_type(self, conn, possible_to_patch):
         """ DB에서 주문 및 배송처리 함수
 
         DB에서 해당하는 row의 주문 상태를 변경해줌
+        주문마다 변경할 상태가 달라도 CASE로 UPDATE 한 번에 실행 (executemany는 UPDATE를 행마다 실행)
 
         Args: 
             conn (Connection): DB 커넥션 객체
             possible_change_order_status (list): order_service에서 걸러진 주문들 (주문 상태를 변경하지 못하는 주문들은 제외됨)
         """
-        sql = """
+        if not possible_to_patch:
+            return
+
+        params = {'orders_detail_ids': tuple(data['orders_detail_id'] for data in possible_to_patch)}
+        cases = list()
+        for idx, data in enumerate(possible_to_patch):
+            params[f'orders_detail_id_{idx}'] = data['orders_detail_id']
+            params[f'order_status_type_id_{idx}'] = data['order_status_type_id']
+            cases.append(f"WHEN %(orders_detail_id_{idx})s THEN %(order_status_type_id_{idx})s")
+
+        sql = f"""
             UPDATE 
                 orders_detail
             SET
-                order_status_type_id = %(order_status_type_id)s
+                order_status_type_id = CASE id
+                    {' '.join(cases)}
+                END
             WHERE 
-                orders_detail.id = %(orders_detail_id)s  
+                orders_detail.id IN %(orders_detail_ids)s
         """
 
         with conn.cursor() as cursor:
-            cursor.executemany(sql, possible_to_patch)
+            cursor.execute(sql, params)
 
     def insert_order_detail_history(self, conn, results):
         """주문 히스토리 데이터 삽입
 
-        주문 상태 변경 후 주문 히스토리에 row를 추가함
+        주문 상태 변경 후 주문 히스토리에 row를 추가함 (INSERT ... SELECT 한 번으로 변경된 주문 모두 추가)
 
         Args:
             conn (Connection) : DB 커넥션 객체
@@ -330,38 +414,42 @@ class OrderDao:
                     ...
                 ]
         """
+        if not results:
+            return
 
-        for data in results:
-            sql = """
-                INSERT INTO order_detail_history(
-                    order_detail_id,
-                    order_status_type_id,
-                    address_id,
-                    modify_account_id,
-                    price
-                )
-                SELECT
-                    id,
-                    order_status_type_id,
-                    address_id,
-                    %(account_id)s,
-                    price
-                FROM
-                    orders_detail
-                WHERE
-                    id = %(orders_detail_id)s
-            """
+        sql = """
+            INSERT INTO order_detail_history(
+                order_detail_id,
+                order_status_type_id,
+                address_id,
+                modify_account_id,
+                price
+            )
+            SELECT
+                id,
+                order_status_type_id,
+                address_id,
+                %(account_id)s,
+                price
+            FROM
+                orders_detail
+            WHERE
+                id IN %(orders_detail_ids)s
+        """
 
-            # modify account id를 위해서 추가
-            data["account_id"] = g.account_id
-            with conn.cursor() as cursor:
-                cursor.execute(sql, data)
+        # modify account id를 위해서 추가
+        params = {
+            'account_id' : g.account_id,
+            'orders_detail_ids' : tuple(data['orders_detail_id'] for data in results)
+        }
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
 
             
     def get_order(self, conn, params):
         """ 주문 상세 확인 
 
-        주문 상세 정보를 가져옴
+        주문 상세 정보를 가져옴 (셀러 계정은 자신의 상품 주문만)
 
         Args:
             conn (Connection) : DB 커넥션 객체
@@ -369,7 +457,7 @@ class OrderDao:
                 {"detail_order_number" : 주문 상세 번호}
         
         Returns:
-            dict : 주문과 관련된 상세 정보 반환 
+            dict : 주문과 관련된 상세 정보 반환, 없거나 다른 셀러의 주문이면 None 
             list : 주문 이력 반환
         """
         sql_select_info = """
@@ -381,8 +469,8 @@ class OrderDao:
                 u.phone as order_phone,
                 p.id as product_id, 
                 op.id as option_id, 
-                p.price, 
-                p.discount_rate, 
+                od.price, 
+                od.discount_rate_bp, 
                 p.discount_start_date, 
                 p.discount_end_date, 
                 p.title, 
@@ -423,9 +511,17 @@ class OrderDao:
             INNER JOIN 
                 order_status_type as ost ON ost.id = od.order_status_type_id
             WHERE  
-                od.detail_order_number = %(detail_order_number)s;
+                od.detail_order_number = %(detail_order_number)s
         """
 
+        # 셀러 계정은 자신의 상품 주문만 조회
+        if g.account_type_id == SELLER:
+            params['account_id'] = g.account_id
+            sql_select_info += """
+                AND
+                    s.account_id = %(account_id)s
+            """
+
         sql_select_history = """
             SELECT 
                 odh.updated_at AS updated_at,
@@ -444,6 +540,9 @@ class OrderDao:
             cursor.execute(sql_select_info, params)
             order_info = cursor.fetchone()
 
+            if not order_info:
+                return None, list()
+
             cursor.execute(sql_select_history, params)
             order_history = cursor.fetchall()
 
@@ -1,55 +1,89 @@
 from flask import g
+from pymysql.constants.ER import DUP_ENTRY
+from pymysql.err import IntegrityError
+
+from utils.code_generator import generate_code
+from utils.projection import select_columns, join_clause
+from utils.constant import PRODUCTS_VERSION, SELLERS_VERSION, CODE_COLLISION_RETRIES
+
+def insert_with_new_codes(conn, sql: str, params: list, code_key: str, unique_key: str):
+    """코드 컬럼을 포함한 multi-row INSERT, 코드 unique index 중복이면 모든 행에 새 코드를 만들어 다시 입력
+
+    CODE_WORKER_ID를 지정하지 않은 프로세스끼리 worker id가 같으면 코드가 중복될 수 있음
+    실패한 INSERT 문은 문장 단위로 rollback 되므로 같은 transaction에서 다시 실행
+    params의 코드 값은 새 코드로 변경됨
+    """
+    for attempt in range(CODE_COLLISION_RETRIES + 1):
+        try:
+            with conn.cursor() as cursor:
+                cursor.executemany(sql, params)
+            return
+
+        except IntegrityError as e:
+            if e.args[0] != DUP_ENTRY or unique_key not in str(e.args[1]) or attempt == CODE_COLLISION_RETRIES:
+                raise
+
+            for param in params:
+                param[code_key] = generate_code()
+
+
 class ProductDao:
     def __new__(cls, *args, **kwargs):
         if not hasattr(cls, '_instance'):
             cls._instance = super().__new__(cls)
         return cls._instance
 
+    # 상품 리스트 출력 field -> (SELECT 컬럼, 필요한 join)
+    LIST_FIELDS = {
+        'upload_date' : (('p.created_at as upload_date',), ()),
+        'image_url' : (('COALESCE(pi.thumbnail_url, pi.image_url) as image_url',), ()),
+        'title' : (('p.title',), ()),
+        'product_code' : (('p.product_code',), ()),
+        'id' : (('p.id',), ()),
+        'seller_id' : (('p.seller_id',), ()),
+        'price' : (('p.price',), ()),
+        'discount_rate' : (('p.effective_discount_rate as discount_rate',), ()),
+        'discount_price' : (('p.effective_price as discount_price',), ()),
+        'is_displayed' : (('p.is_displayed',), ()),
+        'is_selling' : (('p.is_selling',), ()),
+        'image_status' : (('p.image_status',), ()),
+        'korean_brand_name' : (('s.korean_brand_name',), ('sellers',)),
+        'sub_property' : (('sp.name as sub_property',), ('sub_property',))
+    }
+
+    # 상품 리스트 join 이름 -> (JOIN 절, 먼저 필요한 join)
+    LIST_JOINS = {
+        'sellers' : ("INNER JOIN sellers as s ON p.seller_id = s.id", ()),
+        'sub_property' : ("INNER JOIN sub_property as sp ON s.sub_property_id = sp.id", ('sellers',))
+    }
+
     def __init__(self):
         pass
 
     def get_products_list(self, conn, params, headers):
-        info_select = """
-            SELECT
-                p.created_at as upload_date,
-                pi.image_url,
-                p.title,
-                p.product_code,
-                p.id,
-                p.seller_id,
-                p.price,
-                IF(p.discount_start_date <= NOW() AND p.discount_end_date >= NOW(), round(p.discount_rate, 2), 0) as discount_rate,
-                IF(p.discount_start_date <= NOW() AND p.discount_end_date >= NOW(), p.price - p.price * round(p.discount_rate, 2), p.price) as discount_price,
-                p.is_displayed,
-                p.is_selling,
-                s.korean_brand_name,
-                sp.name as sub_property
-        """
-        count_select = """
-            SELECT
-                count(0) as total_count
+        """상품 리스트
+
+        params['fields']에 있는 field의 컬럼과, 그 컬럼 및 검색 조건에 필요한 join만 사용
+        대표 이미지 join은 대표 이미지가 있는 상품만 조회하는 조건이므로 항상 사용
         """
+        fields = params.get('fields') or tuple(self.LIST_FIELDS)
+        filter_joins = set()
 
         sql = """
-            FROM
-                products as p
-            INNER JOIN 
-                product_images as pi
-                ON p.id = pi.product_id
-                AND pi.is_represent = 1
-            INNER JOIN 
-                sellers as s
-                ON p.seller_id = s.id
-            INNER JOIN 
-                sub_property as sp
-                ON s.sub_property_id = sp.id
             WHERE
                 1 + 1
         """
         
-        page_sql = """
+        # 정렬 (할인가 정렬은 effective_price index 사용)
+        order_by = {
+            'latest' : 'p.created_at DESC',
+            'price_asc' : 'p.effective_price ASC, p.id ASC',
+            'price_desc' : 'p.effective_price DESC, p.id DESC'
+        }[params.get('sort', 'latest')]
+
+        page_sql = f"""
             ORDER BY
-                p.created_at DESC
+                {order_by}
             LIMIT
                 %(limit)s
             OFFSET
@@ -69,24 +103,37 @@ class ProductDao:
             """
         # 속성 리스트에 존재하는 셀러 선택
         if 'sub_property' in params:
+            filter_joins.add('sellers')
             sql += """
                 AND
                     s.sub_property_id IN %(sub_property)s
             """
-        # 할인여부 중 할인
+        # 할인여부 중 할인 (현재 할인 기간인 상품)
         if 'discount' in params and params['discount'] :
             sql += """
                 AND
-                    p.discount_rate > 0
+                    p.effective_discount_rate > 0
             """
         # 할인여부 중 미할인
         if 'discount' in params and not params['discount'] :
             sql += """
                 AND
-                    p.discount_rate = 0
+                    p.effective_discount_rate = 0
+            """
+        # 할인가 범위
+        if 'min_price' in params:
+            sql += """
+                AND
+                    p.effective_price >= %(min_price)s
+            """
+        if 'max_price' in params:
+            sql += """
+                AND
+                    p.effective_price <= %(max_price)s
             """
         # 셀러명으로 검색
         if 'seller' in params:
+            filter_joins.add('sellers')
             sql += """
                 AND
                     s.korean_brand_name = %(seller)s
@@ -136,14 +183,44 @@ class ProductDao:
         # 셀러계정일 때 해당 셀러상품만 검색
         if g.account_type_id == 2:
             params['account_id'] = g.account_id
+            filter_joins.add('sellers')
             
             sql += """
                 AND
                     s.account_id = %(account_id)s
             """
         
-        product_sql = info_select + sql + page_sql
-        total_sql = count_select + sql
+        tables = f"""
+            FROM
+                products as p
+            INNER JOIN 
+                product_images as pi
+                ON p.id = pi.product_id
+                AND pi.is_represent = 1
+                AND pi.is_deleted = 0
+            {join_clause(fields, self.LIST_FIELDS, self.LIST_JOINS, filter_joins)}
+        """
+
+        # 개수는 fields와 관계없이 대표 이미지, 검색 조건 join만 사용 (sellers, sub_property는 FK join이라 행 수가 같음)
+        count_tables = f"""
+            FROM
+                products as p
+            INNER JOIN 
+                product_images as pi
+                ON p.id = pi.product_id
+                AND pi.is_represent = 1
+                AND pi.is_deleted = 0
+            {join_clause((), self.LIST_FIELDS, self.LIST_JOINS, filter_joins)}
+        """
+
+        product_sql = f"""
+            SELECT
+                {select_columns(fields, self.LIST_FIELDS)}
+        """ + tables + sql + page_sql
+        total_sql = """
+            SELECT
+                count(0) as total_count
+        """ + count_tables + sql
 
         with conn.cursor() as cursor:
             cursor.execute(product_sql, params)
@@ -157,7 +234,83 @@ class ProductDao:
 
             return product_result, total_count_result
 
-    def create_product_info_dao(self, conn, params: dict):
+    def update_effective_price(self, conn, product_ids: list):
+        """현재 시간 기준으로 상품의 적용 할인율, 할인가 갱신
+
+        할인 기간 안이면 할인율과 할인가(원 단위 버림), 아니면 0과 판매가
+        상품 등록, 수정 후와 discount scheduler가 할인 시작, 종료 시점에 호출
+        """
+        sql = """
+            UPDATE products AS p
+            SET
+                p.effective_discount_rate = IF(p.discount_start_date <= NOW() AND p.discount_end_date >= NOW(), p.discount_rate, 0),
+                p.effective_price = IF(p.discount_start_date <= NOW() AND p.discount_end_date >= NOW(), FLOOR(p.price * (1 - p.discount_rate)), p.price)
+            WHERE
+                p.id IN %(product_ids)s
+        """
+        with conn.cursor() as cursor:
+            return cursor.execute(sql, {'product_ids': tuple(product_ids)})
+
+    def update_stale_effective_price(self, conn):
+        """적용 할인율, 할인가가 현재 시간 기준 값과 다른 상품 모두 갱신 (scheduler 시작 시 중단된 동안의 변경 반영)"""
+        sql = """
+            UPDATE products AS p
+            SET
+                p.effective_discount_rate = IF(p.discount_start_date <= NOW() AND p.discount_end_date >= NOW(), p.discount_rate, 0),
+                p.effective_price = IF(p.discount_start_date <= NOW() AND p.discount_end_date >= NOW(), FLOOR(p.price * (1 - p.discount_rate)), p.price)
+            WHERE
+                p.effective_discount_rate <> IF(p.discount_start_date <= NOW() AND p.discount_end_date >= NOW(), p.discount_rate, 0)
+                OR p.effective_price <> IF(p.discount_start_date <= NOW() AND p.discount_end_date >= NOW(), FLOOR(p.price * (1 - p.discount_rate)), p.price)
+        """
+        with conn.cursor() as cursor:
+            return cursor.execute(sql)
+
+    def get_discount_boundaries(self, conn, params: dict):
+        """start < 시점 <= end 인 할인 시작, 종료 시점
+
+        할인 기간은 종료 시간을 포함하므로 종료 시점은 discount_end_date + 1초
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (dict): {'start': 조회 시작 시간, 'end': 조회 끝 시간}
+
+        Returns:
+            list: [{'product_id': 상품아이디, 'boundary': 적용 할인율이 바뀌는 시간}, ...]
+        """
+        sql = """
+            SELECT
+                p.id AS product_id,
+                p.discount_start_date AS boundary
+            FROM
+                products AS p
+            WHERE
+                p.discount_start_date > %(start)s
+                AND p.discount_start_date <= %(end)s
+            UNION ALL
+            SELECT
+                p.id AS product_id,
+                p.discount_end_date + INTERVAL 1 SECOND AS boundary
+            FROM
+                products AS p
+            WHERE
+                p.discount_end_date > %(start)s - INTERVAL 1 SECOND
+                AND p.discount_end_date <= %(end)s - INTERVAL 1 SECOND
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def get_now(self, conn):
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT NOW() AS now")
+            return cursor.fetchone()['now']
+
+    def create_product_info_dao(self, conn, params: list):
+        """상품 일괄 생성
+
+        Returns:
+            list: params 순서대로 생성된 product의 id
+        """
         sql = """
             INSERT INTO
             products (
@@ -203,47 +356,233 @@ class ProductDao:
                 %(max_amount)s
             )
         """
+        # multi-row INSERT 한 번으로 등록 후, 생성된 id는 product_code로 한 번에 조회
+        insert_with_new_codes(conn, sql, params, 'product_code', 'uk_products_product_code')
+
+        product_ids = self.get_product_ids_by_product_codes(conn, [product['product_code'] for product in params])
+        return [product_ids[product['product_code']] for product in params]
+
+    def get_product_ids_by_product_codes(self, conn, product_codes: list):
+        """product_code로 상품 id 조회
+
+        Returns:
+            dict: {product_code: product_id}
+        """
+        sql = """
+            SELECT
+                p.id AS product_id,
+                p.product_code
+            FROM
+                products AS p
+            WHERE
+                p.product_code IN %(product_codes)s
+        """
         with conn.cursor() as cursor:
-            cursor.execute(sql, params)
-            return cursor.lastrowid
+            cursor.execute(sql, {'product_codes': tuple(product_codes)})
+            return {row['product_code']: row['product_id'] for row in cursor.fetchall()}
     
-    def create_product_history(self, conn, params: dict):
+    def create_product_history(self, conn, params: list):
+        """상품 history checkpoint(전체 컬럼) 생성"""
         sql = """
             INSERT INTO
             product_history (
                 product_id,
                 modify_account_id,
+                is_checkpoint,
                 is_selling,
                 is_displayed,
                 title,
                 simple_description,
                 content,
+                price,
                 discount_rate,
                 discount_start_date,
                 discount_end_date,
                 min_amount,
-                max_amount
+                max_amount,
+                manufacturer,
+                date_of_manufacture,
+                origin
             )
             VALUES (
                 %(product_id)s,
                 %(modify_account_id)s,
+                1,
                 %(is_selling)s,
                 %(is_displayed)s,
                 %(title)s,
                 %(simple_description)s,
                 %(content)s,
+                %(price)s,
                 %(discount_rate)s,
                 %(discount_start_date)s,
                 %(discount_end_date)s,
                 %(min_amount)s,
-                %(max_amount)s
+                %(max_amount)s,
+                %(manufacturer)s,
+                %(date_of_manufacture)s,
+                %(origin)s
+            )
+        """
+        with conn.cursor() as cursor:
+            cursor.executemany(sql, params)
+
+    def create_product_history_diff(self, conn, params: list):
+        """상품 history diff(변경된 컬럼만) 생성
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (list): [{'product_id', 'modify_account_id', 'changes': 변경된 컬럼 JSON}, ...]
+        """
+        sql = """
+            INSERT INTO
+            product_history (
+                product_id,
+                modify_account_id,
+                is_checkpoint,
+                changes
+            )
+            VALUES (
+                %(product_id)s,
+                %(modify_account_id)s,
+                0,
+                %(changes)s
             )
         """
+        with conn.cursor() as cursor:
+            cursor.executemany(sql, params)
+
+    def get_products_history_columns(self, conn, product_ids: list):
+        """product_history에 기록하는 상품 컬럼 조회
+
+        Returns:
+            dict: {상품아이디: {컬럼: 값}}
+        """
+        sql = """
+            SELECT
+                p.id AS product_id,
+                p.is_selling,
+                p.is_displayed,
+                p.title,
+                p.simple_description,
+                p.content,
+                p.price,
+                p.discount_rate,
+                p.discount_start_date,
+                p.discount_end_date,
+                p.min_amount,
+                p.max_amount,
+                p.manufacturer,
+                p.date_of_manufacture,
+                p.origin
+            FROM
+                products AS p
+            WHERE
+                p.id IN %(product_ids)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, {'product_ids': tuple(product_ids)})
+            return {row.pop('product_id'): row for row in cursor.fetchall()}
+
+    def get_product_history_diff_counts(self, conn, product_ids: list):
+        """상품별 마지막 checkpoint 이후 diff 개수
+
+        Returns:
+            dict: {상품아이디: diff 개수}, checkpoint가 없는 상품은 포함되지 않음
+        """
+        sql = """
+            SELECT
+                c.product_id,
+                COUNT(h.id) AS diff_count
+            FROM
+                (
+                    SELECT
+                        product_id,
+                        MAX(id) AS checkpoint_id
+                    FROM
+                        product_history
+                    WHERE
+                        product_id IN %(product_ids)s
+                        AND is_checkpoint = 1
+                    GROUP BY
+                        product_id
+                ) AS c
+            LEFT JOIN
+                product_history AS h
+                ON h.product_id = c.product_id
+                AND h.id > c.checkpoint_id
+            GROUP BY
+                c.product_id
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, {'product_ids': tuple(product_ids)})
+            return {row['product_id']: row['diff_count'] for row in cursor.fetchall()}
+
+    def get_product_history(self, conn, params: dict):
+        """상품 history를 checkpoint부터 id 순서로 조회
+
+        at이 있으면 at 이전의 마지막 checkpoint부터 at까지, 없으면 전체
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (dict): {'product_id': 상품아이디, 'at': 조회 시점 (없으면 None)}
+        """
+        sql = """
+            SELECT
+                h.id AS history_id,
+                h.modify_account_id,
+                h.is_checkpoint,
+                h.changes,
+                h.is_selling,
+                h.is_displayed,
+                h.title,
+                h.simple_description,
+                h.content,
+                h.price,
+                h.discount_rate,
+                h.discount_start_date,
+                h.discount_end_date,
+                h.min_amount,
+                h.max_amount,
+                h.manufacturer,
+                h.date_of_manufacture,
+                h.origin,
+                h.created_at
+            FROM
+                product_history AS h
+            WHERE
+                h.product_id = %(product_id)s
+        """
+
+        if params.get('at'):
+            sql += """
+                AND h.created_at <= %(at)s
+                AND h.id >= (
+                    SELECT
+                        MAX(c.id)
+                    FROM
+                        product_history AS c
+                    WHERE
+                        c.product_id = %(product_id)s
+                        AND c.is_checkpoint = 1
+                        AND c.created_at <= %(at)s
+                )
+            """
+
+        sql += """
+            ORDER BY
+                h.id
+        """
         with conn.cursor() as cursor:
             cursor.execute(sql, params)
-            return cursor.lastrowid
+            return cursor.fetchall()
 
     def create_option_info_dao(self, conn, option_info: list):
+        """옵션 일괄 생성
+
+        Returns:
+            list: option_info 순서대로 생성된 option의 id
+        """
         sql = """
             INSERT INTO
             options (
@@ -263,12 +602,11 @@ class ProductDao:
                 %(option_code)s
             )
         """
-        with conn.cursor() as cursor:
-            option_ids = list()
-            for option in option_info:
-                cursor.execute(sql, option)
-                option_ids.append(cursor.lastrowid)
-            return option_ids
+        # multi-row INSERT 한 번으로 등록 후, 생성된 id는 option_code로 한 번에 조회
+        insert_with_new_codes(conn, sql, option_info, 'option_code', 'uk_options_option_code')
+
+        option_ids = self.get_option_ids_by_option_codes(conn, [option['option_code'] for option in option_info])
+        return [option_ids[option['option_code']] for option in option_info]
     
     def create_option_history(self, conn, option_info: list):
         sql = """
@@ -294,12 +632,20 @@ class ProductDao:
             INSERT INTO product_images (
                 product_id,
                 image_url,
+                thumbnail_url,
+                list_url,
+                detail_url,
+                content_hash,
                 is_represent,
                 created_account_id
             )
             VALUES (
                 %(product_id)s,
                 %(image_url)s,
+                %(thumbnail_url)s,
+                %(list_url)s,
+                %(detail_url)s,
+                %(content_hash)s,
                 %(is_represent)s,
                 %(created_account_id)s
             )
@@ -307,41 +653,156 @@ class ProductDao:
         with conn.cursor() as cursor:
             cursor.executemany(sql, params)
 
+    def start_image_jobs(self, conn, params: dict):
+        """상품들의 이미지 작업 순번을 올리고 image_status를 PENDING으로 변경 (상품 row lock은 commit 까지 유지)
+
+        Args:
+            params (dict): {'product_ids': 상품 id list}
+
+        Returns:
+            dict: {상품 id: 새 작업 순번}
+        """
+        sql = """
+            UPDATE products
+            SET
+                image_seq = image_seq + 1,
+                image_status = 'PENDING'
+            WHERE
+                id IN %(product_ids)s
+        """
+        select_sql = """
+            SELECT
+                id AS product_id,
+                image_seq
+            FROM
+                products
+            WHERE
+                id IN %(product_ids)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            cursor.execute(select_sql, params)
+            return {row['product_id']: row['image_seq'] for row in cursor.fetchall()}
+
+    def get_image_seq(self, conn, params: dict, for_update: bool = False):
+        """상품의 현재 이미지 작업 순번 (for_update면 commit 까지 상품 row lock)"""
+        sql = f"""
+            SELECT
+                image_seq
+            FROM
+                products
+            WHERE
+                id = %(product_id)s
+            {'FOR UPDATE' if for_update else ''}
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+            return row['image_seq'] if row else None
+
+    def update_image_status(self, conn, params: dict):
+        """상품 이미지 변환 작업 상태 변경 (DONE, FAILED), 작업 순번이 상품의 현재 순번과 같을 때만"""
+        sql = """
+            UPDATE products
+            SET
+                image_status = %(image_status)s
+            WHERE
+                id = %(product_id)s
+                AND image_seq = %(image_seq)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
+
+    def get_images_by_content_hashes(self, conn, content_hashes: list):
+        """이미 저장된 이미지의 url 조회
+
+        Returns:
+            dict: {content_hash: {'image_url', 'thumbnail_url', 'list_url', 'detail_url'}}
+        """
+        if not content_hashes:
+            return dict()
+
+        sql = """
+            SELECT
+                pi.content_hash,
+                pi.image_url,
+                pi.thumbnail_url,
+                pi.list_url,
+                pi.detail_url
+            FROM
+                product_images as pi
+            WHERE
+                pi.content_hash IN %(content_hashes)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, {'content_hashes': tuple(content_hashes)})
+            return {row.pop('content_hash'): row for row in cursor.fetchall()}
+
+    def get_product_images(self, conn, product_id: int):
+        """상품의 현재 이미지 (대표 이미지부터 등록 순서대로)"""
+        sql = """
+            SELECT
+                pi.id,
+                pi.content_hash
+            FROM
+                product_images as pi
+            WHERE
+                pi.product_id = %s
+                AND pi.is_deleted = 0
+            ORDER BY
+                pi.is_represent DESC,
+                pi.id
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, product_id)
+            return cursor.fetchall()
+
     def patch_product_selling_or_display_status(self, conn, product_check_success_result):
         """상품 판매, 진열 상태 변경 함수
 
         요청 받은 상품 중 존재하거나 권한이 있는 상품의 판매, 진열여부를 변경한다.
+        변경할 값(display, selling)이 같은 상품끼리 묶어 그룹마다 UPDATE 한 번만 실행하므로
+        상품 개수와 상관없이 최대 8번(display, selling 각각 미입력/0/1 조합)만 실행된다.
 
         Arg:
             conn (Connection): DB 커넥션 객체
             product_check_success_result (list): service layer에서 걸러진 상품 리스트 
             
         """
+        # (진열여부, 판매여부) 별 상품 아이디 묶음. 요청에 없는 값은 None
+        groups = dict()
         for product_check_result in product_check_success_result:
-            sql = """
-                UPDATE
-                    products as p       
-                SET
-            """
-            comma = ''
-            
-            if 'display' in product_check_result:
-                sql += """
-                    p.is_displayed = %(display)s
-                """
-                comma = ','
-            
-            if 'selling' in product_check_result:
-                sql += f"""
-                    {comma}p.is_selling = %(selling)s
+            key = (product_check_result.get('display'), product_check_result.get('selling'))
+            groups.setdefault(key, list()).append(product_check_result['product_id'])
+
+        with conn.cursor() as cursor:
+            for (display, selling), product_ids in groups.items():
+                set_list = list()
+
+                if display is not None:
+                    set_list.append("p.is_displayed = %(display)s")
+
+                if selling is not None:
+                    set_list.append("p.is_selling = %(selling)s")
+
+                if not set_list:
+                    continue
+
+                sql = f"""
+                    UPDATE
+                        products as p
+                    SET
+                        {', '.join(set_list)}
+                    WHERE
+                        p.id IN %(product_ids)s
                 """
-            sql1 = """
-                WHERE
-                    p.id = %(product_id)s
-            """
-            sql += sql1
-            with conn.cursor() as cursor:
-                cursor.execute(sql, product_check_result)
+                product_data = {
+                    'display' : display,
+                    'selling' : selling,
+                    'product_ids' : tuple(product_ids)
+                }
+                cursor.execute(sql, product_data)
 
 
     def check_product_exists(self, conn, params):
@@ -399,64 +860,23 @@ class ProductDao:
             cursor.execute(sql, product_data)
             return cursor.fetchall()
 
-    def insert_product_history(self, conn, product_check_results):
-        """상품 히스토리 입력 함수
+    def get_product_detail(self, conn, params):
+        """상품 코드로 상품 상세 조회
 
-        변경된 상품의 이력을 남기는 함수
+        상품 정보와 상품 이미지, 옵션 목록을 한 번의 쿼리로 가져온다.
+        이미지와 옵션은 product_code로 찾은 상품의 id로 조회해 JSON 배열 문자열로 반환한다.
+        JSON_ARRAYAGG는 순서를 보장하지 않으므로 정렬은 서비스에서 id로 한다.
+        상세 캐시에 사용하도록 셀러 계정 scope의 상품, 셀러 version을 같은 쿼리(같은 snapshot)에서 함께 읽는다.
 
-        Arg:
+        Args:
             conn (Connection): DB 커넥션 객체
-            params (list):
-                [
-                    {"product_id" : 상품아이디, "selling" : 판매여부, "display" : 진열여부, 'is_exists' : 존재여부},
-                    {"product_id" : 상품아이디, "selling" : 판매여부, "display" : 진열여부, 'is_exists' : 존재여부},
-                    {"product_id" : 상품아이디, "selling" : 판매여부, "display" : 진열여부, 'is_exists' : 존재여부}
-                    ...
-                ] 
+            params (dict): { 'product_code' : 상품코드 }
 
+        Returns:
+            [dict]: 상품 정보와
+                images  : '[{"id": 이미지번호, "image_url": 이미지 URL, "is_represent": 대표이미지 여부}, ...]'
+                options : '[{"id": 옵션번호, "stock": 재고, "color": 색상, "color_id": 색상 아이디, "size": 사이즈, "size_id": 사이즈 아이디}, ...]'
         """
-        sql = """
-            INSERT INTO product_history(
-                product_id,
-                modify_account_id,
-                is_selling,
-                is_displayed,
-                title,
-                price,
-                content,
-                discount_rate,
-                discount_start_date,
-                discount_end_date,
-                min_amount,
-                max_amount
-            )
-            SELECT
-                p.id,
-                %(account_id)s,
-                is_selling,
-                is_displayed,
-                title,
-                price,
-                content,
-                discount_rate,
-                discount_start_date,
-                discount_end_date,
-                min_amount,
-                max_amount
-            FROM
-                products as p
-            WHERE
-                p.id IN %(product_ids)s
-        """
-        product_data = {
-            'product_ids' : product_check_results,
-            'account_id' : g.account_id
-        }
-        with conn.cursor() as cursor:
-            cursor.execute(sql, product_data)
-
-
-    def get_product_detail(self, conn, params):
         sql = """
             SELECT
                 p.product_code,
@@ -481,7 +901,66 @@ class ProductDao:
                 p.min_amount,
                 p.max_amount,
                 p.id as product_id,
-                s.korean_brand_name as seller_name
+                p.image_status,
+                s.korean_brand_name as seller_name,
+                s.account_id as seller_account_id,
+                (
+                    SELECT
+                        COALESCE(MAX(tv.version), 0)
+                    FROM
+                        table_versions as tv
+                    WHERE
+                        tv.table_name = %(products_version)s
+                        AND tv.scope_id = s.account_id
+                ) as products_version,
+                (
+                    SELECT
+                        COALESCE(MAX(tv.version), 0)
+                    FROM
+                        table_versions as tv
+                    WHERE
+                        tv.table_name = %(sellers_version)s
+                        AND tv.scope_id = s.account_id
+                ) as sellers_version,
+                (
+                    SELECT
+                        JSON_ARRAYAGG(
+                            JSON_OBJECT(
+                                'id', pi.id,
+                                'image_url', pi.image_url,
+                                'is_represent', pi.is_represent
+                            )
+                        )
+                    FROM
+                        product_images as pi
+                    WHERE
+                        pi.product_id = p.id
+                        AND pi.is_deleted = 0
+                ) as images,
+                (
+                    SELECT
+                        JSON_ARRAYAGG(
+                            JSON_OBJECT(
+                                'id', o.id,
+                                'stock', o.stock,
+                                'color', co.name,
+                                'color_id', co.id,
+                                'size', si.name,
+                                'size_id', si.id
+                            )
+                        )
+                    FROM
+                        options as o
+                    INNER JOIN
+                        color as co
+                        ON o.color_id = co.id
+                    INNER JOIN
+                        size as si
+                        ON o.size_id = si.id
+                    WHERE
+                        o.product_id = p.id
+                        AND o.is_deleted = 0
+                ) as options
             FROM 
                 products as p
             INNER JOIN
@@ -501,6 +980,8 @@ class ProductDao:
             """
 
         params['account_id'] = g.account_id
+        params['products_version'] = PRODUCTS_VERSION
+        params['sellers_version'] = SELLERS_VERSION
         if g.account_type_id == 2:
             sql += """
                 AND
@@ -510,54 +991,6 @@ class ProductDao:
         with conn.cursor() as cursor:
             cursor.execute(sql, params)
             return cursor.fetchone()
-    
-    def get_product_images_by_product_code(self, conn, params):
-        sql = """
-            SELECT
-                pi.image_url,
-                pi.is_represent
-            FROM
-                product_images as pi
-            INNER JOIN
-                products as p
-                ON p.id = pi.product_id
-                AND p.product_code = %(product_code)s
-            WHERE
-                pi.is_deleted = 0
-        """
-        
-        with conn.cursor() as cursor:
-            cursor.execute(sql, params)
-            return cursor.fetchall()
-
-    def get_product_options_by_product_code(self, conn, params):
-        sql = """
-            SELECT
-                o.id,
-                o.stock,
-                c.name as color,
-                c.id as color_id,
-                s.name as size,
-                s.id as size_id
-            FROM
-                options as o
-            INNER JOIN
-                products as p
-                ON p.id = o.product_id
-                AND p.product_code = %(product_code)s
-            INNER JOIN
-                color as c
-                ON o.color_id = c.id
-            INNER JOIN
-                size as s
-                ON o.size_id = s.id
-            WHERE
-                o.is_deleted = 0
-        """
-
-        with conn.cursor() as cursor:
-            cursor.execute(sql, params)
-            return cursor.fetchall()
 
     def search_seller_dao(self, conn, params: dict):
         sql = """
@@ -665,52 +1098,11 @@ class ProductDao:
         with conn.cursor() as cursor:
             cursor.execute(sql, params)
     
-    def patch_products_history(self, conn, params: dict):
-        sql = """
-            INSERT INTO product_history (
-                product_id,
-                modify_account_id,
-                is_selling,
-                is_displayed,
-                title,
-                simple_description,
-                content,
-                price,
-                discount_rate,
-                discount_start_date,
-                discount_end_date,
-                min_amount,
-                max_amount,
-                manufacturer,
-                date_of_manufacture,
-                origin
-            )
-            VALUES (
-                %(product_id)s,
-                %(modify_account_id)s,
-                %(is_selling)s,
-                %(is_displayed)s,
-                %(title)s,
-                %(simple_description)s,
-                %(content)s,
-                %(price)s,
-                %(discount_rate)s,
-                %(discount_start_date)s,
-                %(discount_end_date)s,
-                %(min_amount)s,
-                %(max_amount)s,
-                %(manufacturer)s,
-                %(date_of_manufacture)s,
-                %(origin)s
-            )
-        """
-        with conn.cursor() as cursor:
-            cursor.execute(sql, params)
-    
     def get_options_by_product_id(self, conn, product_id: int):
         sql = """
             SELECT
                 op.id AS option_id,
+                op.option_code,
                 op.color_id,
                 op.size_id,
                 op.price,
@@ -726,68 +1118,74 @@ class ProductDao:
             cursor.execute(sql, product_id)
             return cursor.fetchall()
     
-    def update_option_info(self, conn, update_data: list):
-        sql = """
-            UPDATE options
-            SET
-                color_id = %(color_id)s,
-                size_id = %(size_id)s,
-                price = %(price)s,
-                stock = %(stock)s,
-                is_deleted = 0
-            WHERE 
-                product_id = %(product_id)s
+    def upsert_option_info(self, conn, option_info: list):
+        """옵션 일괄 저장
 
+        id가 있는 옵션은 수정하고, id가 None인 옵션은 새로 등록 (multi-row INSERT 한 번으로 실행)
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            option_info (list): [{'id', 'product_id', 'color_id', 'size_id', 'price', 'stock', 'option_code'}, ...]
         """
-        with conn.cursor() as cursor:
-            cursor.executemany(sql, update_data)
-    
-    def update_option_history(self, conn, update_data: list):
         sql = """
-            INSERT INTO options_history (
-                option_id,
-                modify_account_id,
+            INSERT INTO
+            options (
+                id,
+                product_id,
+                color_id,
+                size_id,
                 price,
-                is_deleted
+                stock,
+                option_code
             )
             VALUES (
-                %(option_id)s,
-                %(modify_account_id)s,
+                %(id)s,
+                %(product_id)s,
+                %(color_id)s,
+                %(size_id)s,
                 %(price)s,
-                0
+                %(stock)s,
+                %(option_code)s
             )
+            ON DUPLICATE KEY UPDATE
+                color_id = VALUES(color_id),
+                size_id = VALUES(size_id),
+                price = VALUES(price),
+                stock = VALUES(stock),
+                is_deleted = 0
         """
         with conn.cursor() as cursor:
-            cursor.executemany(sql, update_data)
-    
-    def delete_option_info(self, conn, exist_options: list):
+            cursor.executemany(sql, option_info)
+
+    def get_option_ids_by_option_codes(self, conn, option_codes: list):
+        """option_code로 옵션 id 조회
+
+        Returns:
+            dict: {option_code: option_id}
+        """
         sql = """
-            UPDATE options 
-            SET
-                is_deleted = 1
+            SELECT
+                op.id AS option_id,
+                op.option_code
+            FROM
+                options AS op
             WHERE
-                id = %(option_id)s
+                op.option_code IN %(option_codes)s
         """
         with conn.cursor() as cursor:
-            cursor.executemany(sql, exist_options)
+            cursor.execute(sql, {'option_codes': tuple(option_codes)})
+            return {row['option_code']: row['option_id'] for row in cursor.fetchall()}
     
-    def delete_option_history(self, conn, exist_options: list):
+    def delete_option_info(self, conn, option_ids: list):
         sql = """
-            INSERT INTO options_history (
-                option_id,
-                price,
-                modify_account_id,
-                is_deleted
-            )
-            VALUES (
-                %(option_id)s,
-                %(price)s,
-                %(modify_account_id)s,
-                1
-            )
+            UPDATE options 
+            SET
+                is_deleted = 1
+            WHERE
+                id IN %(option_ids)s
         """
         with conn.cursor() as cursor:
-            cursor.executemany(sql, exist_options)
+            cursor.execute(sql, {'option_ids': tuple(option_ids)})
         
     def delete_images_in_product_images(self, conn, params: dict):
         sql = """
@@ -0,0 +1,175 @@
+from utils.query_detector import QueryCountingSSCursor
+
+
+class ProductImportDao:
+    def __new__(cls, *args, **kwargs):
+        if not hasattr(cls, '_instance'):
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def create_import_job(self, conn, params: dict):
+        sql = """
+            INSERT INTO
+            product_import_jobs (
+                account_id,
+                filename
+            )
+            VALUES (
+                %(account_id)s,
+                %(filename)s
+            )
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.lastrowid
+
+    def update_import_job(self, conn, params: dict):
+        """import 작업 상태, 진행률 수정
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (dict): {'job_id': 작업 id, 수정할 컬럼: 값, ...}
+        """
+        columns = [key for key in params if key != 'job_id']
+        sql = f"""
+            UPDATE product_import_jobs
+            SET
+                {', '.join(f'{column} = %({column})s' for column in columns)}
+            WHERE
+                id = %(job_id)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def create_savepoint(self, conn):
+        """상품 한 개씩 다시 등록할 때 실패한 상품만 되돌리기 위한 savepoint"""
+        with conn.cursor() as cursor:
+            cursor.execute("SAVEPOINT import_product")
+
+    def rollback_to_savepoint(self, conn):
+        with conn.cursor() as cursor:
+            cursor.execute("ROLLBACK TO SAVEPOINT import_product")
+
+    def get_import_job(self, conn, params: dict):
+        sql = """
+            SELECT
+                j.id AS job_id,
+                j.account_id,
+                j.filename,
+                j.status,
+                j.total_rows,
+                j.processed_rows,
+                j.success_count,
+                j.fail_count,
+                j.error_file_key,
+                j.error_message,
+                j.created_at,
+                j.finished_at
+            FROM
+                product_import_jobs AS j
+            WHERE
+                j.id = %(job_id)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()
+
+    def create_import_errors(self, conn, params: list):
+        """등록에 실패한 행 저장 (multi-row INSERT)
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (list): [{'job_id', 'line_number': 파일의 행 번호, 'row_values': 원본 값 JSON, 'message': 오류 내용}, ...]
+        """
+        sql = """
+            INSERT INTO
+            product_import_errors (
+                job_id,
+                line_number,
+                row_values,
+                message
+            )
+            VALUES (
+                %(job_id)s,
+                %(line_number)s,
+                %(row_values)s,
+                %(message)s
+            )
+        """
+        with conn.cursor() as cursor:
+            cursor.executemany(sql, params)
+
+    def get_import_errors(self, conn, params: dict):
+        """등록에 실패한 행을 행 번호 순서로 조회
+
+        오류 행이 많아도 한 번에 메모리에 올리지 않도록 unbuffered cursor를 반환 (iterate가 끝난 뒤 conn을 닫음)
+
+        Returns:
+            cursor (QueryCountingSSCursor) : iterate 하면 {'line_number', 'row_values', 'message'}
+        """
+        sql = """
+            SELECT
+                e.line_number,
+                e.row_values,
+                e.message
+            FROM
+                product_import_errors AS e
+            WHERE
+                e.job_id = %(job_id)s
+            ORDER BY
+                e.line_number
+        """
+        cursor = conn.cursor(QueryCountingSSCursor)
+        cursor.execute(sql, params)
+        return cursor
+
+    def get_categories(self, conn):
+        sql = """
+            SELECT
+                c.id AS category_id,
+                c.property_id,
+                c.name
+            FROM
+                category AS c
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql)
+            return cursor.fetchall()
+
+    def get_sub_categories(self, conn):
+        sql = """
+            SELECT
+                s.id AS sub_category_id,
+                s.category_id,
+                s.name
+            FROM
+                sub_category AS s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql)
+            return cursor.fetchall()
+
+    def get_seller(self, conn, params: dict):
+        """seller_id 또는 account_id로 셀러 조회"""
+        sql = """
+            SELECT
+                s.id AS seller_id,
+                s.property_id
+            FROM
+                sellers AS s
+            WHERE
+                s.is_deleted = 0
+        """
+        if 'seller_id' in params:
+            sql += """
+                AND s.id = %(seller_id)s
+            """
+
+        if 'account_id' in params:
+            sql += """
+                AND s.account_id = %(account_id)s
+            """
+
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()
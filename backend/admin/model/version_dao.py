@@ -0,0 +1,146 @@
+class VersionDao:
+    def __new__(cls, *args, **kwargs):
+        if not hasattr(cls, '_instance'):
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def get_versions(self, conn, params: dict):
+        """테이블별 version 조회
+
+        scope_id가 0(테이블 전체)이면 모든 셀러 scope version의 합 (어느 셀러의 version이 올라가도 함께 올라감)
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (dict): {'table_names': 테이블 이름 tuple, 'scope_id': 0(테이블 전체) 또는 셀러 계정 id}
+
+        Returns:
+            dict: {테이블 이름: version}, 한 번도 수정되지 않은 테이블은 없음
+        """
+        if params['scope_id'] == 0:
+            sql = """
+                SELECT
+                    table_name,
+                    CAST(SUM(version) AS SIGNED) AS version
+                FROM
+                    table_versions
+                WHERE
+                    table_name IN %(table_names)s
+                GROUP BY
+                    table_name
+            """
+        else:
+            sql = """
+                SELECT
+                    table_name,
+                    version
+                FROM
+                    table_versions
+                WHERE
+                    table_name IN %(table_names)s
+                    AND scope_id = %(scope_id)s
+            """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return {row['table_name']: row['version'] for row in cursor.fetchall()}
+
+    def get_product_scopes(self, conn, product_ids: list):
+        """상품을 가진 셀러의 계정 id"""
+        sql = """
+            SELECT DISTINCT
+                s.account_id
+            FROM
+                products AS p
+            INNER JOIN
+                sellers AS s ON s.id = p.seller_id
+            WHERE
+                p.id IN %(product_ids)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, {'product_ids': tuple(product_ids)})
+            return [row['account_id'] for row in cursor.fetchall()]
+
+    def get_order_scopes(self, conn, orders_detail_ids: list):
+        """주문 상세의 상품을 가진 셀러의 계정 id"""
+        sql = """
+            SELECT DISTINCT
+                s.account_id
+            FROM
+                orders_detail AS d
+            INNER JOIN
+                products AS p ON p.id = d.product_id
+            INNER JOIN
+                sellers AS s ON s.id = p.seller_id
+            WHERE
+                d.id IN %(orders_detail_ids)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, {'orders_detail_ids': tuple(orders_detail_ids)})
+            return [row['account_id'] for row in cursor.fetchall()]
+
+    def get_seller_scopes(self, conn, seller_ids: list):
+        """셀러의 계정 id"""
+        sql = """
+            SELECT
+                account_id
+            FROM
+                sellers
+            WHERE
+                id IN %(seller_ids)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, {'seller_ids': tuple(seller_ids)})
+            return [row['account_id'] for row in cursor.fetchall()]
+
+    def bump_versions(self, conn, params: list):
+        """version 1 증가 (없으면 1로 생성), multi-row INSERT 한 번으로 실행
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (list): [{'table_name': 테이블 이름, 'scope_id': 셀러 계정 id}, ...]
+                여러 요청이 같은 row를 잡을 때 deadlock이 생기지 않도록 (table_name, scope_id) 순서로 정렬해서 전달
+        """
+        sql = """
+            INSERT INTO
+            table_versions (
+                table_name,
+                scope_id,
+                version
+            )
+            VALUES (
+                %(table_name)s,
+                %(scope_id)s,
+                1
+            )
+            ON DUPLICATE KEY UPDATE
+                version = version + 1
+        """
+        with conn.cursor() as cursor:
+            cursor.executemany(sql, params)
+
+    def bump_table_versions(self, conn, params: dict):
+        """모든 셀러 scope의 version 1 증가 (version row가 없는 셀러는 1로 생성)
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (dict): {'table_name': 테이블 이름}
+        """
+        sql = """
+            INSERT INTO
+            table_versions (
+                table_name,
+                scope_id,
+                version
+            )
+            SELECT
+                %(table_name)s,
+                s.account_id,
+                1
+            FROM
+                sellers AS s
+            ORDER BY
+                s.account_id
+            ON DUPLICATE KEY UPDATE
+                version = table_versions.version + 1
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
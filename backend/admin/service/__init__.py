@@ -4,8 +4,20 @@ from .order_service import OrderService
 
 from .account_service import AccountService
 
+from .product_import_service import ProductImportService
+
+from .job_service import JobService
+
+from .discount_service import DiscountService
+
+from .version_service import VersionService
+
 __all__ = [
     "ProductService",
     "OrderService",
-    "AccountService"
+    "AccountService",
+    "ProductImportService",
+    "JobService",
+    "DiscountService",
+    "VersionService"
 ]
\ No newline at end of file
@@ -1,13 +1,14 @@
 import bcrypt, jwt, xlwt, copy
 
 from flask import g
-from cachetools import TTLCache, cached
 import time
 from config import SECRET_KEY
 from admin.model import AccountDao
+from admin.service.version_service import VersionService
 from utils.custom_exception import SignUpFail, SignInError, TokenCreateError, MasterLoginRequired
 from utils.constant import MASTER, SELLER, USER, STORE_OUT, STORE_REJECTED
 from utils.formatter import CustomJSONEncoder
+from utils.projection import parse_fields
 
 # 이미지 업로드 재사용을 위함
 from service.product_service import ProductService
@@ -22,6 +23,7 @@ class AccountService:
 
     def __init__(self):
         self.account_dao = AccountDao()
+        self.version_service = VersionService()
 
     def set_password_hash(self, params):
         params['password'] = bcrypt.hashpw(
@@ -117,6 +119,8 @@ class AccountService:
         get_sellers_history_id = self.account_dao.create_seller_history(conn, params)
         if not get_sellers_history_id:
             raise SignUpFail("아이디를 생성하는데 오류가 발생했습니다.", "create_seller_history error")
+
+        self.version_service.bump_sellers(conn, [get_seller_id])
         
     # seller 로그인
     def post_account_login(self, conn, params):
@@ -140,42 +144,39 @@ class AccountService:
         # raise TokenCreateError("뜻하지 않은 에러가 발생했습니다. 다시 시도 해주세요.", "create_token error")
         return token
 
-    @cached(cache = TTLCache(12, 10))
-    def get_status_type(self, conn, seller_status_type):
-        """셀러 상태를 가져오는 함수
+    def get_status_type(self, conn):
+        """셀러 상태별 상태 변경 버튼을 가져오는 함수
 
-        DB로부터 입점, 휴점, 퇴점 등 셀러의 상태 관련 데이터를 가져오는 함수
+        DB로부터 입점, 휴점, 퇴점 등 셀러의 상태 관련 데이터를 한 번에 가져오는 함수
 
         Args:
             conn (Connection): DB커넥션 객체
-            seller_status_type (str): 현재 셀러의 입점 상태
 
         Returns:
-            results (list): 
-                [
-                    {
-                        'button_name': 버튼 이름, 
-                        'to_status_type_id': 버튼을 클릭하면 이동하는 상태 id
-                    }, 
-                    {
-                        'button_name': 버튼 이름, 
-                        'to_status_type_id': 버튼을 클릭하면 이동하는 상태 id
-                    }
-                ]
+            results (dict): 
+                {
+                    셀러 상태 이름: [
+                        {
+                            'button_name': 버튼 이름, 
+                            'to_status_type_id': 버튼을 클릭하면 이동하는 상태 id
+                        },
+                        ...
+                    ]
+                }
+                입점거절, 퇴점 등 변경 버튼이 없는 상태는 빈 list
         """
         # status_name, seller_status_type_id, button_id, button_name, to_status_type_id가 포함된 리스트        
-        seller_status_type_button_lists = self.account_dao.get_seller_status(conn, seller_status_type)
+        seller_status_type_button_lists = self.account_dao.get_seller_status(conn)
 
-        results = list()
+        results = dict()
         for seller_status_type_button in seller_status_type_button_lists:
-            if seller_status_type in ["입점신청", "입점", "휴점", "퇴점대기"]:
+            buttons = results.setdefault(seller_status_type_button["status_name"], list())
+            if seller_status_type_button["status_name"] in ["입점신청", "입점", "휴점", "퇴점대기"]:
                 seller_button_info = {
                                         "button_name": seller_status_type_button["button_name"], 
                                         "to_status_type_id": seller_status_type_button["to_status_type_id"]
                                     }
-                results.append(seller_button_info)
-            elif seller_status_type in ["입점거절", "퇴점"]:
-                continue
+                buttons.append(seller_button_info)
         
         return results
 
@@ -243,6 +244,8 @@ class AccountService:
 
         # HEADERS로 엑셀파일 요청
         if 'application/vnd.ms-excel' in headers.values():
+            # 엑셀은 항상 전체 항목
+            params['fields'] = tuple(self.account_dao.LIST_FIELDS)
             seller_info_list = self.account_dao.get_seller_list(conn, params, headers)
             output = BytesIO()
 
@@ -277,23 +280,19 @@ class AccountService:
             output.seek(0)
             return output
 
+        fields = parse_fields(params.get('fields'), self.account_dao.LIST_FIELDS)
+        params['fields'] = fields
+
         seller_list, seller_count = self.account_dao.get_seller_list(conn, params, headers)
 
+        if 'seller_status_type_button' in fields:
+            status_type_buttons = self.get_status_type(conn)
+            for seller in seller_list:
+                seller["seller_status_type_button"] = status_type_buttons.get(seller["seller_status_type"], list())
+
         seller_list_info = {
             "seller_list": [
-                {
-                    "seller_id": seller["seller_id"],
-                    "seller_identification": seller["seller_identification"],
-                    "english_brand_name": seller["english_brand_name"],
-                    "korean_brand_name": seller["korean_brand_name"],
-                    "manager_name": seller["manager_name"],
-                    "seller_status_type": seller["seller_status_type"],
-                    "seller_status_type_button": self.get_status_type(conn, seller["seller_status_type"]),
-                    "manager_phone": seller["manager_phone"],
-                    "manager_email": seller["manager_email"],
-                    "sub_property": seller["sub_property"],
-                    "seller_created_date": seller["seller_created_date"]
-                } for seller in seller_list
+                {field: seller[field] for field in fields} for seller in seller_list
             ],
             "total_count": seller_count["count"]
         }
@@ -324,6 +323,8 @@ class AccountService:
         # history 추가
         self.account_dao.change_seller_history(conn, params)
 
+        self.version_service.bump_sellers(conn, [params['seller_id']])
+
 
     def get_seller_info(self, conn, params):
         """셀러 상세 정보 formatting
@@ -498,6 +499,8 @@ class AccountService:
         # 셀러 정보 수정 & 셀러 history 추가
         self.account_dao.update_seller_info(conn, params)
         self.account_dao.insert_seller_history(conn, params)
+
+        self.version_service.bump_sellers(conn, [params['seller_id']])
     
 
     def create_image_url(self, img_obj, image_type):
@@ -0,0 +1,120 @@
+import heapq, time, logging
+from datetime import timedelta
+
+from admin.model import ProductDao
+from admin.service.version_service import VersionService
+from connection import get_connection
+from utils.constant import DISCOUNT_SCHEDULER_HORIZON, DISCOUNT_SCHEDULER_RELOAD_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class DiscountService:
+    """상품 적용 할인율, 할인가(effective_discount_rate, effective_price) 갱신
+
+    상품 등록, 수정 시에는 같은 transaction에서 바로 갱신하고,
+    시간이 지나서 할인 기간이 시작, 종료되는 상품은 scheduler(admin/discount_scheduler.py)가 그 시점에 갱신합니다.
+
+    scheduler는 앞으로 DISCOUNT_SCHEDULER_HORIZON 안의 할인 시작, 종료 시점을 min-heap에 넣고
+    가장 가까운 시점까지 대기한 뒤 그 시점의 상품만 갱신합니다.
+    DISCOUNT_SCHEDULER_RELOAD_INTERVAL 마다 이전에 읽은 시간 이후의 시점을 다시 읽어서
+    그 사이에 수정된 상품의 시점도 추가합니다 (이미 지난 시점은 바로 갱신).
+    """
+    def __new__(cls, *args, **kwargs):
+        if not hasattr(cls, '_instance'):
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        self.product_dao = ProductDao()
+        self.version_service = VersionService()
+
+    def load_boundaries(self, conn, heap: list, scheduled: set, start):
+        """start 이후 DISCOUNT_SCHEDULER_HORIZON 까지의 할인 시작, 종료 시점을 heap에 추가
+
+        Returns:
+            datetime: 조회한 DB 현재 시간 (다음 조회의 start)
+        """
+        now = self.product_dao.get_now(conn)
+        boundaries = self.product_dao.get_discount_boundaries(conn, {
+            'start' : start,
+            'end' : now + timedelta(seconds=DISCOUNT_SCHEDULER_HORIZON)
+        })
+        conn.commit()
+
+        for boundary in boundaries:
+            item = (boundary['boundary'], boundary['product_id'])
+            if item not in scheduled:
+                scheduled.add(item)
+                heapq.heappush(heap, item)
+
+        return now
+
+    def run_due_boundaries(self, conn, heap: list, scheduled: set):
+        """DB 현재 시간까지 지난 시점의 상품 갱신
+
+        Returns:
+            float: 다음 시점까지 남은 시간(초), heap이 비어 있으면 None
+        """
+        now = self.product_dao.get_now(conn)
+
+        product_ids = set()
+        while heap and heap[0][0] <= now:
+            item = heapq.heappop(heap)
+            scheduled.discard(item)
+            product_ids.add(item[1])
+
+        if product_ids:
+            self.product_dao.update_effective_price(conn, list(product_ids))
+            self.version_service.bump_products(conn, list(product_ids))
+        conn.commit()
+
+        if not heap:
+            return None
+
+        return (heap[0][0] - now).total_seconds()
+
+    def run_scheduler(self, stop_event):
+        """stop_event가 set 될 때까지 할인 시작, 종료 시점마다 적용 할인율, 할인가 갱신"""
+        conn = None
+        try:
+            while not stop_event.is_set():
+                try:
+                    if conn is None:
+                        conn = get_connection()
+                        heap = list()
+                        scheduled = set()
+
+                        # 중단된 동안 지난 시점 반영
+                        updated = self.product_dao.update_stale_effective_price(conn)
+                        if updated:
+                            self.version_service.bump_all_products(conn)
+                        conn.commit()
+                        logger.info('discount scheduler started, %s stale products updated', updated)
+
+                        loaded_at = self.product_dao.get_now(conn)
+                        next_reload = 0
+
+                    if time.monotonic() >= next_reload:
+                        loaded_at = self.load_boundaries(conn, heap, scheduled, loaded_at)
+                        next_reload = time.monotonic() + DISCOUNT_SCHEDULER_RELOAD_INTERVAL
+
+                    wait = self.run_due_boundaries(conn, heap, scheduled)
+
+                    # 다음 시점 또는 다시 읽을 시간 중 먼저 오는 시간까지 대기
+                    until_reload = next_reload - time.monotonic()
+                    stop_event.wait(max(min(wait, until_reload) if wait is not None else until_reload, 0))
+
+                except Exception:
+                    # DB 연결 오류 등은 연결을 새로 만들고 처음부터 다시 시작
+                    logger.exception('discount scheduler error')
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+                    conn = None
+                    stop_event.wait(DISCOUNT_SCHEDULER_RELOAD_INTERVAL)
+
+        finally:
+            if conn:
+                conn.close()
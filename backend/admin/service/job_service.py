@@ -0,0 +1,169 @@
+import json, time, logging
+
+from admin.model import JobDao
+from connection import get_connection
+from utils.custom_exception import CustomUserError
+from utils.constant import (
+                            JOB_MAX_ATTEMPTS,
+                            JOB_RETRY_BASE_DELAY,
+                            JOB_RETRY_MAX_DELAY,
+                            JOB_LOCK_TIMEOUT,
+                            JOB_POLL_INTERVAL
+)
+
+logger = logging.getLogger(__name__)
+
+
+class JobService:
+    """job_outbox 작업 생성, 실행
+
+    서비스는 요청 transaction 안에서 enqueue_job으로 작업을 추가하고,
+    worker(admin/worker.py)가 commit 된 작업을 가져와 작업 종류별 handler로 실행합니다.
+
+    handler는 handler(conn, payload) 형태이고, handler의 DB 변경과 작업 완료 처리는 같은 transaction으로 commit 합니다.
+    실패하면 rollback 후 대기 시간을 2배씩 늘리며 다시 실행하고, 최대 시도 횟수를 넘으면 FAILED로 남깁니다.
+    FAILED가 될 때 fail_handler(conn, payload, 오류 메시지)가 있으면 같은 transaction에서 실행해서 작업 대상을 실패 상태로 표시합니다.
+    여러 번 commit 하는 긴 handler(파일 import 등)는 commit 할 때마다 touch_job을 호출하고, 다시 실행되면 commit 된 곳부터 이어서 실행합니다.
+    worker가 handler 실행 중 종료되면 JOB_LOCK_TIMEOUT 후 다시 실행하므로 handler의 외부 작업(s3 업로드 등)은
+    여러 번 실행되어도 결과가 같아야 합니다.
+    """
+    def __new__(cls, *args, **kwargs):
+        if not hasattr(cls, '_instance'):
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        self.job_dao = JobDao()
+
+    def enqueue_job(self, conn, job_type: str, payload: dict, idempotency_key: str = None, delay: int = 0):
+        """작업 추가 (commit은 호출하는 쪽의 transaction과 함께)
+
+        Args:
+            conn (Connection): DB Connection Object
+            job_type (str): 작업 종류
+            payload (dict): handler에 전달할 값 (JSON으로 저장)
+            idempotency_key (str): 같은 key의 작업은 한 번만 생성
+            delay (int): 실행까지 대기 시간(초)
+
+        Returns:
+            int: 생성된 작업 id (이미 있으면 0)
+        """
+        return self.job_dao.create_job(conn, {
+            'job_type' : job_type,
+            'payload' : json.dumps(payload, ensure_ascii=False),
+            'idempotency_key' : idempotency_key,
+            'max_attempts' : JOB_MAX_ATTEMPTS,
+            'delay' : delay
+        })
+
+    def enqueue_jobs(self, conn, job_type: str, jobs: list):
+        """같은 종류의 작업 여러 개를 한 번에 추가 (commit은 호출하는 쪽의 transaction과 함께)
+
+        Args:
+            conn (Connection): DB Connection Object
+            job_type (str): 작업 종류
+            jobs (list): [(payload, idempotency_key), ...]
+        """
+        if not jobs:
+            return
+
+        self.job_dao.create_jobs(conn, [
+            {
+                'job_type' : job_type,
+                'payload' : json.dumps(payload, ensure_ascii=False),
+                'idempotency_key' : idempotency_key,
+                'max_attempts' : JOB_MAX_ATTEMPTS
+            }
+            for payload, idempotency_key in jobs
+        ])
+
+    def touch_job(self, conn, idempotency_key: str):
+        """실행 중인 작업이 아직 진행 중임을 기록 (JOB_LOCK_TIMEOUT 안에 다시 호출해야 다른 worker가 가져가지 않음)"""
+        self.job_dao.touch_job(conn, {'idempotency_key': idempotency_key})
+
+    def get_retry_delay(self, attempts: int):
+        return min(JOB_RETRY_BASE_DELAY * 2 ** (attempts - 1), JOB_RETRY_MAX_DELAY)
+
+    def run_next_job(self, conn, handlers: dict, fail_handlers: dict = None):
+        """실행할 작업 한 개를 가져와 실행
+
+        Args:
+            conn (Connection): DB Connection Object
+            handlers (dict): {작업 종류: handler}
+            fail_handlers (dict): {작업 종류: 최대 시도 횟수를 넘었을 때 실행할 handler}
+
+        Returns:
+            bool: 실행한 작업이 있으면 True
+        """
+        # 작업 선점 (다른 worker는 SKIP LOCKED로 건너뛰고, commit 후에는 RUNNING 상태라 가져가지 않음)
+        job = self.job_dao.get_runnable_job(conn, {
+            'job_types' : list(handlers),
+            'lock_timeout' : JOB_LOCK_TIMEOUT
+        })
+
+        if not job:
+            conn.commit()
+            return False
+
+        self.job_dao.lock_job(conn, job)
+        conn.commit()
+
+        attempts = job['attempts'] + 1
+        try:
+            handlers[job['job_type']](conn, json.loads(job['payload']))
+            self.job_dao.complete_job(conn, job)
+            conn.commit()
+
+        except Exception as e:
+            logger.exception('job %s (%s) failed, attempt %s', job['job_id'], job['job_type'], attempts)
+            conn.rollback()
+
+            params = {
+                'job_id' : job['job_id'],
+                'last_error' : (e.error_message if isinstance(e, CustomUserError) else repr(e))[:1000]
+            }
+
+            if attempts >= job['max_attempts']:
+                self.job_dao.fail_job(conn, params)
+
+                fail_handler = (fail_handlers or dict()).get(job['job_type'])
+                if fail_handler:
+                    fail_handler(conn, json.loads(job['payload']), params['last_error'])
+            else:
+                params['delay'] = self.get_retry_delay(attempts)
+                self.job_dao.retry_job(conn, params)
+
+            conn.commit()
+
+        return True
+
+    def run_worker(self, handlers: dict, fail_handlers: dict = None, poll_interval: float = JOB_POLL_INTERVAL, stop_event=None):
+        """작업이 없으면 poll_interval 동안 대기하면서 계속 실행 (stop_event가 set 되면 종료)"""
+        conn = None
+        try:
+            while not (stop_event and stop_event.is_set()):
+                if conn is None:
+                    conn = get_connection()
+
+                try:
+                    processed = self.run_next_job(conn, handlers, fail_handlers)
+
+                except Exception:
+                    # DB 연결 오류 등은 연결을 새로 만들어서 다시 시도
+                    logger.exception('job worker error')
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+                    conn = None
+                    processed = False
+
+                if not processed:
+                    if stop_event:
+                        stop_event.wait(poll_interval)
+                    else:
+                        time.sleep(poll_interval)
+
+        finally:
+            if conn:
+                conn.close()
@@ -1,8 +1,12 @@
 from admin.model import OrderDao
+from admin.service.version_service import VersionService
 
 from utils.response import error_response
-from utils.custom_exception import DataNotExists, StartDateFail
+from utils.custom_exception import DataNotExists, StartDateFail, DataTypeDoesNotMatch
 from utils.constant import PURCHASE_COMPLETE, CANCEL_COMPLETE, REFUND_COMPLETE
+from utils.money import discounted_price, line_total, line_totals, bp_to_percent
+from utils.projection import parse_fields
+from utils.excel import stream_csv_file, stream_xlsx_file
 
 import traceback
 from datetime import timedelta, date
@@ -15,14 +19,62 @@ class OrderService:
 
     def __init__(self):
         self.order_dao = OrderDao()
+        self.version_service = VersionService()
     
+    def make_order_list_params(self, params):
+        """주문 리스트, 파일 export 검색 조건 정리
+
+        조회 기간 확인, 여러 값 검색 조건을 IN 조건용 tuple로 변환, fields 확인 (params를 직접 수정)
+
+        Args:
+            params (dict): query parameter로 받은 정보
+
+        Returns:
+            fields (tuple): 출력 field
+
+        Raises:
+            StartDateFail : 조회 시작 날짜가 끝 날짜보다 클 때
+            DataTypeDoesNotMatch : 아이디 검색 조건이 숫자가 아닐 때
+            InvalidFields : 조회할 수 없는 field를 요청했을 때
+        """
+        
+        if 'end_date' in params:
+            params['end_date'] +=  timedelta(days=1)
+            params['end_date_str'] = params['end_date'].strftime('%Y-%m-%d')
+
+        if 'start_date' in params:
+            params['start_date_str'] = params['start_date'].strftime('%Y-%m-%d')
+
+        if 'start_date' in params and 'end_date' in params and params['start_date'] > params['end_date']:
+            raise StartDateFail('조회 시작 날짜가 끝 날짜보다 큽니다.')
+
+        # 여러 값 검색 조건은 IN 조건으로 사용하도록 중복을 제거한 tuple로 변환
+        for key in ('order_status_type_id', 'sub_property_id'):
+            if key in params:
+                try:
+                    params[key] = tuple(dict.fromkeys(int(value) for value in params[key]))
+                except ValueError:
+                    raise DataTypeDoesNotMatch('입력값의 형태가 올바르지 않습니다.')
+
+        for key in ('seller_name', 'order_number', 'order_detail_number'):
+            if key in params:
+                params[key] = tuple(dict.fromkeys(params[key]))
+
+        fields = parse_fields(params.get('fields'), self.order_dao.LIST_FIELDS)
+        params['fields'] = fields
+
+        return fields
+
     def get_order_list(self, conn, params):
         """주문 조회 리스트 서비스
         주문 리스트 정보를 위해 model로 정보를 넘김
         
         Args:
             conn (Connection): DB 커넥션 객체
-            params (dict): query parameter로 받은 정보 (셀러명, 조회 기간 등)
+            params (dict): query parameter로 받은 정보 (셀러명, 조회 기간 등),
+                주문 상태, 셀러 속성, 셀러명, 주문 번호, 주문 상세 번호는 여러 값 list,
+                fields (콤마로 구분한 출력 field, 없으면 전체 field),
+                group_counts ('status'이면 주문 상태별 개수도 반환)
             
         Returns:
             order_list_info (dict) : 
@@ -44,48 +96,83 @@ class OrderService:
                                     "product_name": 상품명
                                 } for order in order_detail
                             ],
-                            "total_count": 주문 전체 수
+                            "total_count": 주문 전체 수,
+                            "status_counts": [
+                                {"order_status_type_id": 주문 상태 아이디, "count": 주문 상태 조건을 뺀 검색 조건의 주문 수}
+                            ] (group_counts=status 일 때만)
                         }     
             500 : Exceptions  
                 StartDateFail : 조회 날짜가 알맞지 않을 때 발생하는 에러
                 KeyError : 데이터베이스의 key값이 맞지 않을 때 발생하는 에러
         """
-        
-        if 'end_date' in params:
-            params['end_date'] +=  timedelta(days=1)
-            params['end_date_str'] = params['end_date'].strftime('%Y-%m-%d')
 
-        if 'start_date' in params:
-            params['start_date_str'] = params['start_date'].strftime('%Y-%m-%d')
+        fields = self.make_order_list_params(params)
 
-        if 'start_date' in params and 'end_date' in params and params['start_date'] > params['end_date']:
-            raise StartDateFail('조회 시작 날짜가 끝 날짜보다 큽니다.')
+        orders_info, order_count, status_counts = self.order_dao.get_order_list(conn, params)
 
-        orders_info, order_count = self.order_dao.get_order_list(conn, params)
+        # 주문 금액은 int 연산으로 한 번에 계산 (할인율은 DAO에서 basis point로 조회)
+        if 'total_price' in fields:
+            for order, total_price in zip(orders_info, line_totals(orders_info)):
+                order['total_price'] = total_price
         
         order_list_info = {
                 "order_list" : [
-                    {
-                        "color": order["color_name"],
-                        "orders_detail_id": order["orders_detail_id"],
-                        "order_created_at": order["created_at"],
-                        "order_detail_number": order["detail_order_number"],
-                        "brand_name": order["korean_brand_name"],
-                        "order_number": order["order_number"],
-                        "order_status_type": order["order_status_type"],
-                        "order_username": order["order_username"],
-                        "orderer_phone": order["orderer_phone"],
-                        "quantity": order["quantity"],
-                        "size": order["size_name"],
-                        "product_name": order["title"],
-                        "total_price": int(order["price"] * order["quantity"]) if order["discount_rate"] == 0 else int(order["price"] * (1-order["discount_rate"]) * order["quantity"])
-                    } for order in orders_info 
+                    {field: order[field] for field in fields} for order in orders_info
                 ],
                 "total_count": order_count["count"]
         }
+
+        if status_counts is not None:
+            order_list_info["status_counts"] = status_counts
     
         return order_list_info
 
+    def export_order_list(self, conn, params, file_type):
+        """주문 리스트 파일(xlsx, csv) export 서비스
+
+        주문 리스트와 같은 검색 조건, fields의 전체 행(페이지 조건 없음)을 DB에서 읽는 대로 파일로 변환
+        conn은 반환한 generator가 끝날 때까지 열려 있어야 함 (unbuffered cursor)
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            params (dict): get_order_list와 같은 query parameter
+            file_type (str): 'xlsx' 또는 'csv'
+
+        Returns:
+            generator : 파일 byte chunk
+        """
+        fields = self.make_order_list_params(params)
+
+        title = {
+            'orders_detail_id'    : '주문상세아이디',
+            'order_created_at'    : '결제일자',
+            'order_number'        : '주문번호',
+            'order_detail_number' : '주문상세번호',
+            'brand_name'          : '셀러명',
+            'product_name'        : '상품명',
+            'color'               : '색상',
+            'size'                : '사이즈',
+            'quantity'            : '수량',
+            'order_username'      : '주문자명',
+            'orderer_phone'       : '핸드폰번호',
+            'order_status_type'   : '주문상태',
+            'total_price'         : '결제금액'
+        }
+        title = {field: title[field] for field in fields}
+
+        orders = self.order_dao.get_order_export(conn, params)
+
+        if 'total_price' in fields:
+            orders = (
+                dict(order, total_price=line_total(order['price'], order['discount_rate_bp'], order['quantity']))
+                for order in orders
+            )
+
+        if file_type == 'xlsx':
+            return stream_xlsx_file(title, orders)
+
+        return stream_csv_file(title, orders)
+
 
     def patch_order_status_type(self, conn, params):
         """주문 및 배송처리 함수
@@ -127,17 +214,15 @@ class OrderService:
         # 현재 데이터의 order_status_type_id가 무엇인지 확인
         order_detail_results = self.order_dao.check_if_possible_change(conn, match_status_types)
         
-        # DB에 존재하면서, 바꿀 수 있는 값인지 확인
+        # DB에 존재하면서, 바꿀 수 있는 값인지 확인 (DB에 없는 주문은 바꿀 수 없는 값)
+        order_detail_status = {data['orders_detail_id']: data['order_status_type_id'] for data in order_detail_results}
         possible_to_patch = list()
         impossible_to_patch = list()
-        for db_data in order_detail_results:
-            for rq_data in match_status_types:
-                if rq_data.get('orders_detail_id') == db_data.get('orders_detail_id') and db_data["order_status_type_id"] in (PURCHASE_COMPLETE, CANCEL_COMPLETE, REFUND_COMPLETE):
-                    impossible_to_patch.append(rq_data)
-                    # 바꿀 수 없는 row를 만나면 break로 현재 for문을 빠져나간다.
-                    break
-                if rq_data.get('orders_detail_id') == db_data.get('orders_detail_id'):
-                    possible_to_patch.append(rq_data)
+        for rq_data in match_status_types:
+            if order_detail_status.get(rq_data.get('orders_detail_id')) in (None, PURCHASE_COMPLETE, CANCEL_COMPLETE, REFUND_COMPLETE):
+                impossible_to_patch.append(rq_data)
+            else:
+                possible_to_patch.append(rq_data)
 
         # 변경 요청 데이터가 유효하지 않은 정보들이 있는 리스트
         impossible_to_patch += not_match_status_types
@@ -146,6 +231,8 @@ class OrderService:
         self.order_dao.patch_order_status_type(conn, possible_to_patch)
         self.order_dao.insert_order_detail_history(conn, possible_to_patch)
 
+        self.version_service.bump_orders(conn, [data['orders_detail_id'] for data in possible_to_patch])
+
         return impossible_to_patch
     
  
@@ -196,6 +283,9 @@ class OrderService:
         """
         order_detail, order_histories = self.order_dao.get_order(conn, params)
 
+        if not order_detail:
+            raise DataNotExists('주문을 조회할 수 없습니다.', 'order does not exists or Forbidden')
+
         order_detail_info = {
                 "order_detail": {
                     "order_number": order_detail["order_number"],
@@ -206,9 +296,9 @@ class OrderService:
                     "orderer_name": order_detail["orderer_name"],
                     "product_id": order_detail["product_id"],
                     "price": order_detail["price"],
-                    "discount_rate": int(100 * order_detail["discount_rate"]),
-                    "discounted_price": int(order_detail["price"] if order_detail["discount_rate"] == 0 else (order_detail["price"] * (1-order_detail["discount_rate"]))),
-                    "total_price": int(order_detail["price"] * order_detail["quantity"] if order_detail["discount_rate"] == 0 else order_detail["price"] * (1-order_detail["discount_rate"]) * order_detail["quantity"]),
+                    "discount_rate": bp_to_percent(order_detail["discount_rate_bp"]),
+                    "discounted_price": discounted_price(order_detail["price"], order_detail["discount_rate_bp"]),
+                    "total_price": line_total(order_detail["price"], order_detail["discount_rate_bp"], order_detail["quantity"]),
                     "product_name": order_detail["title"],
                     "brand_name": order_detail["korean_brand_name"],
                     "color": order_detail["color"],
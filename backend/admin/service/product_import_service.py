@@ -0,0 +1,512 @@
+import json, os, tempfile, uuid, logging
+from datetime import datetime, date
+from itertools import groupby, islice
+
+from flask import g
+
+from admin.model import ProductDao, ProductImportDao
+from admin.service.job_service import JobService
+from admin.service.product_service import ProductService
+from connection import get_s3_connection
+from config import BUCKET_NAME
+from utils.excel import read_file_rows, stream_csv_file
+from utils.image import check_image_url
+from utils.validation import check_product_required_data
+from utils.custom_exception import CustomUserError, DataNotExists, DataTypeDoesNotMatch, RequiredDataError
+from utils.constant import SELLER, BULK_PRODUCT_CHUNK_SIZE, PRODUCT_IMPORT_EXTENSIONS, PRODUCT_IMPORT_JOB
+
+logger = logging.getLogger(__name__)
+
+# import 파일 header
+# 한 행이 옵션 하나이고, 상품키가 같은 연속된 행은 한 상품의 옵션으로 등록 (상품 정보는 첫 행 기준)
+IMPORT_TITLE = {
+    'product_key'         : '상품키',
+    'seller_id'           : '셀러번호',
+    'category'            : '1차카테고리',
+    'sub_category'        : '2차카테고리',
+    'title'               : '상품명',
+    'simple_description'  : '한줄설명',
+    'content'             : '상세설명',
+    'is_selling'          : '판매여부',
+    'is_displayed'        : '진열여부',
+    'price'               : '판매가',
+    'discount_rate'       : '할인율',
+    'discount_start_date' : '할인시작일시',
+    'discount_end_date'   : '할인종료일시',
+    'min_amount'          : '최소판매수량',
+    'max_amount'          : '최대판매수량',
+    'manufacturer'        : '제조사',
+    'date_of_manufacture' : '제조일자',
+    'origin'              : '원산지',
+    'image_urls'          : '이미지URL',
+    'color'               : '색상',
+    'size'                : '사이즈',
+    'stock'               : '재고'
+}
+
+# 문자열이 아닌 컬럼의 변환 형식
+IMPORT_TYPES = {
+    'seller_id'           : int,
+    'is_selling'          : bool,
+    'is_displayed'        : bool,
+    'price'               : int,
+    'discount_rate'       : float,
+    'discount_start_date' : datetime,
+    'discount_end_date'   : datetime,
+    'min_amount'          : int,
+    'max_amount'          : int,
+    'date_of_manufacture' : date,
+    'stock'               : int
+}
+
+# 상품 리스트 엑셀 export 값도 그대로 import 할 수 있도록 허용
+BOOLEAN_VALUES = {'1': 1, '0': 0, '판매': 1, '미판매': 0, '진열': 1, '미진열': 0}
+
+
+def convert_value(key, value):
+    """파일의 셀 값을 상품 등록 validate 함수가 받는 형식으로 변환
+
+    Returns:
+        변환된 값, 빈 셀은 None
+    """
+    if isinstance(value, str):
+        value = value.strip()
+
+    if value is None or value == '':
+        return None
+
+    value_type = IMPORT_TYPES.get(key, str)
+    try:
+        if value_type is int:
+            number = float(value)
+            if not number.is_integer():
+                raise ValueError
+            return int(number)
+
+        if value_type is float:
+            return float(value)
+
+        if value_type is bool:
+            return BOOLEAN_VALUES[str(value).replace('.0', '')]
+
+        # 엑셀 날짜 셀은 datetime으로 읽힘
+        if value_type is datetime:
+            return value.strftime('%Y-%m-%d %H:%M') if isinstance(value, datetime) else value
+
+        if value_type is date:
+            return value.strftime('%Y-%m-%d') if isinstance(value, (datetime, date)) else value
+
+        return str(value)
+
+    except (KeyError, ValueError):
+        raise DataTypeDoesNotMatch(f'{IMPORT_TITLE[key]} 입력값의 형태가 올바르지 않습니다.')
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ImportLookup:
+    """카테고리, 색상, 사이즈 이름과 셀러번호를 id로 변환
+
+    기준 테이블은 작업 시작 시 한 번만 조회하고, 셀러는 처음 나온 셀러만 조회해서 재사용
+    """
+    def __init__(self, conn, account_id, account_type_id):
+        self.conn = conn
+        self.product_import_dao = ProductImportDao()
+        product_dao = ProductDao()
+
+        self.categories = {
+            (row['property_id'], row['name']): row['category_id'] for row in self.product_import_dao.get_categories(conn)
+        }
+        self.sub_categories = {
+            (row['category_id'], row['name']): row['sub_category_id'] for row in self.product_import_dao.get_sub_categories(conn)
+        }
+        self.colors = {row['color_name']: row['color_id'] for row in product_dao.get_products_color_list_dao(conn)}
+        self.sizes = {row['size_name']: row['size_id'] for row in product_dao.get_products_size_list_dao(conn)}
+        self.sellers = dict()
+
+        # 셀러는 본인 상품만 등록
+        self.own_seller = None
+        if account_type_id == SELLER:
+            self.own_seller = self.product_import_dao.get_seller(conn, {'account_id': account_id})
+            if not self.own_seller:
+                raise DataNotExists('셀러 정보를 조회할 수 없습니다.', 'seller does not exists')
+
+    def seller(self, seller_id):
+        if self.own_seller:
+            return self.own_seller
+
+        if seller_id is None:
+            raise RequiredDataError('판매자 정보를 입력하세요.')
+
+        if seller_id not in self.sellers:
+            self.sellers[seller_id] = self.product_import_dao.get_seller(self.conn, {'seller_id': seller_id})
+
+        seller = self.sellers[seller_id]
+        if not seller:
+            raise DataNotExists('셀러를 조회할 수 없습니다.', 'seller does not exists')
+        return seller
+
+    def find(self, table, key, message):
+        if key not in table:
+            raise DataNotExists(message, 'name does not exists')
+        return table[key]
+
+
+class ImportErrors:
+    """등록에 실패한 행을 모아두었다가 진행률과 같은 transaction으로 product_import_errors에 저장"""
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.rows = list()
+        self.count = 0
+
+    def write(self, rows, message):
+        for row_number, row in rows:
+            self.rows.append({
+                'job_id' : self.job_id,
+                'line_number' : row_number,
+                'row_values' : json.dumps({header: row.get(header) for header in IMPORT_TITLE.values()}, ensure_ascii=False, default=str),
+                'message' : message[:500]
+            })
+            self.count += 1
+
+    def flush(self, conn, product_import_dao):
+        if self.rows:
+            product_import_dao.create_import_errors(conn, self.rows)
+            self.rows = list()
+
+
+def estimate_total_rows(file_info, processed_rows):
+    """read_file_rows가 기록한 파일 정보로 전체 행 수 추정 (csv는 읽은 byte 비율, xlsx는 파일에 기록된 범위)"""
+    if file_info.get('total_rows'):
+        return max(file_info['total_rows'], processed_rows)
+
+    if file_info.get('position'):
+        return max(round(processed_rows * file_info['size'] / file_info['position']), processed_rows)
+
+    return None
+
+
+class ProductImportService:
+    def __new__(cls, *args, **kwargs):
+        if not hasattr(cls, '_instance'):
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        self.product_import_dao = ProductImportDao()
+        self.product_service = ProductService()
+        self.job_service = JobService()
+
+    # 상품 파일 import 작업 생성
+    def create_import_job(self, conn, file_obj):
+        """업로드된 파일을 s3에 저장하고 import 작업 생성
+
+        실제 등록은 worker(admin/worker.py)가 job_outbox의 PRODUCT_IMPORT_JOB 작업으로 실행하므로
+        웹 서버 프로세스가 재시작되어도 작업이 중단되지 않음
+
+        Args:
+            conn (Connection): DB 커넥션 객체
+            file_obj (FileStorage): 업로드된 csv, xlsx 파일
+
+        Returns:
+            int: 작업 id
+        """
+        if not file_obj or not file_obj.filename:
+            raise RequiredDataError('상품 파일을 업로드하세요.')
+
+        extension = file_obj.filename.rsplit('.', 1)[-1].lower()
+        if extension not in PRODUCT_IMPORT_EXTENSIONS:
+            raise DataTypeDoesNotMatch('csv, xlsx 파일만 업로드할 수 있습니다.')
+
+        # worker가 다른 서버에서 실행될 수 있으므로 파일은 s3에 저장 (DB 입력 전에 업로드)
+        file_key = f'product-imports/{g.account_id}/{uuid.uuid4().hex}.{extension}'
+        get_s3_connection().upload_fileobj(file_obj.stream, BUCKET_NAME, file_key)
+
+        job_id = self.product_import_dao.create_import_job(conn, {
+            'account_id' : g.account_id,
+            'filename' : file_obj.filename[:200]
+        })
+
+        idempotency_key = f'{PRODUCT_IMPORT_JOB}:{job_id}'
+        self.job_service.enqueue_job(conn, PRODUCT_IMPORT_JOB, {
+            'job_id' : job_id,
+            'file_key' : file_key,
+            'extension' : extension,
+            'account_id' : g.account_id,
+            'account_type_id' : g.account_type_id,
+            'idempotency_key' : idempotency_key
+        }, idempotency_key)
+
+        return job_id
+
+    def run_import_job(self, conn, payload: dict):
+        """상품 파일 import 작업 handler (worker에서 실행)
+
+        파일 읽기 -> 상품 단위로 묶기 -> validate, 이름 변환 -> 묶음 단위 등록 (이미지는 작업으로 변환)
+        각 단계는 generator로 연결되어 있어서 파일 크기와 상관없이 한 묶음만 메모리에 유지
+        묶음마다 등록한 상품, 실패한 행, 진행률을 같은 transaction으로 commit 하므로
+        worker가 중간에 종료되어 다시 실행되면 processed_rows 다음 행부터 이어서 등록
+        셀러 정보 오류처럼 다시 실행해도 결과가 같은 오류는 재시도 없이 FAILED로 처리
+
+        Args:
+            conn (Connection): DB Connection Object
+            payload (dict): {'job_id', 'file_key', 'extension', 'account_id', 'account_type_id', 'idempotency_key'}
+        """
+        job_id = payload['job_id']
+        job = self.product_import_dao.get_import_job(conn, {'job_id': job_id})
+        if not job or job['status'] in ('DONE', 'FAILED'):
+            return
+
+        fd, path = tempfile.mkstemp(suffix=f".{payload['extension']}")
+        os.close(fd)
+        try:
+            get_s3_connection().download_file(Bucket=BUCKET_NAME, Key=payload['file_key'], Filename=path)
+
+            try:
+                lookup = ImportLookup(conn, payload['account_id'], payload['account_type_id'])
+            except CustomUserError as e:
+                self.fail_import_job(conn, payload, e.error_message)
+                return
+
+            self.product_import_dao.update_import_job(conn, {'job_id': job_id, 'status': 'RUNNING'})
+            self.job_service.touch_job(conn, payload['idempotency_key'])
+            conn.commit()
+
+            # 이전 실행에서 commit 된 행은 건너뜀 (processed_rows는 항상 상품 단위 경계)
+            file_info = dict()
+            rows = islice(read_file_rows(path, payload['extension'], file_info), job['processed_rows'], None)
+
+            progress = {'rows': job['processed_rows']}
+            success_count = job['success_count']
+            errors = ImportErrors(job_id)
+
+            products = self.make_import_products(self.group_product_rows(rows, progress), lookup, errors)
+            for chunk in chunked(products, BULK_PRODUCT_CHUNK_SIZE):
+                try:
+                    self.create_import_products(conn, chunk, payload['account_id'])
+                    success_count += len(chunk)
+
+                except Exception:
+                    # 실패한 상품을 찾기 위해 묶음을 되돌리고 한 개씩 다시 등록
+                    conn.rollback()
+                    success_count += self.retry_import_products(conn, chunk, payload['account_id'], errors)
+
+                self.save_import_progress(conn, payload, errors, {
+                    'job_id' : job_id,
+                    'total_rows' : estimate_total_rows(file_info, progress['rows']),
+                    'processed_rows' : progress['rows'],
+                    'success_count' : success_count,
+                    'fail_count' : job['fail_count'] + errors.count
+                })
+
+            self.save_import_progress(conn, payload, errors, {
+                'job_id' : job_id,
+                'status' : 'DONE',
+                'total_rows' : progress['rows'],
+                'processed_rows' : progress['rows'],
+                'success_count' : success_count,
+                'fail_count' : job['fail_count'] + errors.count,
+                'finished_at' : datetime.now()
+            })
+
+        finally:
+            os.remove(path)
+
+    def create_import_products(self, conn, products: list, account_id: int):
+        """상품 일괄 등록 후 이미지 작업 추가
+
+        이미지 URL은 작업이 끝날 때까지 그대로 등록되고(image_status PENDING),
+        worker가 내려받아 사이즈별 변환, content hash 저장 후 교체 (enqueue_products_images)
+        """
+        created = self.product_service.create_products_bulk(conn, products, account_id)
+
+        self.product_service.enqueue_products_images(conn, [
+            (result['product_id'], [{'url': url} for url in product['image_urls']])
+            for product, result in zip(products, created)
+        ], replace=True, account_id=account_id)
+
+    def retry_import_products(self, conn, products: list, account_id: int, errors: ImportErrors):
+        """묶음 등록에 실패한 상품들을 한 개씩 등록하고, 실패한 상품의 행만 실제 오류 내용으로 기록
+
+        상품마다 savepoint로 실패한 상품만 되돌리므로 성공한 상품은 진행률과 같은 transaction으로 commit 됨
+
+        Returns:
+            int: 등록에 성공한 상품 수
+        """
+        success_count = 0
+        for product in products:
+            self.product_import_dao.create_savepoint(conn)
+            try:
+                self.create_import_products(conn, [product], account_id)
+                success_count += 1
+
+            except Exception as e:
+                logger.warning('import product failed (rows %s): %r', [row_number for row_number, _ in product['rows']], e)
+                self.product_import_dao.rollback_to_savepoint(conn)
+                errors.write(product['rows'], self.make_import_error_message(e))
+
+        return success_count
+
+    def make_import_error_message(self, e: Exception):
+        if isinstance(e, CustomUserError):
+            return e.error_message
+
+        # DB 오류 등은 오류 종류와 내용을 함께 기록 (pymysql 오류는 args가 (code, message))
+        detail = e.args[-1] if e.args else ''
+        return f'상품 등록에 실패했습니다. ({type(e).__name__}: {detail})'
+
+    def save_import_progress(self, conn, payload: dict, errors: ImportErrors, params: dict):
+        """실패한 행, 진행률 저장 후 commit (작업 실행 중 표시도 같이 갱신)"""
+        errors.flush(conn, self.product_import_dao)
+        self.product_import_dao.update_import_job(conn, params)
+        self.job_service.touch_job(conn, payload['idempotency_key'])
+        conn.commit()
+
+    def fail_import_job(self, conn, payload: dict, error_message: str):
+        """import 작업을 FAILED로 변경 (재시도 횟수를 넘었을 때 worker가 호출, 이미 등록된 상품은 success_count로 남음)"""
+        self.product_import_dao.update_import_job(conn, {
+            'job_id' : payload['job_id'],
+            'status' : 'FAILED',
+            'error_message' : error_message[:500],
+            'finished_at' : datetime.now()
+        })
+
+    def group_product_rows(self, rows, progress):
+        """상품키가 같은 연속된 행을 한 상품으로 묶음 (상품키가 없는 행은 한 행이 한 상품)"""
+        def product_key(row):
+            key = row[1].get(IMPORT_TITLE['product_key'])
+            return str(key).strip() if key not in (None, '') else ('row', row[0])
+
+        for _, group in groupby(rows, key=product_key):
+            group = list(group)
+            progress['rows'] += len(group)
+            yield group
+
+    def make_import_products(self, groups, lookup, errors):
+        """묶은 행을 상품 일괄 등록 입력값으로 변환, 실패한 상품의 행은 오류 파일에 기록"""
+        for group in groups:
+            try:
+                product = self.make_import_product(group, lookup)
+            except CustomUserError as e:
+                errors.write(group, e.error_message)
+                continue
+            yield product
+
+    def make_import_product(self, group, lookup):
+        """상품 한 개의 행들을 validate 후 create_products_bulk 입력값으로 변환
+
+        Args:
+            group (list): [(행 번호, {header: 값}), ...]
+            lookup (ImportLookup): 이름 -> id 변환
+
+        Returns:
+            dict: make_bulk_product_params 결과 + {'image_urls': 이미지 url list, 'rows': group}
+        """
+        rows = [
+            {key: convert_value(key, row.get(header)) for key, header in IMPORT_TITLE.items()}
+            for _, row in group
+        ]
+        first = rows[0]
+
+        seller = lookup.seller(first['seller_id'])
+        category_id = lookup.find(lookup.categories, (seller['property_id'], first['category']), '1차 카테고리를 조회할 수 없습니다.')
+        sub_category_id = lookup.find(lookup.sub_categories, (category_id, first['sub_category']), '2차 카테고리를 조회할 수 없습니다.')
+
+        basic_info = {
+            'seller_id' : seller['seller_id'],
+            'property_id' : seller['property_id'],
+            'category_id' : category_id,
+            'sub_category_id' : sub_category_id
+        }
+        for key in ('is_selling', 'is_displayed', 'title', 'content', 'simple_description', 'manufacturer', 'date_of_manufacture', 'origin'):
+            if first[key] is not None:
+                basic_info[key] = first[key]
+
+        selling_info = {
+            key: first[key]
+            for key in ('price', 'discount_rate', 'discount_start_date', 'discount_end_date', 'min_amount', 'max_amount')
+            if first[key] is not None
+        }
+
+        # 색상, 사이즈, 재고 중 하나라도 입력된 행은 옵션으로 등록
+        option_info = list()
+        for row in rows:
+            if row['color'] is None and row['size'] is None and row['stock'] is None:
+                continue
+
+            option = {'price': selling_info.get('price')}
+            if row['color'] is not None:
+                option['color_id'] = lookup.find(lookup.colors, row['color'], '색상을 조회할 수 없습니다.')
+            if row['size'] is not None:
+                option['size_id'] = lookup.find(lookup.sizes, row['size'], '사이즈를 조회할 수 없습니다.')
+            if row['stock'] is not None:
+                option['stock'] = row['stock']
+            option_info.append(option)
+
+        check_product_required_data({'basic_info': basic_info, 'selling_info': selling_info, 'option_info': option_info})
+
+        image_urls = [check_image_url(url.strip()) for url in (first['image_urls'] or '').split(',') if url.strip()]
+        if not image_urls:
+            raise RequiredDataError('상품 이미지 URL을 입력하세요.')
+
+        product = self.product_service.make_bulk_product_params(basic_info, selling_info, option_info)
+        product['image_urls'] = image_urls
+        product['rows'] = group
+
+        return product
+
+    # 상품 파일 import 작업 조회
+    def get_import_job(self, conn, params):
+        """import 작업 진행 상태 조회, 본인이 생성한 작업만 조회 가능 (마스터는 전체)"""
+        job = self.product_import_dao.get_import_job(conn, params)
+
+        if not job or (g.account_type_id == SELLER and job['account_id'] != g.account_id):
+            raise DataNotExists('상품 import 작업을 조회할 수 없습니다.', 'import job does not exists or Forbidden')
+
+        # total_rows는 읽은 byte 비율로 추정한 값이라 실행 중에는 100%를 넘지 않게 표시
+        if job['status'] == 'DONE':
+            job['progress'] = 100
+        elif job['total_rows']:
+            job['progress'] = min(round(job['processed_rows'] / job['total_rows'] * 100, 1), 99.9)
+        else:
+            job['progress'] = 0
+
+        job.pop('error_file_key')
+        job['has_error_file'] = job['fail_count'] > 0
+        return job
+
+    # 상품 파일 import 오류 파일
+    def get_import_error_file(self, conn, params):
+        """실패한 행의 원본 값과 오류 내용 csv stream
+
+        conn은 반환한 generator가 끝날 때까지 열려 있어야 함 (unbuffered cursor)
+
+        Returns:
+            generator : csv byte chunk
+        """
+        job = self.product_import_dao.get_import_job(conn, params)
+
+        if not job or (g.account_type_id == SELLER and job['account_id'] != g.account_id):
+            raise DataNotExists('상품 import 작업을 조회할 수 없습니다.', 'import job does not exists or Forbidden')
+
+        if not job['fail_count']:
+            raise DataNotExists('오류 파일이 없습니다.', 'error file does not exists')
+
+        title = {'line_number': '행번호', **{header: header for header in IMPORT_TITLE.values()}, 'message': '오류내용'}
+        return stream_csv_file(title, self.make_import_error_rows(self.product_import_dao.get_import_errors(conn, params)))
+
+    def make_import_error_rows(self, errors):
+        """저장된 실패 행 -> 오류 파일 행 (수정 후 그대로 다시 import 할 수 있도록 원본 header 사용)"""
+        for error in errors:
+            values = json.loads(error['row_values'])
+            row = {header: values.get(header) for header in IMPORT_TITLE.values()}
+            row['line_number'] = error['line_number']
+            row['message'] = error['message']
+            yield row
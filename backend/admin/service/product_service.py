@@ -1,11 +1,22 @@
-import random, string, uuid
+import os, uuid, json, hashlib, mimetypes
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from flask import g
 from admin.model import ProductDao
+from admin.service.job_service import JobService
+from admin.service.version_service import VersionService
 from datetime import timedelta, datetime
-from utils.custom_exception import StartDateFail, DataNotExists
+from utils.custom_exception import StartDateFail, DataNotExists, DataTypeDoesNotMatch, TooMuchDataRequests, RequiredDataError
 from utils.excel import export_excel_file
-import copy
 from connection import get_s3_connection
+from botocore.exceptions import ClientError
+from werkzeug.datastructures import FileStorage
+from utils.cache import product_detail_cache
+from utils.code_generator import generate_code
+from utils.image import resize_images, download_image, IMAGE_EXTENSION, IMAGE_CONTENT_TYPE
+from utils.history import make_diff, encode_changes, apply_history
+from utils.money import rate_to_bp, discounted_price
+from utils.projection import parse_fields
 
 from utils.validation import (
                                 validate_integer, 
@@ -19,7 +30,17 @@ from config import BUCKET_NAME, REGION
 from utils.constant import (
                             START_DATE,
                             END_DATE,
-                            PRODUCT_INFO_NOTICE
+                            PRODUCT_INFO_NOTICE,
+                            SELLER,
+                            IMAGE_SIZES,
+                            PRESIGNED_UPLOAD_EXPIRES,
+                            PRESIGNED_UPLOAD_MAX_FILES,
+                            UPLOAD_IMAGE_MAX_SIZE,
+                            PRODUCT_IMAGES_JOB,
+                            PRODUCT_HISTORY_COLUMNS,
+                            PRODUCT_HISTORY_CHECKPOINT_INTERVAL,
+                            PRODUCTS_VERSION,
+                            SELLERS_VERSION
 )
 
 
@@ -31,6 +52,8 @@ class ProductService:
 
     def __init__(self):
         self.product_dao = ProductDao()
+        self.job_service = JobService()
+        self.version_service = VersionService()
     
     # 상품 리스트 가져오기
     def get_products_list(self, conn, params, headers):
@@ -49,6 +72,8 @@ class ProductService:
         
         # HEADERS로 엑셀파일 요청
         if 'application/vnd.ms-excel' in headers.values():
+            # 엑셀은 항상 전체 항목
+            params['fields'] = tuple(self.product_dao.LIST_FIELDS)
             result = self.product_dao.get_products_list(conn, params, headers)
             
             # 할인가격, 진열,판매,할인 여부 추가
@@ -74,12 +99,9 @@ class ProductService:
             }
             
             return export_excel_file(title, result)
-            
-        product_result, total_count_result = self.product_dao.get_products_list(conn, params, headers)
         
-        # 할인가격 key, value 추가
-        for product in product_result:
-            product['discount_price'] = product['price'] - (product['price'] * product['discount_rate'])
+        params['fields'] = parse_fields(params.get('fields'), self.product_dao.LIST_FIELDS)
+        product_result, total_count_result = self.product_dao.get_products_list(conn, params, headers)
 
         result = {
             'total_count' : total_count_result['total_count'],
@@ -89,19 +111,18 @@ class ProductService:
         return result
     
     
-    def create_product_info(self, conn, basic_info: dict, selling_info: dict):
-        """상품 정보 validate, 생성
+    def make_product_params(self, basic_info: dict, selling_info: dict):
+        """상품 정보 validate
 
         필수 입력값, 선택 입력값을 validate 한 후
-        dao에서 한번에 입력하기 위한 준비(null=true인 field에 None 할당)
+        dao에서 한번에 입력하기 위한 준비(null=true인 field에 None 할당, 상품 코드 생성)
 
         Args:
-            conn (Connection): DB Connection Object
             basic_info (dict): 상품에 대한 정보(상품 이름, 상세 설명 등)
             selling_info (dict): 상품 판매에 대한 정보(가격, 할인율, 할인기간, 최대판매량, 최소판매량)
 
         Returns:
-            product_id: 생성된 product의 id 반환
+            params: products 테이블 입력값
         """
 
         # 필수 입력값 validate
@@ -167,9 +188,9 @@ class ProductService:
         params['simple_description'] = basic_info.get('simple_description', None)
         params['manufacturer'] = basic_info.get('manufacturer', PRODUCT_INFO_NOTICE)
         params['origin'] = basic_info.get('origin', PRODUCT_INFO_NOTICE)
-        params['discount_rate'] = basic_info.get('discount_rate', 0)
-        params['min_amount'] = basic_info.get('min_amount', 1)
-        params['max_amount'] = basic_info.get('max_amount', 20)
+        params['discount_rate'] = selling_info.get('discount_rate', 0)
+        params['min_amount'] = selling_info.get('min_amount', 1)
+        params['max_amount'] = selling_info.get('max_amount', 20)
 
         if 'discount_start_date' in selling_info:
             params['discount_start_date'] = validate_datetime(selling_info['discount_start_date'])
@@ -190,29 +211,42 @@ class ProductService:
 
 
         # 상품 코드 생성
-        product_code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=20))
+        product_code = generate_code()
         params['product_code'] = product_code
 
+        return params
+
+    def create_product_info(self, conn, basic_info: dict, selling_info: dict):
+        """상품 정보 validate, 생성
+
+        Args:
+            conn (Connection): DB Connection Object
+            basic_info (dict): 상품에 대한 정보(상품 이름, 상세 설명 등)
+            selling_info (dict): 상품 판매에 대한 정보(가격, 할인율, 할인기간, 최대판매량, 최소판매량)
+
+        Returns:
+            product_id: 생성된 product의 id 반환
+        """
+        params = self.make_product_params(basic_info, selling_info)
+
         # products 테이블에 데이터 입력
-        product_id = self.product_dao.create_product_info_dao(conn, params)
+        product_id = self.product_dao.create_product_info_dao(conn, [params])[0]
+        self.product_dao.update_effective_price(conn, [product_id])
 
         # history 생성
         params['product_id'] = product_id
         params['modify_account_id'] = g.account_id
-        self.product_dao.create_product_history(conn, params)
+        self.product_dao.create_product_history(conn, [params])
         
         return product_id
 
-    def create_option_info(self, conn, product_id:int, option_info: list):
-        """옵션 상품 정보 validate, 생성
+    def make_option_params(self, option_info: list):
+        """옵션 상품 정보 validate
+
+        선택 입력값에 None 할당, 옵션 코드 생성 (product_id는 상품 생성 후 할당)
 
         Args:
-            conn (Connection): DB Connection Object
-            product_id (int): 연결시킬 상위개념의 상품의 id
             option_info (list): 옵션 상품 리스트
-
-        Returns:
-            product_dao 계층의 create_option_history method
         """
         for option in option_info:
 
@@ -230,59 +264,508 @@ class ProductService:
                 validate_integer(option['size_id'])
 
             # 입력값 setting
-            option_code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=25))
+            option_code = generate_code()
             option['color_id'] = option.get('color_id', None)
             option['size_id'] = option.get('size_id', None)
             option['stock'] = option.get('stock', None)
-            option['product_id'] = product_id
             option['option_code'] = option_code
 
+    def create_option_info(self, conn, product_id:int, option_info: list):
+        """옵션 상품 정보 validate, 생성
+
+        Args:
+            conn (Connection): DB Connection Object
+            product_id (int): 연결시킬 상위개념의 상품의 id
+            option_info (list): 옵션 상품 리스트
+
+        Returns:
+            product_dao 계층의 create_option_history method
+        """
+        self.make_option_params(option_info)
+
+        if not option_info:
+            return
+
+        for option in option_info:
+            option['product_id'] = product_id
+
         option_ids = self.product_dao.create_option_info_dao(conn, option_info)
 
         # options_history 생성
-        option_length = len(option_info)
-        for i in range(option_length):
-            option_info[i]['option_id'] = option_ids[i]
-            option_info[i]['modify_account_id'] = g.account_id
-            option_info[i]['is_deleted'] = 0
+        for option, option_id in zip(option_info, option_ids):
+            option['option_id'] = option_id
+            option['modify_account_id'] = g.account_id
+            option['is_deleted'] = 0
         
         return self.product_dao.create_option_history(conn, option_info)
     
     def upload_file_to_s3(self, img_obj, folder: str):
         s3_conn = get_s3_connection()
-        uploaded_at = str(datetime.now())
-        filename = img_obj.filename
-        name = folder + uploaded_at + filename
-        # 띄어쓰기, 콜론 등 필요없는 부분을 제거하기 위함
-        key = name.replace(" ", "").replace(":","")
+        key = self.make_s3_key(folder, img_obj.filename)
         s3_conn.upload_fileobj(Fileobj=img_obj,
                                 Bucket=BUCKET_NAME,
                                 Key=key)
         url = f"https://{BUCKET_NAME}.s3.{REGION}.amazonaws.com/{key}"
         
         return url
+
+    def make_s3_key(self, folder: str, filename: str):
+        uploaded_at = str(datetime.now())
+        name = folder + uploaded_at + filename
+        # 띄어쓰기, 콜론 등 필요없는 부분을 제거하기 위함
+        return name.replace(" ", "").replace(":","")
+
+    def upload_bytes_to_s3(self, s3_conn, key: str, data: bytes, content_type: str):
+        s3_conn.upload_fileobj(Fileobj=BytesIO(data),
+                                Bucket=BUCKET_NAME,
+                                Key=key,
+                                ExtraArgs={'ContentType': content_type})
+        return f"https://{BUCKET_NAME}.s3.{REGION}.amazonaws.com/{key}"
     
-    def insert_image_url(self, conn, product_id: int, imgs_obj: list):
-        """image_url 생성 후 dao에서의 입력을 위해 
+    def create_image_upload_intents(self, files: list):
+        """상품 이미지 직접 업로드용 presigned PUT url 생성
+
+        클라이언트는 받은 url로 s3에 바로 PUT 하고, 상품 등록/수정 요청에는 파일 대신 key를 보냄
+        key는 계정별 임시 경로(product-uploads/{account_id}/)라서 다른 계정이 올린 파일은 사용할 수 없고,
+        상품에 연결되지 않은 파일은 bucket lifecycle 규칙으로 정리
+
+        Args:
+            files (list): [{'filename': 파일명, 'content_type': 이미지 MIME type}, ...]
+
+        Raises:
+            RequiredDataError: 파일 정보가 없는 경우
+            TooMuchDataRequests: PRESIGNED_UPLOAD_MAX_FILES 보다 많이 요청한 경우
+            DataTypeDoesNotMatch: 이미지가 아닌 경우
+
+        Returns:
+            list: [{'key': s3 key, 'upload_url': PUT url, 'headers': PUT 요청에 포함할 header, 'expires_in': 유효 시간(초)}, ...]
+        """
+        if not files:
+            raise RequiredDataError('업로드할 파일 정보를 입력하세요.')
+
+        if len(files) > PRESIGNED_UPLOAD_MAX_FILES:
+            raise TooMuchDataRequests(f'한 번에 {PRESIGNED_UPLOAD_MAX_FILES}개까지 업로드할 수 있습니다.')
+
+        s3_conn = get_s3_connection()
+        intents = list()
+        for file in files:
+            filename = file.get('filename') or ''
+            content_type = file.get('content_type') or ''
+
+            if not content_type.startswith('image/'):
+                raise DataTypeDoesNotMatch('이미지 파일만 업로드할 수 있습니다.')
+
+            extension = os.path.splitext(filename)[1].lower()
+            key = f'product-uploads/{g.account_id}/{uuid.uuid4().hex}{extension}'
+
+            # 서명에 Content-Type이 포함되므로 클라이언트는 같은 header로 PUT 해야 함
+            upload_url = s3_conn.generate_presigned_url('put_object',
+                                                        Params={'Bucket': BUCKET_NAME, 'Key': key, 'ContentType': content_type},
+                                                        ExpiresIn=PRESIGNED_UPLOAD_EXPIRES)
+            intents.append({
+                'key' : key,
+                'upload_url' : upload_url,
+                'headers' : {'Content-Type': content_type},
+                'expires_in' : PRESIGNED_UPLOAD_EXPIRES
+            })
+
+        return intents
+
+    def check_uploaded_image(self, s3_conn, key: str):
+        try:
+            head = s3_conn.head_object(Bucket=BUCKET_NAME, Key=key)
+        except ClientError:
+            raise DataNotExists('업로드되지 않은 이미지가 있습니다.')
+
+        if head['ContentLength'] > UPLOAD_IMAGE_MAX_SIZE:
+            raise TooMuchDataRequests('이미지 파일 크기가 너무 큽니다.')
+
+        return head
+
+    def get_uploaded_image(self, s3_conn, key: str):
+        head = self.check_uploaded_image(s3_conn, key)
+        content_type = head.get('ContentType') or 'application/octet-stream'
+        body = s3_conn.get_object(Bucket=BUCKET_NAME, Key=key)['Body'].read()
+
+        return FileStorage(BytesIO(body), filename=os.path.basename(key), content_type=content_type)
+
+    def check_upload_keys(self, image_keys: list, account_id: int):
+        if not image_keys:
+            raise RequiredDataError('상품 이미지를 입력하세요.')
+
+        prefix = f'product-uploads/{account_id}/'
+        for key in image_keys:
+            if not isinstance(key, str) or not key.startswith(prefix) or '/' in key[len(prefix):]:
+                raise RequiredDataError('업로드한 이미지 정보가 올바르지 않습니다.')
+
+    def check_uploaded_images(self, image_keys: list):
+        """presigned url로 업로드된 이미지가 s3에 있는지 확인 (요청에서 DB transaction 시작 전에 호출)
+
+        Args:
+            image_keys (list): create_image_upload_intents로 받은 s3 key list, 첫 번째 이미지가 대표 이미지
+
+        Raises:
+            RequiredDataError: key가 없거나 본인 계정의 업로드 경로가 아닌 경우
+            DataNotExists: s3에 업로드되지 않은 key가 있는 경우
+            TooMuchDataRequests: 이미지 파일 크기가 UPLOAD_IMAGE_MAX_SIZE 보다 큰 경우
+
+        Returns:
+            list: 상품 이미지 list (stage_images와 같은 형태), [{'key', 'image_url'}, ...]
+        """
+        self.check_upload_keys(image_keys, g.account_id)
+
+        s3_conn = get_s3_connection()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda key: self.check_uploaded_image(s3_conn, key), image_keys))
+
+        return [{'key': key, 'image_url': self.make_s3_url(key)} for key in image_keys]
+
+    def get_uploaded_images(self, image_keys: list, account_id: int = None):
+        """업로드된 이미지를 FileStorage로 변환
+
+        파일로 받은 경우와 같은 FileStorage Object로 만들어서 이후 변환, 저장(make_image_params)은 그대로 사용
+
+        Args:
+            image_keys (list): 업로드 경로의 s3 key list, 첫 번째 이미지가 대표 이미지
+            account_id (int): 업로드한 계정 id, 기본값은 g.account_id
+
+        Returns:
+            list: FileStorage Object list
+        """
+        if account_id is None:
+            account_id = g.account_id
+
+        self.check_upload_keys(image_keys, account_id)
+
+        # 확인, 다운로드는 network 대기라 thread로 동시에 실행
+        s3_conn = get_s3_connection()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(lambda key: self.get_uploaded_image(s3_conn, key), image_keys))
+
+    def make_s3_url(self, key: str):
+        return f"https://{BUCKET_NAME}.s3.{REGION}.amazonaws.com/{key}"
+
+    def stage_images(self, conn, imgs_obj: list):
+        """multipart로 받은 이미지 파일 중 저장된 적 없는 이미지만 presigned url 업로드와 같은 임시 경로에 업로드
+
+        content hash가 product_images에 이미 있는 이미지는 업로드하지 않고 저장된 url을 사용 (상품 수정 시 기존 이미지 등)
+        DB transaction 시작 전에 호출 (conn은 저장된 이미지 조회만 실행)
 
         Args:
             conn (Connection): DB Connection Object
-            product_id (int): image가 해당되는 product_id
             imgs_obj (list): request로 받은 FileStorage Object list
 
         Returns:
-            product_dao 계층의 insert_image_url_dao method
+            list: imgs_obj 순서대로 새 이미지는 {'key', 'image_url'}, 저장된 이미지는 {'content_hash', 'image_url'}
         """
-        str_account_id = str(g.account_id)
-        str_product_id = str(product_id)
+        images = self.read_images(imgs_obj)
+        stored_urls = self.product_dao.get_images_by_content_hashes(
+            conn, list({content_hash for _, _, content_hash in images}))
+
+        # 같은 요청 안의 중복 파일도 한 번만 업로드
+        staged_keys = dict()
+        uploads = list()
+        result = list()
+        for img_obj, data, content_hash in images:
+            if content_hash in stored_urls:
+                result.append({'content_hash': content_hash, 'image_url': stored_urls[content_hash]['image_url']})
+                continue
+
+            if content_hash not in staged_keys:
+                extension = os.path.splitext(img_obj.filename)[1].lower()
+                staged_keys[content_hash] = f'product-uploads/{g.account_id}/{uuid.uuid4().hex}{extension}'
+                uploads.append((staged_keys[content_hash], data, img_obj.mimetype or 'application/octet-stream'))
+
+            result.append({'key': staged_keys[content_hash], 'image_url': self.make_s3_url(staged_keys[content_hash])})
+
+        if uploads:
+            s3_conn = get_s3_connection()
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda upload: self.upload_bytes_to_s3(s3_conn, *upload), uploads))
 
-        folder = f'product-images/{str_account_id}/{str_product_id}/'
-        
-        imgs_url = list()
+        return result
+
+    def bump_product_version(self, conn, product_id: int):
+        """상품 등록, 수정 요청의 마지막(commit 직전)에 상품 version을 올림
+
+        version row의 lock은 commit 까지 유지되므로 상품, 옵션, 이미지 입력과 작업 추가가 모두 끝난 뒤 호출
+        """
+        self.version_service.bump_products(conn, [product_id])
+
+    def create_staged_images(self, conn, product_id: int, images: list):
+        """stage_images(check_uploaded_images) 결과의 url로 product_images 입력 (요청 transaction에서 실행)
+
+        worker가 변환 이미지로 교체하기 전에도 상품 리스트(대표 이미지 join), 상세에서 조회되도록
+        새 이미지는 업로드 경로의 url을 그대로 사용하고, 작업 완료 시 replace_images에서 교체됨
+
+        Args:
+            conn (Connection): DB Connection Object
+            product_id (int): 상품 id
+            images (list): stage_images 결과, 첫 번째 이미지가 대표 이미지
+        """
+        params = self.make_image_url_params(product_id, [image['image_url'] for image in images], g.account_id)
+        return self.product_dao.insert_image_url_dao(conn, params)
+
+    def enqueue_product_images(self, conn, product_id: int, images: list, replace: bool = False):
+        """상품 이미지 변환, 저장 작업 추가 (요청 transaction이 commit 된 후 worker에서 실행)
+
+        작업이 끝날 때까지 상품의 image_status는 PENDING
+        작업마다 상품의 이미지 작업 순번(image_seq)을 올려 payload에 저장하므로, 이전 수정의 작업은 실행되지 않음
+
+        Args:
+            conn (Connection): DB Connection Object
+            product_id (int): 상품 id
+            images (list): stage_images(check_uploaded_images) 결과, 첫 번째 이미지가 대표 이미지
+            replace (bool): 기존 이미지를 교체하는 경우(상품 수정) True
+        """
+        self.enqueue_products_images(conn, [(product_id, images)], replace)
+
+    def enqueue_products_images(self, conn, products: list, replace: bool = False, account_id: int = None):
+        """여러 상품의 이미지 작업을 한 번에 추가 (enqueue_product_images, 파일 import)
+
+        Args:
+            conn (Connection): DB Connection Object
+            products (list): [(상품 id, 이미지 list), ...], 이미지는 {'key'}, {'content_hash'}, {'url'} 중 하나
+            replace (bool): 기존 이미지를 교체하는 경우 True
+            account_id (int): 등록한 계정 id, 요청 밖(파일 import 등)에서 실행할 때 지정. 기본값은 g.account_id
+        """
+        if account_id is None:
+            account_id = g.account_id
+
+        image_seqs = self.product_dao.start_image_jobs(conn, {'product_ids': [product_id for product_id, _ in products]})
+
+        self.job_service.enqueue_jobs(conn, PRODUCT_IMAGES_JOB, [
+            (
+                {
+                    'product_id' : product_id,
+                    'image_seq' : image_seqs[product_id],
+                    # 새 이미지는 업로드 경로 key(외부 이미지는 url), 저장된 이미지는 content hash만 전달
+                    'images' : [{k: v for k, v in image.items() if k != 'image_url'} for image in images],
+                    'account_id' : account_id,
+                    'replace' : replace
+                },
+                f"{PRODUCT_IMAGES_JOB}:{product_id}:{image_seqs[product_id]}"
+            )
+            for product_id, images in products
+        ])
+
+    def get_job_images(self, conn, images: list, account_id: int):
+        """작업 payload의 이미지를 upload_images 결과 형태로 변환
+
+        업로드 경로의 새 이미지와 외부 이미지 url은 내려받아 변환, 저장하고, content hash로 받은 이미지는 저장된 url 사용
+
+        Args:
+            conn (Connection): DB Connection Object
+            images (list): [{'key'}, {'url'} 또는 {'content_hash'}, ...]
+            account_id (int): 업로드한 계정 id
+
+        Raises:
+            DataNotExists: content hash의 이미지가 저장되어 있지 않은 경우
+
+        Returns:
+            list: images 순서대로 {'image_url', 'thumbnail_url', 'list_url', 'detail_url', 'content_hash'}
+        """
+        keys = list(dict.fromkeys(image['key'] for image in images if 'key' in image))
+        urls = list(dict.fromkeys(image['url'] for image in images if 'url' in image))
+
+        imgs_obj = list()
+        if keys:
+            imgs_obj.extend(self.get_uploaded_images(keys, account_id))
+        if urls:
+            # 내려받기는 network 대기라 thread로 동시에 실행
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                imgs_obj.extend(executor.map(self.get_url_image, urls))
+
+        uploaded = dict()
+        if imgs_obj:
+            uploaded = dict(zip(keys + urls, self.upload_images(conn, imgs_obj)))
+
+        stored_urls = self.product_dao.get_images_by_content_hashes(
+            conn, list({image['content_hash'] for image in images if 'content_hash' in image}))
+
+        result = list()
+        for image in images:
+            if 'key' in image:
+                result.append(uploaded[image['key']])
+            elif 'url' in image:
+                result.append(uploaded[image['url']])
+            elif image['content_hash'] in stored_urls:
+                result.append(dict(stored_urls[image['content_hash']], content_hash=image['content_hash']))
+            else:
+                raise DataNotExists('저장된 이미지를 찾을 수 없습니다.')
+
+        return result
+
+    def get_url_image(self, url: str):
+        """외부 이미지 url을 내려받아 FileStorage로 변환 (파일 import)"""
+        data, content_type = download_image(url)
+        # 원본 s3 key의 확장자는 url이 아닌 응답 content type 기준
+        filename = 'image' + (mimetypes.guess_extension(content_type) or '')
+        return FileStorage(BytesIO(data), filename=filename, content_type=content_type)
+
+    def is_latest_image_job(self, conn, payload: dict, for_update: bool = False):
+        return self.product_dao.get_image_seq(conn, payload, for_update) == payload['image_seq']
+
+    def run_product_images_job(self, conn, payload: dict):
+        """상품 이미지 변환, 저장 작업 handler (worker에서 실행)
+
+        s3 key가 이미지 hash라서 다시 실행해도 같은 파일을 덮어쓰고,
+        product_images 입력은 작업 완료 처리와 같은 transaction이라 한 번만 반영됨
+        이후 수정으로 새 작업이 추가된 경우(payload의 image_seq가 상품의 현재 순번과 다름) 아무것도 하지 않고 완료
+        상품 version을 올리므로 모든 프로세스의 상품 상세 캐시가 commit 이후 다시 조회됨
+
+        Args:
+            conn (Connection): DB Connection Object
+            payload (dict): {'product_id', 'image_seq', 'images', 'account_id', 'replace'}
+        """
+        if not self.is_latest_image_job(conn, payload):
+            return
+
+        stored_images = self.get_job_images(conn, payload['images'], payload['account_id'])
+
+        # 변환, 업로드 중에 새 작업이 추가됐는지 상품 row lock을 잡고 다시 확인
+        if not self.is_latest_image_job(conn, payload, for_update=True):
+            return
+
+        if payload['replace']:
+            self.replace_images(conn, payload['product_id'], stored_images, payload['account_id'])
+        else:
+            params = self.make_stored_image_params(payload['product_id'], stored_images, payload['account_id'])
+            self.product_dao.insert_image_url_dao(conn, params)
+
+        self.product_dao.update_image_status(conn, {
+            'product_id' : payload['product_id'],
+            'image_seq' : payload['image_seq'],
+            'image_status' : 'DONE'
+        })
+        self.version_service.bump_products(conn, [payload['product_id']])
+
+    def fail_product_images_job(self, conn, payload: dict, error_message: str):
+        """상품 이미지 작업을 최대 시도 횟수를 넘어 실패한 경우 상품의 image_status를 FAILED로 변경 (worker에서 실행)
+
+        등록 시 입력한 업로드 경로의 원본 이미지(수정인 경우 기존 이미지)는 그대로 남음
+        이후 수정으로 새 작업이 추가된 경우에는 변경하지 않음
+        """
+        updated = self.product_dao.update_image_status(conn, {
+            'product_id' : payload['product_id'],
+            'image_seq' : payload['image_seq'],
+            'image_status' : 'FAILED'
+        })
+        if updated:
+            self.version_service.bump_products(conn, [payload['product_id']])
+
+    def read_images(self, imgs_obj: list):
+        """업로드된 이미지 파일을 읽고 content hash 계산
+
+        Returns:
+            list: [(FileStorage, bytes, sha256 hex), ...]
+        """
+        images = list()
         for img_obj in imgs_obj:
-            url = self.upload_file_to_s3(img_obj, folder)
-            imgs_url.append(url)
-        
+            # 일괄 등록에서 여러 상품이 같은 파일을 사용하는 경우를 위해 처음부터 읽음
+            img_obj.seek(0)
+            data = img_obj.read()
+            images.append((img_obj, data, hashlib.sha256(data).hexdigest()))
+        return images
+
+    def upload_images(self, conn, imgs_obj: list):
+        """이미지를 사이즈별로 변환해서 s3에 업로드 (DB에는 입력하지 않음)
+
+        s3 key는 이미지 내용의 hash라서 같은 이미지는 한 번만 저장하고,
+        이미 등록된 적 있는 이미지는 변환, 업로드 없이 기존 url을 재사용
+        원본과 IMAGE_SIZES 사이즈별 이미지(thumbnail, list, detail)를 함께 업로드
+        DB 입력 전에 호출해서 업로드하는 동안 입력한 row의 lock을 잡고 있지 않도록 함
+
+        Args:
+            conn (Connection): DB Connection Object (저장된 이미지 조회만 실행)
+            imgs_obj (list): request로 받은 FileStorage Object list
+
+        Returns:
+            list: imgs_obj 순서대로 {'image_url', 'thumbnail_url', 'list_url', 'detail_url', 'content_hash'}
+        """
+        images = self.read_images(imgs_obj)
+        content_hashes = [content_hash for _, _, content_hash in images]
+
+        # 이미 저장된 이미지 {content_hash: {'image_url', 'thumbnail_url', 'list_url', 'detail_url'}}
+        stored_urls = self.product_dao.get_images_by_content_hashes(conn, list(set(content_hashes)))
+
+        # 새로 저장할 이미지 (같은 요청 안의 중복도 한 번만)
+        new_images = dict()
+        for img_obj, data, content_hash in images:
+            if content_hash not in stored_urls and content_hash not in new_images:
+                new_images[content_hash] = (img_obj, data)
+
+        if new_images:
+            # process pool에서 사이즈별 이미지 변환
+            resized_imgs = resize_images([data for _, data in new_images.values()])
+
+            # 업로드할 파일 (key, bytes, content type)
+            uploads = list()
+            for (content_hash, (img_obj, data)), resized in zip(new_images.items(), resized_imgs):
+                extension = os.path.splitext(img_obj.filename)[1].lower()
+                uploads.append((f'product-images/{content_hash}{extension}', data, img_obj.mimetype or 'application/octet-stream'))
+
+                for size, resized_data in resized.items():
+                    uploads.append((f'product-images/{content_hash}_{size}.{IMAGE_EXTENSION}', resized_data, IMAGE_CONTENT_TYPE))
+
+            # s3 업로드는 network 대기라 thread로 동시에 실행
+            s3_conn = get_s3_connection()
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                urls = list(executor.map(lambda upload: self.upload_bytes_to_s3(s3_conn, *upload), uploads))
+
+            per_image = 1 + len(IMAGE_SIZES)
+            for idx, content_hash in enumerate(new_images):
+                image_urls = urls[idx * per_image:(idx + 1) * per_image]
+                stored_urls[content_hash] = {'image_url': image_urls[0]}
+                stored_urls[content_hash].update({f'{size}_url': url for size, url in zip(IMAGE_SIZES, image_urls[1:])})
+
+        return [dict(stored_urls[content_hash], content_hash=content_hash) for content_hash in content_hashes]
+
+    def make_stored_image_params(self, product_id: int, stored_images: list, account_id: int):
+        """upload_images 결과로 product_images 테이블 입력값 생성
+
+        Args:
+            product_id (int): image가 해당되는 product_id
+            stored_images (list): upload_images 결과, 첫 번째 이미지가 대표 이미지
+            account_id (int): 등록한 계정 id
+
+        Returns:
+            params: product_images 테이블 입력값 list
+        """
+        params = self.make_image_url_params(product_id, [image['image_url'] for image in stored_images], account_id)
+        for param, image in zip(params, stored_images):
+            param.update(image)
+
+        return params
+
+    def make_image_params(self, conn, product_id: int, imgs_obj: list, account_id: int = None):
+        """이미지를 s3에 업로드(upload_images) 후 product_images 테이블 입력값 생성
+
+        Args:
+            conn (Connection): DB Connection Object
+            product_id (int): image가 해당되는 product_id
+            imgs_obj (list): request로 받은 FileStorage Object list, 첫 번째 이미지가 대표 이미지
+            account_id (int): 등록한 계정 id, 기본값은 g.account_id
+
+        Returns:
+            params: product_images 테이블 입력값 list
+        """
+        if account_id is None:
+            account_id = g.account_id
+
+        return self.make_stored_image_params(product_id, self.upload_images(conn, imgs_obj), account_id)
+
+    def make_image_url_params(self, product_id: int, imgs_url: list, account_id: int):
+        """이미지 url로 product_images 테이블 입력값 생성
+
+        Args:
+            product_id (int): image가 해당되는 product_id
+            imgs_url (list): 이미지 url list, 첫 번째 이미지가 대표 이미지
+            account_id (int): 등록한 계정 id
+
+        Returns:
+            params: product_images 테이블 입력값 list
+        """
         params = list()
 
         for idx, val in enumerate(imgs_url):
@@ -290,7 +773,12 @@ class ProductService:
             result = dict()
             result['image_url'] = val
             result['product_id'] = product_id
-            result['created_account_id'] = g.account_id
+            result['created_account_id'] = account_id
+
+            # 사이즈별 이미지가 없으면 원본 사용 (목록 조회에서 COALESCE)
+            for size in IMAGE_SIZES:
+                result[f'{size}_url'] = None
+            result['content_hash'] = None
 
             if idx == 0:
                 result['is_represent'] = 1
@@ -299,8 +787,108 @@ class ProductService:
             
             params.append(result)
             
+        return params
+
+    def insert_image_url(self, conn, product_id: int, imgs_obj: list, account_id: int = None):
+        """image_url 생성 후 dao에서의 입력을 위해 
+
+        Args:
+            conn (Connection): DB Connection Object
+            product_id (int): image가 해당되는 product_id
+            imgs_obj (list): request로 받은 FileStorage Object list
+            account_id (int): 등록한 계정 id, 기본값은 g.account_id
+
+        Returns:
+            product_dao 계층의 insert_image_url_dao method
+        """
+        params = self.make_image_params(conn, product_id, imgs_obj, account_id)
         return self.product_dao.insert_image_url_dao(conn, params)
 
+    # 상품 일괄 등록
+    def make_bulk_product_params(self, basic_info: dict, selling_info: dict, option_info: list):
+        """일괄 등록할 상품 한 개의 상품, 옵션 정보 validate
+
+        Returns:
+            dict: {'params': products 테이블 입력값, 'options': options 테이블 입력값 list}
+        """
+        options = option_info or list()
+        self.make_option_params(options)
+
+        return {
+            'params' : self.make_product_params(basic_info, selling_info),
+            'options' : options
+        }
+
+    def create_products_bulk(self, conn, products: list, account_id: int = None):
+        """상품 일괄 등록
+
+        validate가 끝난 상품들을 상품, 상품 history, 옵션, 옵션 history, 이미지 별로
+        multi-row INSERT 한 번씩 입력 (commit은 호출하는 쪽에서 묶음 단위로 수행)
+
+        Args:
+            conn (Connection): DB Connection Object
+            products (list): 
+                [
+                    {
+                        'params' : make_bulk_product_params의 상품 입력값,
+                        'options' : make_bulk_product_params의 옵션 입력값 list,
+                        'stored_images' : upload_images 결과 list (s3 업로드는 호출 전에 완료)
+                            또는 'image_urls' : 이미지 url list
+                    },
+                    ...
+                ]
+            account_id (int): 등록하는 계정 id, 요청 밖(파일 import 등)에서 실행할 때 지정. 기본값은 g.account_id
+
+        Returns:
+            list: products 순서대로 [{'product_id': 상품아이디, 'product_code': 상품코드}, ...]
+        """
+        if account_id is None:
+            account_id = g.account_id
+
+        product_params = [product['params'] for product in products]
+        product_ids = self.product_dao.create_product_info_dao(conn, product_params)
+        self.product_dao.update_effective_price(conn, product_ids)
+
+        options = list()
+        images = list()
+        for product, product_id in zip(products, product_ids):
+            product['params']['product_id'] = product_id
+            product['params']['modify_account_id'] = account_id
+
+            for option in product['options']:
+                option['product_id'] = product_id
+            options.extend(product['options'])
+
+            if 'image_urls' in product:
+                images.extend(self.make_image_url_params(product_id, product['image_urls'], account_id))
+            else:
+                images.extend(self.make_stored_image_params(product_id, product['stored_images'], account_id))
+
+        # 상품 history 생성
+        self.product_dao.create_product_history(conn, product_params)
+
+        # 옵션, 옵션 history 생성
+        if options:
+            option_ids = self.product_dao.create_option_info_dao(conn, options)
+            for option, option_id in zip(options, option_ids):
+                option['option_id'] = option_id
+                option['modify_account_id'] = account_id
+                option['is_deleted'] = 0
+
+            self.product_dao.create_option_history(conn, options)
+
+        self.product_dao.insert_image_url_dao(conn, images)
+
+        self.version_service.bump_products(conn, product_ids)
+
+        return [
+            {
+                'product_id' : params['product_id'],
+                'product_code' : params['product_code']
+            }
+            for params in product_params
+        ]
+
     # 상품 리스트에서 상품의 판매여부, 진열여부 수정
     def patch_product_selling_or_display_status(self, conn, params):
         """상품 판매, 진열 수정 함수
@@ -322,6 +910,7 @@ class ProductService:
         """
         # 데이터베이스 상품 조회 후 tuple 형태 변환
         product_check_results = tuple(map(lambda d:d.get('product_id'), self.product_dao.check_product_exists(conn, params)))
+        product_check_ids = set(product_check_results)
         
         # 해당 상품이 없거나 권한이 없을 경우 return
         if not product_check_results:
@@ -333,21 +922,22 @@ class ProductService:
         # 데이터베이스에 있는 상품 리스트
         product_check_success_result = list()
         
-        # 요청으로 들어온 값을 복합객체, 내용 복사
-        requests_data = copy.deepcopy(params)
-
         # 요청으로 들어온 상품 과 데이터베이스 비교 후 리스트 분리
-        for request_data in requests_data:
-            if request_data.get('product_id') in product_check_results:
+        for request_data in params:
+            if request_data.get('product_id') in product_check_ids:
                 product_check_success_result.append(request_data)
             else:
                 product_check_fail_result.append(request_data)
 
         # 상품 판매, 진열 상태 변경
+        before = self.product_dao.get_products_history_columns(conn, product_check_results)
         self.product_dao.patch_product_selling_or_display_status(conn, product_check_success_result)
         
         # 상품 히스토리에 변경 이력 저장
-        self.product_dao.insert_product_history(conn, product_check_results)
+        self.create_products_history(conn, before)
+
+        # 변경된 상품의 목록, 상세 캐시 version 증가
+        self.version_service.bump_products(conn, product_check_results)
 
         return product_check_fail_result
 
@@ -356,7 +946,8 @@ class ProductService:
     def get_product_detail(self, conn, params):
         """상품 코드로 상품 상세 조회 서비스
 
-        상품코드로 상품정보, 상품이미지, 상품옵션 정보를 가져오고 결과 fomatting 수행
+        상품코드로 상품정보, 상품이미지, 상품옵션 정보를 한 번의 쿼리로 가져오고 결과 fomatting 수행
+        fomatting 결과는 (상품코드, 조회 계정 범위) 단위로 캐시하고, 상품 셀러의 상품, 셀러 version(table_versions)이 바뀌면 다시 조회
 
         Args:
             conn (Connection): DB 커넥션 객체
@@ -406,21 +997,38 @@ class ProductService:
                         }
                     }
         """
+        # 셀러는 본인 상품만 조회할 수 있으므로 캐시도 셀러 계정별로 분리
+        scope = g.account_id if g.account_type_id == SELLER else 'master'
+        cache_key = (params['product_code'], scope)
+
+        # 캐시에 저장된 값은 상품 셀러의 상품, 셀러 version이 그대로일 때만 사용
+        product_detail = product_detail_cache.get(
+            cache_key,
+            lambda seller_account_id: self.version_service.get_versions(conn, (PRODUCTS_VERSION, SELLERS_VERSION), seller_account_id)
+        )
+        if product_detail:
+            return product_detail
+
+        # 상품 정보, 이미지, 옵션을 한 번에 조회 (이미지, 옵션은 JSON 배열 문자열)
         product_result = self.product_dao.get_product_detail(conn, params)
         
         if not product_result:
             raise DataNotExists('상품을 조회할 수 없습니다.', 'product does not exists or Forbidden')
 
-        product_image_result = self.product_dao.get_product_images_by_product_code(conn, params)
+        product_image_result = json.loads(product_result['images']) if product_result['images'] else None
 
         if not product_image_result:
             raise DataNotExists('상품이미지를 조회할 수 없습니다.', 'product image does not exists or Forbidden')
 
-        product_option_result = self.product_dao.get_product_options_by_product_code(conn, params)
+        product_option_result = json.loads(product_result['options']) if product_result['options'] else None
 
         if not product_option_result:
             raise DataNotExists('상품옵션을 조회할 수 없습니다.', 'product option does not exists or Forbidden')
 
+        # JSON_ARRAYAGG 순서는 호출마다 달라질 수 있으므로 대표 이미지를 먼저, 나머지는 등록(id) 순으로 정렬
+        product_image_result.sort(key=lambda image: (not image['is_represent'], image['id']))
+        product_option_result.sort(key=lambda option: option['id'])
+
         product_detail = {
             'basic_info': {
                 'seller_name' : product_result['seller_name'],
@@ -428,6 +1036,7 @@ class ProductService:
                 'product_code': product_result['product_code'],
                 'is_selling': product_result['is_selling'],
                 'is_displayed' : product_result['is_displayed'],
+                'image_status' : product_result['image_status'],
                 'property_name': product_result['property'],
                 'property_id': product_result['property_id'],
                 'category': product_result['category'],
@@ -461,7 +1070,7 @@ class ProductService:
             'selling_info': {
                 'price': product_result['price'],
                 'discount_rate': product_result['discount_rate'],
-                'discount_price': product_result['price'] - product_result['price'] * product_result['discount_rate'],
+                'discount_price': discounted_price(product_result['price'], rate_to_bp(product_result['discount_rate'])),
                 'discount_start_date': product_result['discount_start_date'],
                 'discount_end_date': product_result['discount_end_date'],
                 'min_amount': product_result['min_amount'],
@@ -469,8 +1078,19 @@ class ProductService:
             }
         }
 
+        product_detail_cache.set(
+            cache_key,
+            product_result['seller_account_id'],
+            (product_result['products_version'], product_result['sellers_version']),
+            product_detail
+        )
+
         return product_detail
     
+    # 상품 상세 캐시 통계
+    def get_product_detail_cache_stats(self):
+        return product_detail_cache.stats()
+
     # 상품 등록 창에서 seller 검색 master만 가능함
     def search_seller(self, conn, keyword:str):
         keyword = keyword + '%'
@@ -500,10 +1120,20 @@ class ProductService:
     
     # 상품 상세 설명에 들어가는 image url 
     def create_product_html_image_url(self, img_obj):
-        str_account_id = str(g.account_id)
-        folder = f'product-images-in-html/{str_account_id}/'
-        url = self.upload_file_to_s3(img_obj, folder)
-        return url
+        """상품 상세 설명(html)에 들어가는 이미지 업로드
+
+        s3 key는 이미지 내용의 hash라서 이미 업로드된 이미지(여러 상품에 쓰는 배너 등)는 다시 업로드하지 않음
+        """
+        _, data, content_hash = self.read_images([img_obj])[0]
+        extension = os.path.splitext(img_obj.filename)[1].lower()
+        key = f'product-images-in-html/{content_hash}{extension}'
+
+        s3_conn = get_s3_connection()
+        try:
+            s3_conn.head_object(Bucket=BUCKET_NAME, Key=key)
+            return f"https://{BUCKET_NAME}.s3.{REGION}.amazonaws.com/{key}"
+        except ClientError:
+            return self.upload_bytes_to_s3(s3_conn, key, data, img_obj.mimetype or 'application/octet-stream')
     
     # 상품등록 수정 patch
     def patch_products_info(self, conn, basic_info: dict, selling_info: dict):
@@ -596,21 +1226,110 @@ class ProductService:
             params['date_of_manufacture'] = PRODUCT_INFO_NOTICE
         
         # patch products info
+        before = self.product_dao.get_products_history_columns(conn, [params['product_id']])
         self.product_dao.patch_products_info(conn, params)
+        self.product_dao.update_effective_price(conn, [params['product_id']])
 
         # history 생성
-        params['modify_account_id'] = g.account_id
-        return self.product_dao.patch_products_history(conn, params)
+        self.create_products_history(conn, before)
+
+    def create_products_history(self, conn, before: dict):
+        """수정된 상품의 history 생성
+
+        수정 전 값과 수정 후 products 값을 비교해서 바뀐 컬럼만 diff로 저장 (바뀐 컬럼이 없으면 저장하지 않음)
+        마지막 checkpoint 이후 diff가 PRODUCT_HISTORY_CHECKPOINT_INTERVAL 개 이상이면 전체 컬럼 checkpoint로 저장
+
+        Args:
+            conn (Connection): DB Connection Object
+            before (dict): 수정 전 get_products_history_columns 결과 {상품아이디: {컬럼: 값}}
+        """
+        if not before:
+            return
+
+        product_ids = list(before)
+        after = self.product_dao.get_products_history_columns(conn, product_ids)
+        diff_counts = self.product_dao.get_product_history_diff_counts(conn, product_ids)
+
+        checkpoints = list()
+        diffs = list()
+        for product_id, columns in after.items():
+            changes = make_diff(before[product_id], columns, PRODUCT_HISTORY_COLUMNS)
+
+            if not changes:
+                continue
+
+            # checkpoint가 없는 상품(diff 저장 이전 데이터)도 checkpoint 저장
+            if diff_counts.get(product_id, PRODUCT_HISTORY_CHECKPOINT_INTERVAL) >= PRODUCT_HISTORY_CHECKPOINT_INTERVAL:
+                checkpoints.append(dict(columns, product_id=product_id, modify_account_id=g.account_id))
+            else:
+                diffs.append({
+                    'product_id' : product_id,
+                    'modify_account_id' : g.account_id,
+                    'changes' : encode_changes(changes)
+                })
+
+        if checkpoints:
+            self.product_dao.create_product_history(conn, checkpoints)
+
+        if diffs:
+            self.product_dao.create_product_history_diff(conn, diffs)
+
+    def get_product_history(self, conn, params: dict):
+        """상품 수정 이력 조회
+
+        checkpoint에 이후 diff를 순서대로 적용해서 각 시점의 상품 정보를 복원
+
+        Args:
+            conn (Connection): DB Connection Object
+            params (dict): {'product_id': 상품아이디, 'at': 조회 시점 (datetime, 없으면 None)}
+
+        Raises:
+            DataNotExists: 상품이 없거나 권한이 없는 경우, at 이전 이력이 없는 경우
+
+        Returns:
+            at이 있으면 [dict]: at 시점의 {'history_id', 'modify_account_id', 'modified_at', 'product': 상품 정보}
+            없으면 [list]: 수정 순서대로 {'history_id', 'modify_account_id', 'modified_at', 'changes': 바뀐 컬럼, 'product': 상품 정보}
+        """
+        if not self.product_dao.check_product_exists(conn, [params]):
+            raise DataNotExists('상품이 존재하지 않거나 권한이 없습니다.')
+
+        rows = self.product_dao.get_product_history(conn, params)
+
+        history = list()
+        for row, state, changes in apply_history(rows, PRODUCT_HISTORY_COLUMNS):
+            history.append({
+                'history_id' : row['history_id'],
+                'modify_account_id' : row['modify_account_id'],
+                'modified_at' : row['created_at'],
+                'changes' : changes,
+                'product' : state
+            })
+
+        if params.get('at') is None:
+            return history
+
+        if not history:
+            raise DataNotExists('해당 시점의 상품 이력이 없습니다.')
+
+        result = history[-1]
+        del result['changes']
+        return result
     
 
     def patch_option_info(self, conn, product_id: int, option_info: list):
-        # 기존 DB에 존재하는 option list
-        exist_options = self.product_dao.get_options_by_product_id(conn, product_id)
-        
-        request_options = copy.deepcopy(option_info)
-        
+        """옵션 상품 수정
+
+        요청 옵션과 기존 옵션을 option_id 기준으로 비교해서
+        수정/추가 옵션은 한 번의 upsert, 요청에 없는 기존 옵션은 한 번의 삭제,
+        변경 이력은 한 번의 history insert로 저장
+
+        Args:
+            conn (Connection): DB Connection Object
+            product_id (int): 수정할 상품의 id
+            option_info (list): 옵션 상품 리스트, 기존 옵션은 option_id 포함
+        """
         # validate
-        for request_option in request_options:
+        for request_option in option_info:
 
             # 필수 입력값 validate
             validate_integer(request_option['price'])
@@ -624,88 +1343,106 @@ class ProductService:
             
             if 'size_id' in request_option:
                 validate_integer(request_option['size_id'])
-        
-
-        # 들어온 요청(request_options)과 기존에 존재하는 option(exist_options)과 option_id 유무로 비교 후
-        # 존재하면 request_option을 update_data 배열에 추가
-        update_data = list()
-        for exist_option in exist_options:
-            for request_option in request_options:
-
-                if 'option_id' in request_option:
-                    if request_option['option_id'] == exist_option['option_id']:
-                        update_data.append(request_option)
-                        # update_data에 request_option 입력 후 request_options에서 삭제
-                        # 비교대상인 exist_option도 exist_options에서 삭제
-                        request_options.remove(request_option)
-                        exist_options.remove(exist_option)
-                        break
 
+        # 기존 DB에 존재하는 option {option_id: option}
+        exist_options = {
+            option['option_id']: option for option in self.product_dao.get_options_by_product_id(conn, product_id)
+        }
 
-        # 기존에 존재하면서 업데이트된 options
-        # 선택 입력값 setting
-        for data in update_data:
-            data['color_id'] = data.get('color_id', None)
-            data['size_id'] = data.get('size_id', None)
-            data['stock'] = data.get('stock', None)
+        # 수정할 option과 새로 등록할 option
+        # 해당 상품의 option_id가 아니면 새 option으로 등록
+        upsert_options = list()
+        new_options = list()
+        for request_option in option_info:
+            exist_option = exist_options.pop(request_option.get('option_id'), None)
+
+            option = {
+                'id' : exist_option['option_id'] if exist_option else None,
+                'product_id' : product_id,
+                'color_id' : request_option.get('color_id', None),
+                'size_id' : request_option.get('size_id', None),
+                'price' : request_option['price'],
+                'stock' : request_option.get('stock', None)
+            }
+            
+            if exist_option:
+                option['option_code'] = exist_option['option_code']
+            else:
+                option['option_code'] = generate_code()
+                new_options.append(option)
+            
+            upsert_options.append(option)
         
-        # 해당 option update
-        self.product_dao.update_option_info(conn, update_data)
-
-        # 업데이트한 내용 history 생성
-        for data in update_data:
-            data['modify_account_id'] = g.account_id
-        self.product_dao.update_option_history(conn, update_data)
+        # 요청에 없는 기존 option은 삭제
+        delete_options = list(exist_options.values())
+
+        if upsert_options:
+            self.product_dao.upsert_option_info(conn, upsert_options)
+
+        # 새로 등록한 option의 id 조회
+        if new_options:
+            option_ids = self.product_dao.get_option_ids_by_option_codes(conn, [option['option_code'] for option in new_options])
+            for option in new_options:
+                option['id'] = option_ids[option['option_code']]
+
+        if delete_options:
+            self.product_dao.delete_option_info(conn, list(exist_options))
+
+        # 수정, 등록, 삭제 history 한 번에 생성
+        history = [
+            {
+                'option_id' : option['id'],
+                'price' : option['price'],
+                'modify_account_id' : g.account_id,
+                'is_deleted' : 0
+            }
+            for option in upsert_options
+        ] + [
+            {
+                'option_id' : option['option_id'],
+                'price' : option['price'],
+                'modify_account_id' : g.account_id,
+                'is_deleted' : 1
+            }
+            for option in delete_options
+        ]
 
+        if history:
+            self.product_dao.create_option_history(conn, history)
 
-        # 새로 들어온 options
-        # 선택 입력값 setting
-        for request_option in request_options:
 
-            option_code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=25))
-            request_option['option_code'] = option_code
-            request_option['product_id'] = product_id
-            request_option['color_id'] = request_option.get('color_id', None)
-            request_option['size_id'] = request_option.get('size_id', None)
-            request_option['stock'] = request_option.get('stock', None)
-        
-        
-        # 새로 insert후 option의 id값들 list형태로 반환
-        option_ids = self.product_dao.create_option_info_dao(conn, request_options)
+    def update_image_url(self, conn, product_id: int, imgs_obj: list, account_id: int = None): 
+        if account_id is None:
+            account_id = g.account_id
 
-        # history에 insert할 데이터에 새로 insert한 option의 id값 입력
-        option_length = len(request_options)
-        for i in range(option_length):
-            request_options[i]['option_id'] = option_ids[i]
-            request_options[i]['modify_account_id'] = g.account_id
-            request_options[i]['is_deleted'] = 0
-        
-        # insert된 내용에 대한 history 생성
-        self.product_dao.create_option_history(conn, request_options)
+        # 이미 저장된 이미지는 s3에 다시 업로드하지 않음, 기존 row를 수정하기 전에 업로드
+        self.replace_images(conn, product_id, self.upload_images(conn, imgs_obj), account_id)
 
+    def replace_images(self, conn, product_id: int, stored_images: list, account_id: int):
+        """상품의 이미지를 upload_images 결과로 교체
 
-        # 삭제된 options
-        # 지울 데이터 is_deleted = 1 설정
-        self.product_dao.delete_option_info(conn, exist_options)
+        Args:
+            conn (Connection): DB Connection Object
+            product_id (int): 상품 id
+            stored_images (list): upload_images 결과, 첫 번째 이미지가 대표 이미지
+            account_id (int): 수정한 계정 id
+        """
+        # 요청 이미지가 기존 이미지와 순서까지 같으면 기존 row를 그대로 사용
+        exist_images = self.product_dao.get_product_images(conn, product_id)
 
-        # 지운 데이터 설정에 대한 history에 입력할 account_id setting
-        for exist_option in exist_options:
-            exist_option['modify_account_id'] = g.account_id
-        
-        # 지운 데이터 관련 history 생성
-        self.product_dao.delete_option_history(conn, exist_options)
+        if [image['content_hash'] for image in stored_images] == [image['content_hash'] for image in exist_images]:
+            return
 
+        # 바뀌었으면 product_id에 해당되는 값은 모두 is_deleted = 1로 하고 다 새롭게 insert해야 함
+        image_params = self.make_stored_image_params(product_id, stored_images, account_id)
 
-    def update_image_url(self, conn, product_id: int, imgs_obj: list): 
-        # patch하면 product_id에 해당되는 값은 모두 is_deleted = 1로 하고 다 새롭게 insert해야 함
-        
         # 기존의 db내용 deleted_account_id, deleted_at, is_deleted 세팅
         params = dict()
         params['product_id'] = product_id
-        params['deleted_account_id'] = g.account_id
+        params['deleted_account_id'] = account_id
         params['deleted_at'] = datetime.now()
         params['is_deleted'] = 1
         self.product_dao.delete_images_in_product_images(conn, params)
         
         # img urls를 product_images에 insert
-        self.insert_image_url(conn, product_id, imgs_obj)
+        self.product_dao.insert_image_url_dao(conn, image_params)
@@ -0,0 +1,48 @@
+from admin.model import VersionDao
+from utils.constant import PRODUCTS_VERSION, ORDERS_VERSION, SELLERS_VERSION
+
+
+class VersionService:
+    """목록, 상세 응답 ETag에 사용하는 테이블 version 관리
+
+    상품, 주문, 셀러를 수정하는 서비스는 같은 transaction 안에서 bump_* 를 호출합니다.
+    수정된 데이터를 가진 셀러 계정의 version만 올리고, 테이블 전체 version(마스터 계정 조회)은
+    모든 셀러 version의 합으로 계산하므로 서로 다른 셀러의 수정이 같은 row의 lock을 기다리지 않습니다.
+    version row는 commit 까지 lock이 유지되므로 수정 작업의 마지막(commit 직전)에 호출합니다.
+    store 주문처럼 admin 밖에서 입력되는 주문은 orders_detail trigger가 주문 version을 올립니다.
+    """
+    def __new__(cls, *args, **kwargs):
+        if not hasattr(cls, '_instance'):
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        self.version_dao = VersionDao()
+
+    def get_versions(self, conn, table_names: tuple, scope_id: int):
+        """table_names 순서의 version tuple (한 번도 수정되지 않은 테이블은 0)"""
+        versions = self.version_dao.get_versions(conn, {'table_names': table_names, 'scope_id': scope_id})
+        return tuple(versions.get(table_name, 0) for table_name in table_names)
+
+    def bump(self, conn, table_name: str, scope_ids: list):
+        scope_ids = sorted(set(scope_ids))
+        if not scope_ids:
+            return
+
+        self.version_dao.bump_versions(conn, [{'table_name': table_name, 'scope_id': scope_id} for scope_id in scope_ids])
+
+    def bump_products(self, conn, product_ids: list):
+        if product_ids:
+            self.bump(conn, PRODUCTS_VERSION, self.version_dao.get_product_scopes(conn, product_ids))
+
+    def bump_all_products(self, conn):
+        """어떤 상품이 수정됐는지 모를 때 (discount scheduler 시작 시 일괄 갱신 등)"""
+        self.version_dao.bump_table_versions(conn, {'table_name': PRODUCTS_VERSION})
+
+    def bump_orders(self, conn, orders_detail_ids: list):
+        if orders_detail_ids:
+            self.bump(conn, ORDERS_VERSION, self.version_dao.get_order_scopes(conn, orders_detail_ids))
+
+    def bump_sellers(self, conn, seller_ids: list):
+        if seller_ids:
+            self.bump(conn, SELLERS_VERSION, self.version_dao.get_seller_scopes(conn, seller_ids))
@@ -1,6 +1,13 @@
 from admin.view.product_view import (
                             ProductView, 
+                            ProductBulkView,
+                            ProductImportView,
+                            ProductImportJobView,
+                            ProductImportErrorFileView,
                             ProductDetailView, 
+                            ProductDetailCacheStatsView,
+                            ProductImageUploadIntentView,
+                            ProductHistoryView,
                             ProductSubCategoryView,
                             ProductSellerView,
                             ProductSellerSearchView,
@@ -30,6 +37,7 @@ def create_endpoints(app, services):
     product_service = services.product_service
     order_service = services.order_service
     account_service = services.account_service
+    product_import_service = services.product_import_service
 
 
     # product
@@ -37,10 +45,38 @@ def create_endpoints(app, services):
                     view_func=ProductView.as_view('product_view', product_service), 
                     methods=['GET', 'POST', 'PATCH'])
 
+    app.add_url_rule("/products/bulk",
+                    view_func=ProductBulkView.as_view('product_bulk_view', product_service),
+                    methods=['POST'])
+
+    app.add_url_rule("/products/import",
+                    view_func=ProductImportView.as_view('product_import_view', product_import_service),
+                    methods=['POST'])
+
+    app.add_url_rule("/products/import/<int:job_id>",
+                    view_func=ProductImportJobView.as_view('product_import_job_view', product_import_service),
+                    methods=['GET'])
+
+    app.add_url_rule("/products/import/<int:job_id>/errors",
+                    view_func=ProductImportErrorFileView.as_view('product_import_error_file_view', product_import_service),
+                    methods=['GET'])
+
     app.add_url_rule("/products/<product_code>", 
                     view_func=ProductDetailView.as_view('product_detail_view', product_service), 
                     methods=['GET', 'PATCH'])
 
+    app.add_url_rule("/products/image/upload-intent",
+                    view_func=ProductImageUploadIntentView.as_view('product_image_upload_intent_view', product_service),
+                    methods=['POST'])
+
+    app.add_url_rule("/products/<int:product_id>/history",
+                    view_func=ProductHistoryView.as_view('product_history_view', product_service),
+                    methods=['GET'])
+
+    app.add_url_rule("/products/cache/stats",
+                    view_func=ProductDetailCacheStatsView.as_view('product_detail_cache_stats_view', product_service),
+                    methods=['GET'])
+
     app.add_url_rule("/products/seller", 
                     view_func=ProductSellerSearchView.as_view('product_seller_search_view', product_service), 
                     methods=['GET'])
@@ -8,7 +8,8 @@ from flask_request_validator.exceptions import InvalidRequestError, InvalidHeade
 
 from utils.custom_exception import DatabaseCloseFail
 from utils.response import post_response, get_response
-from utils.decorator import LoginRequired
+from utils.decorator import LoginRequired, ConditionalGet
+from utils.constant import SELLERS_VERSION
 from connection import get_connection
 from utils.decorator import LoginRequired
 
@@ -97,6 +98,7 @@ class SellerListView(MethodView):
         self.service=service
 
     @LoginRequired("seller")
+    @ConditionalGet(SELLERS_VERSION)
     @validate_params(
         Param('Content-Type', HEADER, str, required=False),
         Param('id', GET, int, required=False),
@@ -111,11 +113,14 @@ class SellerListView(MethodView):
         Param('start_date', GET, str, required=False),
         Param('end_date', GET, str, required=False),
         Param('page', GET, int, required=False, default=1, rules=[Min(1)]),
-        Param('limit', GET, int, required=False, default=10, rules=[Enum(10, 20, 50)])
+        Param('limit', GET, int, required=False, default=10, rules=[Enum(10, 20, 50)]),
+        Param('fields', GET, str, required=False)
     )
     def get(self, valid):
         """셀러 계정 리스트 조회
 
+        fields(예: fields=seller_id,seller_status_type)로 출력할 항목만 조회 가능
+
         Args:
             valid (ValidRequest): parameter로 들어온 값
 
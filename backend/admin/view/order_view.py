@@ -1,11 +1,13 @@
 from utils.response import error_response, get_response, post_response, post_response_with_return
 from flask import request, jsonify, g
 from flask.views import MethodView
-from flask_request_validator import validate_params, Param, GET, ValidRequest, JsonParam, Min, Enum, Datetime
+from flask_request_validator import validate_params, Param, GET, HEADER, ValidRequest, JsonParam, Min, Enum, Datetime
 from connection import get_connection
-from utils.response import error_response, get_response, post_response, post_response_with_return
+from utils.response import error_response, get_response, post_response, post_response_with_return, file_response
 from utils.custom_exception import DataNotExists, StartDateFail
-from utils.decorator import LoginRequired
+from utils.decorator import LoginRequired, ConditionalGet
+from utils.constant import ORDERS_VERSION, PRODUCTS_VERSION, SELLERS_VERSION
+from datetime import datetime
 
 from utils.custom_exception import DataNotExists, StartDateFail
 
@@ -18,42 +20,84 @@ class OrderListView(MethodView):
     @validate_params(
         Param('start_date', GET, str, rules=[Datetime('%Y-%m-%d')], required=True),
         Param('end_date', GET, str, rules=[Datetime('%Y-%m-%d')], required=True),
-        Param('sub_property_id', GET, int, required=False),
-        Param('order_number', GET, str, required=False),
-        Param('order_status_type_id', GET, int, required=True),
-        Param('order_detail_number', GET, str, required=False),
+        Param('sub_property_id', GET, list, required=False),
+        Param('order_number', GET, list, required=False),
+        Param('order_status_type_id', GET, list, required=True),
+        Param('order_detail_number', GET, list, required=False),
         Param('order_username', GET, str, required=False),
         Param('orderer_phone', GET, str, required=False),
-        Param('seller_name', GET, str, required=False),
+        Param('seller_name', GET, list, required=False),
         Param('product_name', GET, str, required=False),
         Param('page', GET, int, required=False, default=1, rules=[Min(1)]),
-        Param('limit', GET, int, required=False, default=10, rules=[Enum(10, 20, 50)])
+        Param('limit', GET, int, required=False, default=10, rules=[Enum(10, 20, 50)]),
+        Param('fields', GET, str, required=False),
+        Param('group_counts', GET, str, required=False, rules=[Enum('status')]),
+        Param('Content-Type', HEADER, str, required=False)
     )
     def get(self, valid):
         """주문 조회 리스트
 
         어드민 페이지의 주문관리 페이지에서 필터 조건에 맞는 주문 리스트 출력
+        fields(예: fields=orders_detail_id,order_status_type)로 출력할 항목만 조회 가능
+        주문 상태, 셀러 속성, 셀러명, 주문 번호, 주문 상세 번호는 여러 값 검색 가능 (order_status_type_id=1,2 또는 order_status_type_id=1&order_status_type_id=2)
+        group_counts=status 이면 같은 검색 조건의 주문 상태별 개수(status_counts)를 함께 반환
+        HEADERS의 Content-Type이 application/vnd.ms-excel 이면 xlsx, text/csv 이면 csv 파일로 같은 검색 조건의 전체 주문을 내려받음
+        (page, limit 없이 DB에서 읽는 대로 전송, 조건부 GET(ETag) 없이 항상 전송)
+        셀러 계정은 자신의 상품 주문만 조회, 마스터 계정은 전체 조회
 
         Args:
             valid (ValidRequest): validate_params 데코레이터로 전달된 값
             
         Returns:
             order_list_result (dict): 결제일자, 주문번호, 주문상세번호, 상품명, 주문상태 등 주문 조회 리스트 관련 정보
-            200: 주문 조회 리스트 가져오기 성공
+            200: 주문 조회 리스트 가져오기 성공 또는 주문 리스트 파일 stream
             500: Exception
                 KeyError - query parameter로 잘못된 key값이 들어올 경우에 발생하는 에러
         """
+        params = valid.get_params()
+        headers = valid.get_headers()
+
+        # HEADERS로 엑셀(xlsx), csv 파일 요청
+        if 'application/vnd.ms-excel' in headers.values() or 'text/csv' in headers.values():
+            file_type = 'xlsx' if 'application/vnd.ms-excel' in headers.values() else 'csv'
+            return self.export_order_list(params, file_type)
+
+        return self.get_order_list(params)
+
+    @ConditionalGet(ORDERS_VERSION, PRODUCTS_VERSION, SELLERS_VERSION, per_seller=True)
+    def get_order_list(self, params):
+        """주문 조회 리스트 (JSON), 주문, 상품, 셀러 version이 같으면 304"""
         conn = None
         try:
-            params = valid.get_params()
-            conn = get_connection()   
-            
+            conn = get_connection()
             order_list_result = self.service.get_order_list(conn, params)
-         
+
             return get_response(order_list_result), 200
-        
+
         finally:
-            conn.close()
+            if conn:
+                conn.close()
+
+    def export_order_list(self, params, file_type):
+        """주문 리스트 파일(xlsx, csv) stream, 파일 전송이 끝나면 file_response가 conn을 닫음"""
+        conn = None
+        try:
+            conn = get_connection()
+            today = datetime.today().strftime('%Y-%m-%d')
+            chunks = self.service.export_order_list(conn, params, file_type)
+
+            response = file_response(
+                chunks,
+                f'{today}order_list.{file_type}',
+                'text/csv' if file_type == 'csv' else 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                conn
+            )
+            conn = None
+            return response
+
+        finally:
+            if conn:
+                conn.close()
     
     # order_status_type 변경
     # LoginRequired의 경우 user가 아닌 경우를 구별하기 위함이므로 master도 포함일 때는 seller로 작성해도 무관
@@ -94,6 +138,7 @@ class OrderView(MethodView):
         self.service = service 
 
     @LoginRequired("seller")
+    @ConditionalGet(ORDERS_VERSION, PRODUCTS_VERSION, SELLERS_VERSION, per_seller=True)
     def get(self, order_detail_number):
         """주문 상세 뷰
 
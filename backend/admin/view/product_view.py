@@ -7,8 +7,8 @@ from flask.views import MethodView
 from flask_request_validator import validate_params, Param, GET, Datetime, ValidRequest, CompositeRule, Min, Max, Enum, JsonParam, JSON, HEADER, PATH
 from flask_request_validator.exceptions import InvalidRequestError, RulesError
 
-from utils.response import get_response, post_response, post_response_with_return, post_response_success
-from utils.decorator import LoginRequired
+from utils.response import get_response, post_response, post_response_with_return, post_response_success, file_response
+from utils.decorator import LoginRequired, ConditionalGet
 from utils.custom_exception import (
                                         IsInt, 
                                         IsStr, 
@@ -20,8 +20,13 @@ from utils.custom_exception import (
                                         DatabaseRollBackError,
                                         SellerBrandNameDoesNotExist,
                                         UploadFailtoS3,
-                                        DataCannotBeConverted
+                                        DataCannotBeConverted,
+                                        TooMuchDataRequests,
+                                        DuplicateFileName,
+                                        CustomUserError
 )
+from utils.constant import BULK_PRODUCT_MAX_COUNT, BULK_PRODUCT_CHUNK_SIZE, PRODUCTS_VERSION, SELLERS_VERSION
+from utils.validation import check_product_required_data
 
 from connection import get_connection
 
@@ -46,9 +51,14 @@ class ProductView(MethodView):
         Param('limit', GET, int, required=False, default=10, rules=[Enum(10, 20, 50)]),
         Param('start_date', GET, str, rules=[Datetime('%Y-%m-%d')], required=False),
         Param('end_date', GET, str, rules=[Datetime('%Y-%m-%d')], required=False),
-        Param('select_product_id', GET, list, required=False)
+        Param('select_product_id', GET, list, required=False),
+        Param('min_price', GET, int, required=False, rules=[Min(0)]),
+        Param('max_price', GET, int, required=False, rules=[Min(0)]),
+        Param('sort', GET, str, required=False, default='latest', rules=[Enum('latest', 'price_asc', 'price_desc')]),
+        Param('fields', GET, str, required=False)
     )
     @LoginRequired('seller')
+    @ConditionalGet(PRODUCTS_VERSION, SELLERS_VERSION, per_seller=True)
     def get(self, valid: ValidRequest):
         """상품 조회 리스트
 
@@ -56,7 +66,8 @@ class ProductView(MethodView):
 
         Args:
             conn (pymysql.connections.Connection): DB 커넥션 객체
-            params (dict): 상품번호, 상품명, 상품코드, 판매여부, 진열여부 등의 정보가 담긴 딕셔너리
+            params (dict): 상품번호, 상품명, 상품코드, 판매여부, 진열여부, 할인가 범위(min_price, max_price),
+                정렬(sort: latest, price_asc, price_desc), 출력할 항목(fields: 콤마로 구분, 없으면 전체) 등의 정보가 담긴 딕셔너리
 
         Returns:
             {
@@ -114,6 +125,8 @@ class ProductView(MethodView):
 
         상품 등록 페이지에서 들어오는 정보를 받고 DB에 입력한다.
 
+        이미지는 multipart 파일(file) 또는 presigned url로 업로드한 s3 key(JSON body의 image_keys)로 받는다.
+
         Raises:
             RequiredDataError: 필수 데이터가 없을 시 발생하는 에러
             DatabaseCloseFail: 데이터베이스와 연결을 끊을 때 발생하는 에러
@@ -124,68 +137,43 @@ class ProductView(MethodView):
         """
         conn = None
         try:
-            imgs_obj = request.files.getlist('file')
-            payload = request.form.get('payload')
-            body = json.loads(payload)
-
-            if not imgs_obj:
-                raise RequiredDataError('상품 이미지를 입력하세요.') 
-
-            if 'basic_info' not in body:
-                raise RequiredDataError('상품 기본 정보를 입력하세요.')
-
-            if 'selling_info' not in body:
-                raise RequiredDataError('상품 판매 정보를 입력하세요.')
-            
-            basic_info = body['basic_info']
-            selling_info = body['selling_info']
-            option_info = body.get('option_info', None)
-
-            # 필수 입력값 확인
-            if 'seller_id' not in basic_info:
-                raise RequiredDataError('판매자 정보를 입력하세요.')
-
-            if 'is_selling' not in basic_info:
-                raise RequiredDataError('판매여부를 선택하세요.')
-
-            if 'is_displayed' not in basic_info:
-                raise RequiredDataError('진열여부를 선택하세요.')
-
-            if 'property_id' not in basic_info:
-                raise RequiredDataError('판매자 속성을 선택하세요.')
-
-            if 'category_id' not in basic_info:
-                raise RequiredDataError('1차 카테고리를 선택하세요.')
-
-            if 'sub_category_id' not in basic_info:
-                raise RequiredDataError('2차 카테고리를 선택하세요.')
-
-            if 'title' not in basic_info:
-                raise RequiredDataError('상품명을 입력하세요.')
+            # presigned url로 이미지를 직접 업로드한 경우 JSON body의 image_keys로 전달
+            if request.is_json:
+                body = request.get_json()
+                imgs_obj = None
+            else:
+                imgs_obj = request.files.getlist('file')
+                payload = request.form.get('payload')
+                body = json.loads(payload)
 
-            if 'content' not in basic_info:
-                raise RequiredDataError('상품 상세 정보를 입력하세요.')
+                if not imgs_obj:
+                    raise RequiredDataError('상품 이미지를 입력하세요.') 
 
-            if 'price' not in selling_info:
-                raise RequiredDataError('상품 가격을 입력하세요.')
+            basic_info, selling_info, option_info = check_product_required_data(body)
 
             conn = get_connection()
 
+            # s3 작업은 DB 수정 전에 처리 (파일은 저장된 적 없는 이미지만 업로드 경로에 올리고, key는 업로드 여부 확인)
+            if imgs_obj:
+                images = self.service.stage_images(conn, imgs_obj)
+            else:
+                images = self.service.check_uploaded_images(body.get('image_keys'))
+
             # products 테이블에 정보 입력
             product_id = self.service.create_product_info(conn, basic_info, selling_info)
 
             # 옵션이 존재하면 options 테이블에 정보 입력
             if option_info:
-
-                for option in option_info:
-
-                    if 'price' not in option:
-                        raise RequiredDataError('옵션 상품 가격을 입력하세요.')
-
                 self.service.create_option_info(conn, product_id, option_info)
             
-            # s3에 상품 이미지 파일 업로드
-            self.service.insert_image_url(conn, product_id, imgs_obj)
+            # 업로드한 원본 이미지로 먼저 등록 (commit 후 바로 리스트, 상세에서 조회됨)
+            self.service.create_staged_images(conn, product_id, images)
+
+            # 이미지 변환, 저장은 commit 후 worker에서 실행 (원본 이미지 row를 변환 이미지로 교체)
+            self.service.enqueue_product_images(conn, product_id, images, replace=True)
+
+            # 상품 version은 commit 직전에 올림 (셀러 version row lock을 짧게 유지)
+            self.service.bump_product_version(conn, product_id)
             
             conn.commit()
 
@@ -239,12 +227,229 @@ class ProductView(MethodView):
             except Exception as e:
                 raise DatabaseCloseFail('알 수 없는 오류가 발생했습니다.')
 
+class ProductBulkView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    # 상품 일괄 등록
+    @LoginRequired('seller')
+    def post(self):
+        """상품 일괄 등록
+
+        payload로 여러 상품 정보를 받아 모두 validate 한 후, BULK_PRODUCT_CHUNK_SIZE 개씩 트랜잭션을 나눠 등록한다.
+        각 상품은 images에 함께 업로드한 file의 파일명을 대표 이미지부터 순서대로 입력한다.
+
+            payload = {
+                "products": [
+                    {
+                        "basic_info": {...},
+                        "selling_info": {...},
+                        "option_info": [...],
+                        "images": ["파일명1", "파일명2"]
+                    },
+                    ...
+                ]
+            }
+
+        Raises:
+            RequiredDataError: 상품 목록이 없을 시 발생하는 에러
+            TooMuchDataRequests: 한 번에 등록할 수 있는 상품 수를 넘은 경우
+            DatabaseCloseFail: 데이터베이스와 연결을 끊을 때 발생하는 에러
+
+        Returns:
+            200, {'success': [{'index', 'product_id', 'product_code'}], 'fail': [{'index', 'message'}]}
+                index는 요청한 products에서의 순서
+        """
+        conn = None
+        try:
+            payload = request.form.get('payload')
+            body = json.loads(payload) if payload else dict()
+            products = body.get('products')
+
+            if not products:
+                raise RequiredDataError('등록할 상품 정보를 입력하세요.')
+
+            if len(products) > BULK_PRODUCT_MAX_COUNT:
+                raise TooMuchDataRequests(f'한 번에 {BULK_PRODUCT_MAX_COUNT}개까지 등록할 수 있습니다.')
+
+            # 상품의 images는 파일명으로 파일을 찾으므로 같은 파일명은 받지 않음
+            files = dict()
+            for img_obj in request.files.getlist('file'):
+                if img_obj.filename in files:
+                    raise DuplicateFileName(f'같은 이름의 파일이 있습니다: {img_obj.filename}')
+                files[img_obj.filename] = img_obj
+
+            success = list()
+            fail = list()
+
+            # 전체 상품 validate
+            valid_products = list()
+            for index, product in enumerate(products):
+                try:
+                    basic_info, selling_info, option_info = check_product_required_data(product)
+
+                    image_names = product.get('images')
+                    if not image_names:
+                        raise RequiredDataError('상품 이미지를 입력하세요.')
+
+                    if any(name not in files for name in image_names):
+                        raise RequiredDataError('업로드하지 않은 상품 이미지입니다.')
+
+                    valid_product = self.service.make_bulk_product_params(basic_info, selling_info, option_info)
+                    valid_product['index'] = index
+                    valid_product['image_names'] = image_names
+                    valid_products.append(valid_product)
+
+                except CustomUserError as e:
+                    fail.append({'index': index, 'message': e.error_message})
+
+            if valid_products:
+                conn = get_connection()
+
+                # s3 업로드는 DB 입력 전에 한 번에 실행 (업로드 중에 입력한 row의 lock을 잡고 있지 않도록)
+                used_names = list(dict.fromkeys(name for product in valid_products for name in product['image_names']))
+                stored_images = dict(zip(used_names, self.service.upload_images(conn, [files[name] for name in used_names])))
+                for product in valid_products:
+                    product['stored_images'] = [stored_images[name] for name in product.pop('image_names')]
+
+            # 묶음 단위로 등록, 실패한 묶음만 rollback
+
+            for start in range(0, len(valid_products), BULK_PRODUCT_CHUNK_SIZE):
+                chunk = valid_products[start:start + BULK_PRODUCT_CHUNK_SIZE]
+                try:
+                    results = self.service.create_products_bulk(conn, chunk)
+                    conn.commit()
+
+                except Exception as e:
+                    conn.rollback()
+                    message = e.error_message if isinstance(e, CustomUserError) else '상품 등록에 실패했습니다.'
+                    fail.extend({'index': product['index'], 'message': message} for product in chunk)
+                    continue
+
+                success.extend(
+                    {'index': product['index'], **result} for product, result in zip(chunk, results)
+                )
+
+            fail.sort(key=lambda item: item['index'])
+
+            return post_response({'success': success, 'fail': fail})
+
+        except ValueError:
+            raise DataCannotBeConverted('입력값의 총 형식이 잘못되어 읽어들일 수 없습니다.', None)
+
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except Exception:
+                    raise DatabaseCloseFail('알 수 없는 오류가 발생했습니다.')
+
+
+class ProductImportView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    # 상품 파일 import
+    @LoginRequired('seller')
+    def post(self):
+        """상품 파일(csv, xlsx) import
+
+        업로드된 파일로 import 작업을 생성하고, worker(admin/worker.py)가 등록을 실행한다.
+        진행 상태는 GET /products/import/<job_id>, 실패한 행은 GET /products/import/<job_id>/errors 로 확인
+
+        Returns:
+            200, {'job_id': 작업 id}
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            job_id = self.service.create_import_job(conn, request.files.get('file'))
+            conn.commit()
+
+            return post_response({'job_id': job_id})
+
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            raise e
+
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except Exception:
+                    raise DatabaseCloseFail('알 수 없는 오류가 발생했습니다.')
+
+
+class ProductImportJobView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    # 상품 파일 import 진행 상태
+    @LoginRequired('seller')
+    @validate_params(
+        Param('job_id', PATH, int)
+    )
+    def get(self, valid: ValidRequest, job_id):
+        """상품 파일 import 진행 상태 조회
+
+        Returns:
+            [dict]: {
+                'job_id', 'filename', 'status' (PENDING, RUNNING, DONE, FAILED),
+                'total_rows', 'processed_rows', 'progress' (%), 'success_count' (상품 수), 'fail_count' (행 수),
+                'has_error_file', 'error_message', 'created_at', 'finished_at'
+            }
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            result = self.service.get_import_job(conn, valid.get_path_params())
+            return get_response(result)
+
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except Exception:
+                    raise DatabaseCloseFail('알 수 없는 오류가 발생했습니다.')
+
+
+class ProductImportErrorFileView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    # 상품 파일 import 오류 파일 다운로드
+    @LoginRequired('seller')
+    @validate_params(
+        Param('job_id', PATH, int)
+    )
+    def get(self, valid: ValidRequest, job_id):
+        """실패한 행의 원본 값과 오류 내용을 csv 파일로 다운로드 (수정 후 그대로 다시 import 가능)"""
+        conn = None
+        try:
+            conn = get_connection()
+            chunks = self.service.get_import_error_file(conn, valid.get_path_params())
+
+            # 파일 전송이 끝나면 file_response가 conn을 닫음
+            response = file_response(chunks, f'product_import_{job_id}_errors.csv', 'text/csv', conn)
+            conn = None
+            return response
+
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except Exception:
+                    raise DatabaseCloseFail('알 수 없는 오류가 발생했습니다.')
+
+
 class ProductDetailView(MethodView):
     def __init__(self, service):
         self.service = service
 
     # 상품 상세 가져오기
     @LoginRequired('seller')
+    @ConditionalGet(PRODUCTS_VERSION, SELLERS_VERSION, per_seller=True)
     @validate_params(
         Param('product_code', PATH, str)
     )
@@ -282,12 +487,17 @@ class ProductDetailView(MethodView):
     def patch(self, product_code: str):
         conn = None
         try:
-            imgs_obj = request.files.getlist('file')
-            payload = request.form.get('payload')
-            body = literal_eval(payload)
+            # presigned url로 이미지를 직접 업로드한 경우 JSON body의 image_keys로 전달
+            if request.is_json:
+                body = request.get_json()
+                imgs_obj = None
+            else:
+                imgs_obj = request.files.getlist('file')
+                payload = request.form.get('payload')
+                body = literal_eval(payload)
             
-            if not imgs_obj:
-                raise RequiredDataError('상품 이미지를 입력하세요.') 
+                if not imgs_obj:
+                    raise RequiredDataError('상품 이미지를 입력하세요.') 
 
             if 'basic_info' not in body:
                 raise RequiredDataError('상품 기본 정보를 입력하세요.')
@@ -333,6 +543,12 @@ class ProductDetailView(MethodView):
             product_id = basic_info['product_id']
 
             conn = get_connection()
+
+            # s3 작업은 DB 수정 전에 처리 (파일은 저장된 적 없는 이미지만 업로드 경로에 올리고, key는 업로드 여부 확인)
+            if imgs_obj:
+                images = self.service.stage_images(conn, imgs_obj)
+            else:
+                images = self.service.check_uploaded_images(body.get('image_keys'))
             
             self.service.patch_products_info(conn, basic_info, selling_info)
 
@@ -345,18 +561,100 @@ class ProductDetailView(MethodView):
                 
                 self.service.patch_option_info(conn, product_id, option_info)
             
-            # s3에 이미지 업로드
-            self.service.update_image_url(conn, product_id, imgs_obj)
+            # 이미지 변환, 교체는 commit 후 worker에서 실행
+            self.service.enqueue_product_images(conn, product_id, images, replace=True)
+
+            # 상품 version은 commit 직전에 올림 (셀러 version row lock을 짧게 유지)
+            self.service.bump_product_version(conn, product_id)
 
             conn.commit()
             
             return post_response_success('상품 수정을 완료하였습니다.')
         
         finally:
-            try:
-                conn.close()
-            except Exception:
-                raise DatabaseCloseFail('알 수 없는 오류가 발생했습니다.')
+            if conn:
+                try:
+                    conn.close()
+                except Exception:
+                    raise DatabaseCloseFail('알 수 없는 오류가 발생했습니다.')
+
+
+class ProductImageUploadIntentView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    # 상품 이미지 직접 업로드용 presigned url 발급
+    @LoginRequired('seller')
+    def post(self):
+        """상품 이미지 업로드 url 발급
+
+        클라이언트는 받은 upload_url에 headers를 포함해서 이미지를 PUT으로 직접 업로드하고,
+        상품 등록/수정 요청의 image_keys에 key를 순서대로 담아 보낸다.
+
+        Args:
+            files (list): [{'filename': 파일명, 'content_type': 이미지 MIME type}, ...]
+
+        Returns:
+            [list]: [{'key': s3 key, 'upload_url': PUT url, 'headers': 요청 header, 'expires_in': 유효 시간(초)}, ...]
+        """
+        body = request.get_json(silent=True) or dict()
+        result = self.service.create_image_upload_intents(body.get('files'))
+        return get_response(result)
+
+
+class ProductHistoryView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    # 상품 수정 이력 조회
+    @LoginRequired('seller')
+    @validate_params(
+        Param('product_id', PATH, int),
+        Param('at', GET, str, rules=[Datetime('%Y-%m-%d %H:%M:%S')], required=False)
+    )
+    def get(self, valid: ValidRequest, product_id):
+        """상품 수정 이력 조회
+
+        Args:
+            product_id (int): 상품아이디
+            at (str): 조회 시점 (%Y-%m-%d %H:%M:%S), 있으면 그 시점의 상품 정보만 반환
+
+        Returns:
+            [list]: 수정 순서대로 {'history_id', 'modify_account_id', 'modified_at', 'changes': 바뀐 컬럼, 'product': 상품 정보}
+            [dict]: at이 있으면 at 시점의 {'history_id', 'modify_account_id', 'modified_at', 'product': 상품 정보}
+        """
+        conn = None
+        try:
+            params = valid.get_path_params()
+            at = valid.get_params().get('at')
+            params['at'] = datetime.strptime(at, '%Y-%m-%d %H:%M:%S') if at else None
+
+            conn = get_connection()
+            result = self.service.get_product_history(conn, params)
+            return get_response(result)
+
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except Exception:
+                    raise DatabaseCloseFail('알 수 없는 오류가 발생했습니다.')
+
+
+class ProductDetailCacheStatsView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    # 상품 상세 캐시 적중률 조회
+    @LoginRequired('master')
+    def get(self):
+        """상품 상세 캐시 통계
+
+        Returns:
+            [dict]: {'size': 캐시된 상품 수, 'hits': 적중 수, 'misses': 미적중 수, 'hit_rate': 적중률, 'stale': 저장 후 원본이 수정되어 사용하지 않은 수}
+        """
+        result = self.service.get_product_detail_cache_stats()
+        return get_response(result)
 
 
 class ProductSellerSearchView(MethodView):
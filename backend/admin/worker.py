@@ -0,0 +1,53 @@
+"""job_outbox 작업 worker
+
+웹 서버와 별도 프로세스로 실행합니다. 여러 개를 실행해도 작업은 한 worker만 가져갑니다.
+
+    cd backend/admin
+    python worker.py
+"""
+import sys
+sys.path.insert(1, '../')
+
+import logging
+import signal
+import threading
+
+from admin.service import ProductService, ProductImportService, JobService
+
+from utils.constant import PRODUCT_IMAGES_JOB, PRODUCT_IMPORT_JOB
+
+
+def create_handlers():
+    product_service = ProductService()
+    product_import_service = ProductImportService()
+
+    return {
+        PRODUCT_IMAGES_JOB : product_service.run_product_images_job,
+        PRODUCT_IMPORT_JOB : product_import_service.run_import_job
+    }
+
+
+def create_fail_handlers():
+    """최대 시도 횟수를 넘어 FAILED가 된 작업의 대상을 실패 상태로 표시"""
+    product_service = ProductService()
+    product_import_service = ProductImportService()
+
+    return {
+        PRODUCT_IMAGES_JOB : product_service.fail_product_images_job,
+        PRODUCT_IMPORT_JOB : product_import_service.fail_import_job
+    }
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s %(message)s')
+
+    # SIGTERM, SIGINT를 받으면 실행 중인 작업을 마치고 종료
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *args: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *args: stop_event.set())
+
+    JobService().run_worker(create_handlers(), create_fail_handlers(), stop_event=stop_event)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# admin/app.py 와 같은 import 경로(backend, backend/admin)를 사용
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for path in (BASE_DIR, os.path.join(BASE_DIR, 'admin')):
+    if path not in sys.path:
+        sys.path.insert(1, path)
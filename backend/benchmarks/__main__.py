@@ -0,0 +1,41 @@
+import argparse
+
+from benchmarks import datagen, endpoints, loadtest
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=endpoints.__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='endpoint benchmark 실행 후 결과를 JSON으로 저장')
+    run_parser.add_argument('--iterations', type=int, default=30)
+    run_parser.add_argument('--warmup', type=int, default=3)
+    run_parser.add_argument('--output', default='benchmark_result.json')
+    run_parser.add_argument('--only', nargs='+', help='실행할 시나리오 이름')
+    run_parser.add_argument('--include-writes', action='store_true', help='상품 등록, 주문 상태 변경 시나리오 포함')
+    run_parser.add_argument('--database', help='benchmark 데이터가 있는 database (기본: config.DB)')
+    run_parser.add_argument('--seller-account-id', type=int, help='dashboard에 사용할 셀러 계정 (기본: 상품이 가장 많은 셀러)')
+    run_parser.set_defaults(func=endpoints.run)
+
+    compare_parser = subparsers.add_parser('compare', help='두 benchmark 결과 비교')
+    compare_parser.add_argument('before')
+    compare_parser.add_argument('after')
+    compare_parser.set_defaults(func=endpoints.compare)
+
+    seed_parser = subparsers.add_parser('seed', help='스키마를 다시 만들고 benchmark 데이터 생성',
+                                        description=datagen.__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    datagen.add_arguments(seed_parser)
+    seed_parser.set_defaults(func=datagen.seed)
+
+    loadtest_parser = subparsers.add_parser('loadtest', help='어드민 API 부하 테스트',
+                                            description=loadtest.__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    loadtest.add_arguments(loadtest_parser)
+    loadtest_parser.set_defaults(func=loadtest.loadtest)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""상품 코드 생성 방식별 insert benchmark
+
+products 테이블과 같은 형태(auto increment PK + 코드 unique index)의 임시 테이블 두 개에
+random 코드(기존 방식)와 utils.code_generator 코드를 각각 같은 수만큼 multi-row insert 하고
+구간별 insert 처리량과 최종 unique index 크기(leaf page 수, byte)를 출력합니다.
+index가 buffer pool보다 커지는 행 수에서 random 방식의 처리량 감소가 잘 보입니다.
+
+    cd backend
+    python -m benchmarks.bench_codes --rows 1000000 --batch 1000
+"""
+import argparse
+import random
+import string
+import time
+
+from connection import get_connection
+from utils.code_generator import CodeGenerator
+
+TABLES = {
+    'random' : 'bench_codes_random',
+    'ordered' : 'bench_codes_ordered'
+}
+
+
+def random_code():
+    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=20))
+
+
+def create_table(conn, table):
+    with conn.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(f"""
+            CREATE TABLE {table} (
+                id INT NOT NULL AUTO_INCREMENT,
+                code VARCHAR(30) NOT NULL,
+                created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (id),
+                UNIQUE KEY uk_code (code)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """)
+
+
+def insert_rows(conn, table, make_code, rows, batch, report_every):
+    sql = f"INSERT INTO {table} (code) VALUES (%s)"
+    timeline = list()
+    inserted = 0
+    window_start = time.perf_counter()
+    window_rows = 0
+    total_start = window_start
+
+    with conn.cursor() as cursor:
+        while inserted < rows:
+            size = min(batch, rows - inserted)
+            cursor.executemany(sql, [(make_code(),) for _ in range(size)])
+            conn.commit()
+            inserted += size
+            window_rows += size
+
+            if window_rows >= report_every or inserted == rows:
+                now = time.perf_counter()
+                timeline.append((inserted, window_rows / (now - window_start)))
+                window_start = now
+                window_rows = 0
+
+    return time.perf_counter() - total_start, timeline
+
+
+def index_size(conn, table):
+    with conn.cursor() as cursor:
+        cursor.execute(f"ANALYZE TABLE {table}")
+        cursor.fetchall()
+        cursor.execute("""
+            SELECT
+                stat_name,
+                stat_value
+            FROM
+                mysql.innodb_index_stats
+            WHERE
+                database_name = DATABASE()
+                AND table_name = %s
+                AND index_name = 'uk_code'
+                AND stat_name IN ('size', 'n_leaf_pages')
+        """, table)
+        stats = {row['stat_name']: row['stat_value'] for row in cursor.fetchall()}
+        cursor.execute("SELECT @@innodb_page_size AS page_size")
+        page_size = cursor.fetchone()['page_size']
+
+    return {
+        'leaf_pages' : stats.get('n_leaf_pages'),
+        'bytes' : stats['size'] * page_size if 'size' in stats else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--batch', type=int, default=1000)
+    parser.add_argument('--keep', action='store_true', help='benchmark 테이블을 삭제하지 않음')
+    args = parser.parse_args()
+
+    generator = CodeGenerator(worker_id=0)
+    schemes = {
+        'random' : random_code,
+        'ordered' : generator.generate
+    }
+
+    conn = get_connection()
+    try:
+        results = dict()
+        for name, make_code in schemes.items():
+            table = TABLES[name]
+            create_table(conn, table)
+
+            print(f"[{name}] inserting {args.rows} rows")
+            elapsed, timeline = insert_rows(conn, table, make_code, args.rows, args.batch, max(args.rows // 10, args.batch))
+            for inserted, rate in timeline:
+                print(f"  {inserted:>10} rows {rate:>12.0f} rows/s")
+
+            results[name] = {'elapsed': elapsed, **index_size(conn, table)}
+
+        print()
+        print(f"{'scheme':>8} {'rows/s':>12} {'leaf pages':>12} {'index MB':>10}")
+        for name, result in results.items():
+            megabytes = result['bytes'] / 1024 / 1024 if result['bytes'] else float('nan')
+            print(f"{name:>8} {args.rows / result['elapsed']:>12.0f} {result['leaf_pages'] or 0:>12} {megabytes:>10.1f}")
+
+    finally:
+        if not args.keep:
+            with conn.cursor() as cursor:
+                for table in TABLES.values():
+                    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""응답 압축 방식, level별 benchmark
+
+주문 리스트 50행, 상품 리스트 50행(한글 상품명, 이미지 url), 상품 상세(HTML 상세 설명) 형태의 JSON 응답을
+gzip level, brotli quality별로 압축해서 압축률과 압축 시간을 출력합니다.
+utils.compression의 기본값(COMPRESS_GZIP_LEVEL, COMPRESS_BROTLI_QUALITY)은 이 결과로 정했습니다.
+DB 없이 실행합니다.
+
+    cd backend
+    python -m benchmarks.bench_compression
+"""
+import argparse
+import gzip
+import random
+import time
+from datetime import datetime, timedelta
+
+import brotli
+
+from benchmarks.bench_json import make_rows
+from utils.formatter import dumps
+
+GZIP_LEVELS = (1, 3, 6, 9)
+BROTLI_QUALITIES = (1, 3, 4, 5, 6, 9, 11)
+
+WORDS = ('여름', '린넨', '셔츠', '오버핏', '데일리', '루즈핏', '니트', '가디건', '슬랙스', '와이드', '청바지', '원피스', '블라우스', '크롭')
+
+
+def make_product_list(count, seed):
+    rand = random.Random(seed)
+    base = datetime(2021, 5, 1, 9, 30, 0)
+    products = list()
+    for idx in range(count):
+        code = ''.join(rand.choices('0123456789ABCDEFGHJKMNPQRSTVWXYZ', k=16))
+        products.append({
+            'id' : idx,
+            'upload_date' : base + timedelta(minutes=rand.randrange(100000)),
+            'image_url' : f'https://brandi-bucket.s3.ap-northeast-2.amazonaws.com/product-images/{rand.getrandbits(256):064x}_thumbnail.webp',
+            'title' : ' '.join(rand.choices(WORDS, k=5)),
+            'product_code' : code,
+            'seller_id' : rand.randrange(1, 500),
+            'korean_brand_name' : rand.choice(('브랜디', '하이버', '서울스토어', '마켓컬리')),
+            'sub_property' : rand.choice(('쇼핑몰', '마켓', '로드샵')),
+            'price' : rand.randrange(1000, 200000, 10),
+            'discount_rate' : rand.choice((0, 0.1, 0.2)),
+            'discount_price' : rand.randrange(1000, 200000, 10),
+            'is_selling' : 1,
+            'is_displayed' : 1
+        })
+    return {'result': {'product': products, 'total_count': 12345}, 'status_code': 200}
+
+
+def make_product_detail(seed, paragraphs=200):
+    rand = random.Random(seed)
+    content = ''.join(
+        f'<p style="text-align:center;">{" ".join(rand.choices(WORDS, k=12))}</p>'
+        f'<img src="https://brandi-bucket.s3.ap-northeast-2.amazonaws.com/product-images-in-html/{rand.getrandbits(256):064x}.jpg">'
+        for _ in range(paragraphs)
+    )
+    return {'result': {'basic_info': {'title': '여름 린넨 셔츠', 'content': content}}, 'status_code': 200}
+
+
+def measure(func, data, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    payloads = {
+        'orders 50' : dumps(make_rows(50, args.seed)),
+        'products 50' : dumps(make_product_list(50, args.seed)),
+        'product detail' : dumps(make_product_detail(args.seed))
+    }
+
+    schemes = [(f'gzip {level}', lambda data, level=level: gzip.compress(data, compresslevel=level)) for level in GZIP_LEVELS]
+    schemes += [(f'br {quality}', lambda data, quality=quality: brotli.compress(data, quality=quality)) for quality in BROTLI_QUALITIES]
+
+    for name, data in payloads.items():
+        print(f"[{name}] {len(data)} bytes")
+        print(f"{'scheme':>8} {'bytes':>9} {'ratio':>7} {'ms':>8} {'MB/s':>8}")
+        for scheme, func in schemes:
+            elapsed, compressed = measure(func, data, args.repeat)
+            print(f"{scheme:>8} {len(compressed):>9} {len(compressed) / len(data):>7.3f} {elapsed * 1000:>8.3f} {len(data) / elapsed / 1024 / 1024:>8.1f}")
+        print()
+
+
+if __name__ == '__main__':
+    main()
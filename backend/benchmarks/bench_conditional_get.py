@@ -0,0 +1,91 @@
+"""목록 polling 조건부 GET(ETag, If-None-Match) benchmark
+
+어드민 화면처럼 같은 조건으로 /orders, /products 를 반복 조회하고,
+--write-every 번 조회마다 한 번씩 수정이 일어나는 상황(table_versions version 증가)을 만들어
+If-None-Match 없이 조회할 때와 직전 ETag로 조회할 때의 응답 수(200, 304), DB 쿼리 수, 응답 byte, 처리 시간을 출력합니다.
+수정은 VersionService.bump 로 version만 올립니다 (수정 쿼리 비용은 두 방식이 같으므로 쿼리 수, 시간에서 제외).
+로컬 DB(db/schema.sql + 데이터)와 --account-id 계정이 필요합니다.
+
+    cd backend
+    python -m benchmarks.bench_conditional_get --account-id 1 --polls 1000 --write-every 20
+"""
+import argparse
+import sys
+import time
+
+import jwt
+
+sys.path.insert(0, 'admin')
+
+from admin.app import create_app
+from admin.service import VersionService
+from config import SECRET_KEY
+from connection import get_connection
+from utils.query_detector import QueryRecorder
+
+TARGETS = {
+    'orders' : '/orders?start_date=2021-01-01&end_date=2021-12-31&order_status_type_id=1&limit=50',
+    'products' : '/products?limit=50'
+}
+
+
+def bump(target, account_id):
+    """수정 한 번 (대상 테이블의 전체, 계정 scope version 증가)"""
+    conn = get_connection()
+    try:
+        VersionService().bump(conn, target, [account_id])
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def poll(client, url, token, account_id, polls, write_every, conditional, target):
+    result = {'200' : 0, '304' : 0, 'queries' : 0, 'bytes' : 0, 'elapsed' : 0}
+    etag = None
+
+    for idx in range(polls):
+        if idx and idx % write_every == 0:
+            bump(target, account_id)
+
+        headers = {'Authorization' : token}
+        if conditional and etag:
+            headers['If-None-Match'] = etag
+
+        start = time.perf_counter()
+        with QueryRecorder() as recorder:
+            response = client.get(url, headers=headers)
+        result['elapsed'] += time.perf_counter() - start
+
+        result[str(response.status_code)] = result.get(str(response.status_code), 0) + 1
+        result['queries'] += len(recorder)
+        result['bytes'] += len(response.data)
+        etag = response.headers.get('ETag', etag)
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--account-id', type=int, required=True, help='조회할 마스터 또는 셀러 계정 id')
+    parser.add_argument('--polls', type=int, default=1000)
+    parser.add_argument('--write-every', type=int, default=20, help='몇 번 조회마다 수정이 일어나는지')
+    parser.add_argument('--target', choices=tuple(TARGETS), nargs='+', default=list(TARGETS))
+    args = parser.parse_args()
+
+    app = create_app()
+    client = app.test_client()
+    token = jwt.encode({'account_id': args.account_id}, SECRET_KEY, algorithm='HS256')
+
+    print(f"{'target':>9} {'mode':>12} {'200':>6} {'304':>6} {'queries':>8} {'KB':>9} {'seconds':>8} {'ms/poll':>8}")
+    for target in args.target:
+        for conditional in (False, True):
+            result = poll(client, TARGETS[target], token, args.account_id, args.polls, args.write_every, conditional, target)
+            mode = 'conditional' if conditional else 'plain'
+            print(
+                f"{target:>9} {mode:>12} {result['200']:>6} {result['304']:>6} {result['queries']:>8} "
+                f"{result['bytes'] / 1024:>9.1f} {result['elapsed']:>8.2f} {result['elapsed'] / args.polls * 1000:>8.2f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""JSON response 직렬화 방식별 benchmark
+
+주문 리스트 행과 같은 형태(datetime, Decimal, 문자열, 정수가 섞인 dict)의 결과를
+기존 방식(json.dumps + CustomJSONEncoder, key 정렬)과 utils.formatter.dumps(orjson)로 각각 직렬화한 시간을 출력합니다.
+두 결과를 다시 읽은 값이 같은지도 확인합니다. DB 없이 실행합니다.
+
+    cd backend
+    python -m benchmarks.bench_json --rows 50 10000
+"""
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from utils.formatter import CustomJSONEncoder, dumps
+
+
+def make_rows(count, seed):
+    rand = random.Random(seed)
+    base = datetime(2021, 5, 1, 9, 30, 0)
+    rows = list()
+    for idx in range(count):
+        created_at = base + timedelta(minutes=rand.randrange(100000))
+        rows.append({
+            'orders_detail_id' : idx,
+            'order_number' : f'2021{idx:012d}',
+            'order_detail_number' : f'OD2021{idx:010d}',
+            'order_created_at' : created_at,
+            'updated_at' : created_at + timedelta(hours=rand.randrange(48)),
+            'discount_start_date' : created_at - timedelta(days=3),
+            'discount_end_date' : created_at + timedelta(days=3),
+            'brand_name' : '브랜디',
+            'product_name' : f'상품 {idx}',
+            'color' : '블랙',
+            'size' : 'FREE',
+            'quantity' : rand.randint(1, 5),
+            'price' : rand.randrange(1000, 200000, 10),
+            'discount_rate' : Decimal(rand.choice(('0.00', '0.10', '0.15', '0.30'))),
+            'order_status_type' : '상품준비',
+            'orderer_phone' : '01012345678'
+        })
+    return {'result': {'order_list': rows, 'total_count': count}, 'status_code': 200}
+
+
+def old_dumps(data):
+    return json.dumps(data, cls=CustomJSONEncoder, sort_keys=True).encode()
+
+
+def measure(func, data, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[50, 10000])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'encoder':>10} {'ms':>9} {'bytes':>10}")
+    for count in args.rows:
+        data = make_rows(count, args.seed)
+
+        old_elapsed, old_result = measure(old_dumps, data, args.repeat)
+        new_elapsed, new_result = measure(dumps, data, args.repeat)
+
+        if json.loads(old_result) != json.loads(new_result):
+            raise AssertionError('orjson result differs from CustomJSONEncoder')
+
+        print(f"{count:>8} {'custom':>10} {old_elapsed * 1000:>9.3f} {len(old_result):>10}")
+        print(f"{count:>8} {'orjson':>10} {new_elapsed * 1000:>9.3f} {len(new_result):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""주문 금액 계산 방식별 microbenchmark
+
+주문 리스트 행과 같은 형태(가격 int, 할인율, 수량 int)의 행을 만들고 주문 금액을
+기존 방식(DECIMAL 할인율로 행마다 int(price * (1 - rate) * quantity)),
+utils.money 행 단위(line_total), utils.money 일괄 계산(line_totals)으로 각각 계산한 시간을 출력합니다.
+utils.money 방식의 할인율은 DAO에서 basis point int로 조회한 값입니다.
+DB 없이 실행합니다.
+
+    cd backend
+    python -m benchmarks.bench_money --rows 1000000
+"""
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from utils.money import RATE_SCALE, line_total, line_totals
+
+RATES = ('0.00', '0.05', '0.10', '0.15', '0.20', '0.33', '0.50')
+
+
+def make_rows(count, seed):
+    rand = random.Random(seed)
+    rows = list()
+    for _ in range(count):
+        rate = rand.choice(RATES)
+        rows.append({
+            'price' : rand.randrange(1000, 200000, 10),
+            'discount_rate' : Decimal(rate),
+            'discount_rate_bp' : int(Decimal(rate) * RATE_SCALE),
+            'quantity' : rand.randint(1, 5)
+        })
+    return rows
+
+
+def decimal_per_row(rows):
+    return [
+        int(row['price'] * row['quantity']) if row['discount_rate'] == 0 else int(row['price'] * (1 - row['discount_rate']) * row['quantity'])
+        for row in rows
+    ]
+
+
+def money_per_row(rows):
+    return [line_total(row['price'], row['discount_rate_bp'], row['quantity']) for row in rows]
+
+
+def money_bulk(rows):
+    return line_totals(rows)
+
+
+def measure(func, rows, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(rows)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.seed)
+    schemes = {
+        'decimal per row' : decimal_per_row,
+        'money per row' : money_per_row,
+        'money bulk' : money_bulk
+    }
+
+    results = dict()
+    print(f"{'scheme':>16} {'seconds':>9} {'ns/row':>8}")
+    for name, func in schemes.items():
+        elapsed, results[name] = measure(func, rows, args.repeat)
+        print(f"{name:>16} {elapsed:>9.3f} {elapsed / args.rows * 1e9:>8.0f}")
+
+    for name in ('money per row', 'money bulk'):
+        if results[name] != results['decimal per row']:
+            raise AssertionError(f'{name} result differs from decimal per row')
+
+
+if __name__ == '__main__':
+    main()
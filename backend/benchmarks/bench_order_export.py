@@ -0,0 +1,84 @@
+"""주문 리스트 파일 export 방식별 benchmark
+
+주문 리스트 행과 같은 형태의 행을 generator로 만들어
+기존 방식(utils.excel.export_excel_file, 전체 행을 list로 받아 openpyxl Workbook을 BytesIO에 저장)과
+utils.excel.stream_xlsx_file, stream_csv_file로 변환할 때의 첫 chunk까지 걸린 시간, 전체 시간, 최대 메모리(tracemalloc), 파일 크기를 출력합니다.
+DB 없이 실행합니다.
+
+    cd backend
+    python -m benchmarks.bench_order_export --rows 10000 100000
+"""
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.bench_json import make_rows
+from utils.excel import export_excel_file, stream_csv_file, stream_xlsx_file
+
+TITLE = {
+    'orders_detail_id' : '주문상세아이디',
+    'order_created_at' : '결제일자',
+    'order_number' : '주문번호',
+    'order_detail_number' : '주문상세번호',
+    'brand_name' : '셀러명',
+    'product_name' : '상품명',
+    'color' : '색상',
+    'size' : '사이즈',
+    'quantity' : '수량',
+    'orderer_phone' : '핸드폰번호',
+    'order_status_type' : '주문상태',
+    'price' : '결제금액'
+}
+
+
+def iter_rows(count, seed, chunk=10000):
+    """DB cursor처럼 행을 하나씩 만드는 generator (make_rows를 chunk 단위로 호출)"""
+    for start in range(0, count, chunk):
+        for row in make_rows(min(chunk, count - start), seed + start)['result']['order_list']:
+            yield row
+
+
+def buffered_xlsx(rows):
+    yield export_excel_file(TITLE, list(rows)).getvalue()
+
+
+EXPORTERS = {
+    'openpyxl' : buffered_xlsx,
+    'xlsx' : lambda rows: stream_xlsx_file(TITLE, rows),
+    'csv' : lambda rows: stream_csv_file(TITLE, rows)
+}
+
+
+def measure(exporter, count, seed):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first, size = None, 0
+    for chunk in exporter(iter_rows(count, seed)):
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first, elapsed, peak, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--exporter', choices=tuple(EXPORTERS), nargs='+', default=list(EXPORTERS))
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'exporter':>9} {'first ms':>9} {'seconds':>8} {'peak MB':>8} {'file MB':>8}")
+    for count in args.rows:
+        for name in args.exporter:
+            first, elapsed, peak, size = measure(EXPORTERS[name], count, args.seed)
+            print(
+                f"{count:>8} {name:>9} {first * 1000:>9.1f} {elapsed:>8.2f} "
+                f"{peak / 1024 / 1024:>8.1f} {size / 1024 / 1024:>8.1f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
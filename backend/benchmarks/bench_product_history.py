@@ -0,0 +1,245 @@
+"""상품 history 저장 방식별 write volume benchmark
+
+product_history와 같은 형태의 임시 테이블 두 개에 같은 수정 이력을
+전체 컬럼 snapshot(기존 방식)과 diff + checkpoint(utils.history) 방식으로 각각 insert 하고
+insert 한 값의 byte 수, 처리 시간, 테이블 크기(data_length)를 출력합니다.
+수정 이력은 판매/진열 여부 변경(--toggle-ratio)과 가격 변경이 섞여 있고, 상세 설명(content)은 바뀌지 않습니다.
+마지막에 diff 테이블에서 복원한 상품 정보가 마지막 수정 값과 같은지 확인합니다.
+
+    cd backend
+    python -m benchmarks.bench_product_history --products 1000 --events 50 --content-size 20000
+"""
+import argparse
+import random
+import time
+from datetime import datetime
+
+from connection import get_connection
+from utils.constant import PRODUCT_HISTORY_COLUMNS, PRODUCT_HISTORY_CHECKPOINT_INTERVAL
+from utils.history import make_diff, encode_changes, apply_history
+
+TABLES = {
+    'snapshot' : 'bench_history_snapshot',
+    'diff' : 'bench_history_diff'
+}
+
+COLUMNS_SQL = """
+    is_selling TINYINT NULL,
+    is_displayed TINYINT NULL,
+    title VARCHAR(100) NULL,
+    simple_description VARCHAR(200) NULL,
+    content MEDIUMTEXT NULL,
+    price INT NULL,
+    discount_rate DECIMAL(3, 2) NULL,
+    discount_start_date DATETIME NULL,
+    discount_end_date DATETIME NULL,
+    min_amount INT NULL,
+    max_amount INT NULL,
+    manufacturer VARCHAR(50) NULL,
+    date_of_manufacture VARCHAR(30) NULL,
+    origin VARCHAR(50) NULL
+"""
+
+
+def create_table(conn, table):
+    with conn.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(f"""
+            CREATE TABLE {table} (
+                id INT NOT NULL AUTO_INCREMENT,
+                product_id INT NOT NULL,
+                modify_account_id INT NULL,
+                is_checkpoint TINYINT NOT NULL DEFAULT 1,
+                changes MEDIUMTEXT NULL,
+                {COLUMNS_SQL},
+                created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (id),
+                KEY ix_product_id (product_id)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """)
+
+
+def make_product(idx, content_size):
+    return {
+        'is_selling' : 1,
+        'is_displayed' : 1,
+        'title' : f'상품 {idx}',
+        'simple_description' : '한줄 설명',
+        'content' : '<p>' + 'x' * content_size + '</p>',
+        'price' : 10000 + idx,
+        'discount_rate' : None,
+        'discount_start_date' : datetime(1111, 1, 1),
+        'discount_end_date' : datetime(9999, 12, 31, 23, 59),
+        'min_amount' : 1,
+        'max_amount' : 20,
+        'manufacturer' : '상품 상세 참조',
+        'date_of_manufacture' : '상품 상세 참조',
+        'origin' : '상품 상세 참조'
+    }
+
+
+def make_events(products, events, toggle_ratio, seed):
+    """(상품아이디, 수정 후 상품 정보) 수정 순서 list"""
+    rand = random.Random(seed)
+    states = {product_id: dict(product) for product_id, product in products.items()}
+    result = list()
+
+    for _ in range(events):
+        for product_id, state in states.items():
+            if rand.random() < toggle_ratio:
+                column = rand.choice(('is_selling', 'is_displayed'))
+                state[column] = 1 - state[column]
+            else:
+                state['price'] += 100
+            result.append((product_id, dict(state)))
+
+    return result
+
+
+def value_bytes(params):
+    return sum(len(str(value).encode()) for value in params.values() if value is not None)
+
+
+def checkpoint_sql(table):
+    columns = ('product_id', 'modify_account_id') + PRODUCT_HISTORY_COLUMNS
+    return f"""
+        INSERT INTO {table} ({', '.join(columns)})
+        VALUES ({', '.join(f'%({column})s' for column in columns)})
+    """
+
+
+def diff_sql(table):
+    return f"""
+        INSERT INTO {table} (product_id, modify_account_id, is_checkpoint, changes)
+        VALUES (%(product_id)s, %(modify_account_id)s, 0, %(changes)s)
+    """
+
+
+def snapshot_rows(products, events):
+    """기존 방식: 수정마다 전체 컬럼 저장"""
+    sql = checkpoint_sql(TABLES['snapshot'])
+    rows = [(sql, dict(product, product_id=product_id, modify_account_id=1)) for product_id, product in products.items()]
+    rows += [(sql, dict(state, product_id=product_id, modify_account_id=1)) for product_id, state in events]
+    return rows
+
+
+def diff_rows(products, events):
+    """ProductService.create_products_history와 같은 규칙으로 checkpoint, diff 생성"""
+    full_sql = checkpoint_sql(TABLES['diff'])
+    changes_sql = diff_sql(TABLES['diff'])
+
+    rows = [(full_sql, dict(product, product_id=product_id, modify_account_id=1)) for product_id, product in products.items()]
+    states = {product_id: dict(product) for product_id, product in products.items()}
+    diff_counts = {product_id: 0 for product_id in products}
+
+    for product_id, state in events:
+        changes = make_diff(states[product_id], state, PRODUCT_HISTORY_COLUMNS)
+        states[product_id] = state
+
+        if not changes:
+            continue
+
+        if diff_counts[product_id] >= PRODUCT_HISTORY_CHECKPOINT_INTERVAL:
+            rows.append((full_sql, dict(state, product_id=product_id, modify_account_id=1)))
+            diff_counts[product_id] = 0
+        else:
+            rows.append((changes_sql, {'product_id': product_id, 'modify_account_id': 1, 'changes': encode_changes(changes)}))
+            diff_counts[product_id] += 1
+
+    return rows
+
+
+def insert_rows(conn, rows, batch):
+    """연속된 같은 sql끼리 묶어서 executemany (id 순서 = 이력 순서 유지)"""
+    start = time.perf_counter()
+    with conn.cursor() as cursor:
+        idx = 0
+        while idx < len(rows):
+            sql = rows[idx][0]
+            group = list()
+            while idx < len(rows) and rows[idx][0] == sql and len(group) < batch:
+                group.append(rows[idx][1])
+                idx += 1
+            cursor.executemany(sql, group)
+            conn.commit()
+
+    return {
+        'rows' : len(rows),
+        'bytes' : sum(value_bytes(params) for _, params in rows),
+        'elapsed' : time.perf_counter() - start
+    }
+
+
+def table_size(conn, table):
+    with conn.cursor() as cursor:
+        cursor.execute(f"ANALYZE TABLE {table}")
+        cursor.fetchall()
+        cursor.execute("""
+            SELECT
+                data_length + index_length AS size
+            FROM
+                information_schema.TABLES
+            WHERE
+                table_schema = DATABASE()
+                AND table_name = %s
+        """, table)
+        return cursor.fetchone()['size']
+
+
+def check_reconstruct(conn, events, sample):
+    """diff 테이블에서 복원한 마지막 상품 정보가 마지막 수정 값과 같은지 확인"""
+    last_states = dict(events)
+    columns = ', '.join(('id', 'is_checkpoint', 'changes') + PRODUCT_HISTORY_COLUMNS)
+
+    with conn.cursor() as cursor:
+        for product_id in list(last_states)[:sample]:
+            cursor.execute(f"SELECT {columns} FROM {TABLES['diff']} WHERE product_id = %s ORDER BY id", product_id)
+            *_, (_, state, _) = apply_history(cursor.fetchall(), PRODUCT_HISTORY_COLUMNS)
+            if state != last_states[product_id]:
+                raise AssertionError(f'product {product_id} reconstruct mismatch')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--products', type=int, default=1000)
+    parser.add_argument('--events', type=int, default=50, help='상품별 수정 횟수')
+    parser.add_argument('--content-size', type=int, default=20000, help='상세 설명 HTML byte 수')
+    parser.add_argument('--toggle-ratio', type=float, default=0.8)
+    parser.add_argument('--batch', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--keep', action='store_true', help='benchmark 테이블을 삭제하지 않음')
+    args = parser.parse_args()
+
+    products = {product_id: make_product(product_id, args.content_size) for product_id in range(1, args.products + 1)}
+    events = make_events(products, args.events, args.toggle_ratio, args.seed)
+    schemes = {
+        'snapshot' : snapshot_rows(products, events),
+        'diff' : diff_rows(products, events)
+    }
+
+    conn = get_connection()
+    try:
+        results = dict()
+        for name, rows in schemes.items():
+            create_table(conn, TABLES[name])
+            print(f"[{name}] inserting {len(rows)} rows")
+            results[name] = insert_rows(conn, rows, args.batch)
+            results[name]['size'] = table_size(conn, TABLES[name])
+
+        check_reconstruct(conn, events, sample=min(args.products, 100))
+
+        print()
+        print(f"{'scheme':>9} {'rows':>10} {'value MB':>10} {'table MB':>10} {'seconds':>9}")
+        for name, result in results.items():
+            print(f"{name:>9} {result['rows']:>10} {result['bytes'] / 1024 / 1024:>10.1f} {(result['size'] or 0) / 1024 / 1024:>10.1f} {result['elapsed']:>9.2f}")
+
+    finally:
+        if not args.keep:
+            with conn.cursor() as cursor:
+                for table in TABLES.values():
+                    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
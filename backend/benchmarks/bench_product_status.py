@@ -0,0 +1,90 @@
+"""상품 판매/진열 일괄 변경 benchmark
+
+로컬 MySQL(config.DB)에 저장된 상품으로 PATCH /products 의 DAO 경로를 실행하고
+상품 수(10, 1k, 10k)별 실행 쿼리 수와 소요 시간을 출력합니다.
+모든 변경은 rollback 되므로 데이터는 바뀌지 않습니다.
+
+    cd backend
+    python -m benchmarks.bench_product_status --sizes 10 1000 10000
+"""
+import argparse
+import time
+
+from flask import Flask, g
+
+from admin.model import ProductDao
+from connection import get_connection
+from utils.constant import MASTER
+from utils.query_detector import QueryRecorder
+
+
+def per_row_update(conn, product_check_success_result):
+    """변경 전 방식: 상품마다 UPDATE 한 번씩 실행"""
+    for product_check_result in product_check_success_result:
+        sql = """
+            UPDATE
+                products as p
+            SET
+                p.is_displayed = %(display)s,
+                p.is_selling = %(selling)s
+            WHERE
+                p.id = %(product_id)s
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql, product_check_result)
+
+
+def make_requests(product_ids):
+    # 상품 리스트에서 전체 선택 후 판매/진열 변경하는 경우와 섞인 경우를 함께 포함
+    return [
+        {
+            'product_id' : product_id,
+            'display' : idx % 2,
+            'selling' : 0
+        }
+        for idx, product_id in enumerate(product_ids)
+    ]
+
+
+def run(conn, func, requests, product_ids):
+    with QueryRecorder() as recorder:
+        start = time.perf_counter()
+        func(conn, requests)
+        ProductDao().insert_product_history(conn, tuple(product_ids))
+        elapsed = time.perf_counter() - start
+    conn.rollback()
+    return len(recorder), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10, 1000, 10000])
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    conn = get_connection()
+    try:
+        with app.app_context():
+            g.account_id = 1
+            g.account_type_id = MASTER
+
+            print(f"{'products':>10} {'method':>10} {'queries':>8} {'ms':>10}")
+            for size in args.sizes:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT id FROM products ORDER BY id LIMIT %s", size)
+                    product_ids = [row['id'] for row in cursor.fetchall()]
+
+                if len(product_ids) < size:
+                    print(f"{size:>10} skipped: only {len(product_ids)} products in database")
+                    continue
+
+                requests = make_requests(product_ids)
+                for name, func in (('per_row', per_row_update), ('grouped', ProductDao().patch_product_selling_or_display_status)):
+                    queries, elapsed = run(conn, func, requests, product_ids)
+                    print(f"{size:>10} {name:>10} {queries:>8} {elapsed * 1000:>10.1f}")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
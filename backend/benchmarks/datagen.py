@@ -0,0 +1,564 @@
+"""benchmark 용 데이터 생성기
+
+db/schema.sql 로 테이블을 다시 만들고 셀러, 상품, 옵션, 이미지, 주문과 각 history 테이블에
+서로 참조가 맞는 데이터를 규모에 맞게 채웁니다.
+
+- 셀러별 상품 수, 상품별 주문 수는 zipf 분포(소수의 대형 셀러, 인기 상품)를 따릅니다.
+- 브랜드명, 상품명, 상세 설명은 한글로 생성합니다.
+- 기본은 LOAD DATA LOCAL INFILE 로 적재하며 (서버의 local_infile 설정 필요),
+  --method insert 를 주면 multi-row INSERT 로 적재합니다.
+
+db/schema.sql 은 모든 테이블을 DROP 후 다시 만들기 때문에 --database 로 대상 database를 직접 지정해야 하며,
+이름이 _bench, _test 로 끝나지 않는 database는 --yes 를 함께 줄 때만 사용합니다. (없으면 생성)
+
+    cd backend
+    python -m benchmarks seed --database brandi_bench --scale small
+    python -m benchmarks seed --database brandi_bench --scale large --method load-data
+    python -m benchmarks seed --database brandi_bench --sellers 100 --products 50000 --orders 100000
+    python -m benchmarks run --database brandi_bench
+"""
+import bisect
+import os
+import random
+import string
+import tempfile
+import time
+from array import array
+from datetime import datetime, timedelta
+from itertools import accumulate
+
+import bcrypt
+import pymysql
+
+from config import DB
+from utils.constant import MASTER, SELLER, USER, PRODUCT_INFO_NOTICE, START_DATE, END_DATE
+from utils.money import discounted_price, rate_to_bp
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'db', 'schema.sql')
+
+# 주문 상세는 주문당 평균 2개 → large 는 약 2천만 건
+SCALES = {
+    'small'  : {'sellers': 50, 'products': 20000, 'users': 5000, 'orders': 30000},
+    'medium' : {'sellers': 500, 'products': 200000, 'users': 50000, 'orders': 500000},
+    'large'  : {'sellers': 5000, 'products': 2000000, 'users': 1000000, 'orders': 10000000},
+}
+
+# --yes 없이 데이터를 지울 수 있는 database 이름
+DISPOSABLE_DATABASE_SUFFIXES = ('_bench', '_test')
+
+# 로그인 비밀번호 (master@brandi.co.kr, seller 아이디 모두 동일)
+PASSWORD = 'brandi1234'
+
+CODE_CHARS = string.ascii_uppercase + string.digits
+
+SYLLABLES = '가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후리미비시이지치키티피히린민빈신진하늘바람별달숲'
+BRAND_SUFFIXES = ['샵', '스토어', '마켓', '하우스', '클로젯', '룸', '라운지', '스튜디오', '아틀리에', '데이']
+LAST_NAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+FIRST_NAMES = ['민준', '서연', '지우', '하은', '도윤', '수아', '예준', '지민', '시우', '채원', '유진', '현우', '다은', '준서']
+ADJECTIVES = ['데일리', '베이직', '오버핏', '슬림핏', '빈티지', '모던', '러블리', '캐주얼', '시크', '심플', '루즈핏', '크롭']
+MATERIALS = ['코튼', '린넨', '울', '캐시미어', '데님', '레더', '니트', '쉬폰', '골지', '기모', '트위드', '나일론']
+CITIES = ['서울특별시 강남구', '서울특별시 마포구', '서울특별시 성동구', '부산광역시 해운대구', '경기도 성남시 분당구', '인천광역시 연수구', '대구광역시 수성구']
+ROADS = ['테헤란로', '월드컵북로', '왕십리로', '해운대로', '판교역로', '컨벤시아대로', '달구벌대로']
+
+
+def base36(number):
+    digits = string.digits + string.ascii_uppercase
+    result = ''
+    while True:
+        number, remainder = divmod(number, 36)
+        result = digits[remainder] + result
+        if not number:
+            return result
+
+
+def unique_code(rng, number, length):
+    # 앞부분은 서비스와 같은 random 문자, 뒷부분은 id를 넣어 중복되지 않게 함
+    suffix = base36(number)
+    return ''.join(rng.choices(CODE_CHARS, k=length - len(suffix))) + suffix
+
+
+def zipf_cum_weights(count, exponent):
+    return array('d', accumulate(1 / (rank + 1) ** exponent for rank in range(count)))
+
+
+def pick(rng, cum_weights):
+    """cum_weights 로 1부터 시작하는 번호 하나를 뽑는다."""
+    return bisect.bisect(cum_weights, rng.random() * cum_weights[-1]) + 1
+
+
+class TableLoader:
+    """row를 모아 batch 단위로 적재
+
+    load-data: 임시 TSV 파일을 만들어 LOAD DATA LOCAL INFILE 실행
+    insert: executemany 로 multi-row INSERT 실행
+    """
+    def __init__(self, conn, table, columns, method, batch_size):
+        self.conn = conn
+        self.table = table
+        self.columns = columns
+        self.method = method
+        self.batch_size = batch_size
+        self.rows = list()
+        self.count = 0
+        self.elapsed = 0
+
+    def add(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+
+        start = time.perf_counter()
+        if self.method == 'load-data':
+            self._load_data()
+        else:
+            self._insert()
+        self.conn.commit()
+        self.elapsed += time.perf_counter() - start
+
+        self.count += len(self.rows)
+        self.rows.clear()
+
+    def _insert(self):
+        sql = f"""
+            INSERT INTO {self.table} ({', '.join(self.columns)})
+            VALUES ({', '.join(['%s'] * len(self.columns))})
+        """
+        with self.conn.cursor() as cursor:
+            cursor.executemany(sql, self.rows)
+
+    def _load_data(self):
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.tsv', delete=False) as f:
+            for row in self.rows:
+                f.write('\t'.join(self._escape(value) for value in row))
+                f.write('\n')
+            path = f.name
+
+        try:
+            sql = f"""
+                LOAD DATA LOCAL INFILE %s
+                INTO TABLE {self.table}
+                CHARACTER SET utf8mb4
+                FIELDS TERMINATED BY '\\t'
+                LINES TERMINATED BY '\\n'
+                ({', '.join(self.columns)})
+            """
+            with self.conn.cursor() as cursor:
+                cursor.execute(sql, path)
+        finally:
+            os.remove(path)
+
+    @staticmethod
+    def _escape(value):
+        if value is None:
+            return '\\N'
+        if isinstance(value, datetime):
+            return value.strftime('%Y-%m-%d %H:%M:%S')
+        return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+class DataGenerator:
+    def __init__(self, conn, args):
+        self.conn = conn
+        self.method = args.method
+        self.batch_size = args.batch_size
+        self.rng = random.Random(args.seed)
+        self.now = datetime.now().replace(microsecond=0)
+        self.days = args.days
+
+        self.sellers = args.sellers
+        self.products = args.products
+        self.users = args.users
+        self.orders = args.orders
+
+        self.password = bcrypt.hashpw(PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        self.loaders = list()
+
+    def loader(self, table, columns):
+        loader = TableLoader(self.conn, table, columns, self.method, self.batch_size)
+        self.loaders.append(loader)
+        return loader
+
+    def finish(self, *loaders):
+        for loader in loaders:
+            loader.flush()
+            rate = loader.count / loader.elapsed if loader.elapsed else 0
+            print(f"  {loader.table:<22} {loader.count:>12,} rows  {loader.elapsed:>8.1f}s  {rate:>12,.0f} rows/s")
+
+    def random_datetime(self, start_ratio=0.0, end_ratio=1.0):
+        start = self.now - timedelta(days=self.days)
+        seconds = self.days * 86400
+        return start + timedelta(seconds=int(seconds * self.rng.uniform(start_ratio, end_ratio)))
+
+    def phone(self):
+        return f"010{self.rng.randint(10000000, 99999999)}"
+
+    def person_name(self):
+        return self.rng.choice(LAST_NAMES) + self.rng.choice(FIRST_NAMES)
+
+    def load_reference(self):
+        with self.conn.cursor() as cursor:
+            cursor.execute("SELECT id, property_id FROM sub_property")
+            self.sub_properties = {row['id']: row['property_id'] for row in cursor.fetchall()}
+
+            cursor.execute("SELECT id, property_id FROM category")
+            self.categories = dict()
+            for row in cursor.fetchall():
+                self.categories.setdefault(row['property_id'], list()).append(row['id'])
+
+            cursor.execute("SELECT id, category_id, name FROM sub_category")
+            self.sub_categories = dict()
+            for row in cursor.fetchall():
+                self.sub_categories.setdefault(row['category_id'], list()).append((row['id'], row['name']))
+
+            cursor.execute("SELECT id FROM color")
+            self.colors = [row['id'] for row in cursor.fetchall()]
+
+            cursor.execute("SELECT id FROM size")
+            self.sizes = [row['id'] for row in cursor.fetchall()]
+
+            cursor.execute("SELECT id FROM delivery_memo")
+            self.delivery_memos = [row['id'] for row in cursor.fetchall()]
+
+    # account id: 1 = master, 2 ~ sellers + 1 = 셀러, 그 이후 = 유저
+    def seller_account_id(self, seller_id):
+        return 1 + seller_id
+
+    def user_account_id(self, user_id):
+        return 1 + self.sellers + user_id
+
+    def generate_accounts(self):
+        print("accounts")
+        account = self.loader('account', ['id', 'account_type_id', 'created_at'])
+        master = self.loader('master', ['account_id', 'email', 'password'])
+        users = self.loader('users', ['id', 'account_id', 'name', 'phone', 'created_at'])
+        address = self.loader('address', ['id', 'user_id', 'recipient', 'phone', 'zip_code', 'address', 'detail_address'])
+
+        account.add((1, MASTER, self.now - timedelta(days=self.days)))
+        master.add((1, 'master@brandi.co.kr', self.password))
+
+        for seller_id in range(1, self.sellers + 1):
+            account.add((self.seller_account_id(seller_id), SELLER, self.random_datetime(0, 0.5)))
+
+        for user_id in range(1, self.users + 1):
+            created_at = self.random_datetime()
+            name = self.person_name()
+            phone = self.phone()
+            account.add((self.user_account_id(user_id), USER, created_at))
+            users.add((user_id, self.user_account_id(user_id), name, phone, created_at))
+            # 유저마다 배송지 1개, address.id = users.id
+            address.add((
+                user_id, user_id, name, phone, f"{self.rng.randint(10000, 63999)}",
+                f"{self.rng.choice(CITIES)} {self.rng.choice(ROADS)} {self.rng.randint(1, 999)}",
+                f"{self.rng.randint(101, 120)}동 {self.rng.randint(101, 2503)}호"
+            ))
+
+        self.finish(account, master, users, address)
+
+    def brand_names(self):
+        used = set()
+        for seller_id in range(1, self.sellers + 1):
+            name = ''.join(self.rng.choices(SYLLABLES, k=self.rng.randint(2, 3))) + self.rng.choice(BRAND_SUFFIXES)
+            while name in used:
+                name = self.rng.choice(SYLLABLES) + name
+            used.add(name)
+            yield seller_id, name
+
+    def generate_sellers(self):
+        print("sellers")
+        sellers = self.loader('sellers', [
+            'id', 'account_id', 'property_id', 'sub_property_id', 'seller_status_type_id', 'seller_identification',
+            'password', 'korean_brand_name', 'english_brand_name', 'customer_center_number', 'profile_image_url',
+            'description', 'zip_code', 'address', 'detail_address', 'open_at', 'close_at', 'created_at'
+        ])
+        sellers_history = self.loader('sellers_history', [
+            'seller_id', 'modify_account_id', 'property_id', 'sub_property_id', 'seller_status_type_id',
+            'korean_brand_name', 'english_brand_name', 'customer_center_number', 'created_at'
+        ])
+        managers = self.loader('managers', ['id', 'seller_id', 'name', 'phone', 'email', 'created_at'])
+        managers_history = self.loader('managers_history', ['manager_id', 'name', 'phone', 'email', 'modify_account_id', 'created_at'])
+
+        self.seller_properties = array('i', [0]) * (self.sellers + 1)
+        manager_id = 0
+        for seller_id, korean_brand_name in self.brand_names():
+            sub_property_id = self.rng.choice(list(self.sub_properties))
+            property_id = self.sub_properties[sub_property_id]
+            self.seller_properties[seller_id] = property_id
+
+            english_brand_name = ''.join(self.rng.choices(string.ascii_lowercase, k=6)) + str(seller_id)
+            # 대부분 입점 상태, 일부는 입점신청/휴점
+            status = self.rng.choices([2, 1, 4, 5], weights=[85, 8, 5, 2])[0]
+            created_at = self.random_datetime(0, 0.5)
+            center = f"02{self.rng.randint(1000000, 9999999)}"
+
+            sellers.add((
+                seller_id, self.seller_account_id(seller_id), property_id, sub_property_id, status,
+                f"seller{seller_id}", self.password, korean_brand_name, english_brand_name, center,
+                f"https://images.brandi.local/seller-profile-image/{seller_id}.jpg",
+                f"{korean_brand_name}의 감성 데일리룩", f"{self.rng.randint(10000, 63999)}",
+                f"{self.rng.choice(CITIES)} {self.rng.choice(ROADS)} {self.rng.randint(1, 999)}",
+                f"{self.rng.randint(2, 15)}층", '10:00:00', '18:00:00', created_at
+            ))
+            sellers_history.add((
+                seller_id, self.seller_account_id(seller_id), property_id, sub_property_id, status,
+                korean_brand_name, english_brand_name, center, created_at
+            ))
+
+            for _ in range(self.rng.randint(1, 3)):
+                manager_id += 1
+                name = self.person_name()
+                phone = self.phone()
+                email = f"manager{manager_id}@{english_brand_name}.com"
+                managers.add((manager_id, seller_id, name, phone, email, created_at))
+                managers_history.add((manager_id, name, phone, email, self.seller_account_id(seller_id), created_at))
+
+        self.finish(sellers, sellers_history, managers, managers_history)
+
+    def product_content(self, product_id, title):
+        # 대부분 짧은 상세 설명, 일부 상품은 긴 HTML 상세 설명
+        paragraphs = self.rng.choices([2, 5, 20, 80], weights=[50, 35, 12, 3])[0]
+        body = ''.join(
+            f"<p>{title} 상세 설명 {idx + 1}. 부드러운 소재로 편안한 착용감을 느낄 수 있는 아이템입니다.</p>"
+            f"<img src=\"https://images.brandi.local/product-images-in-html/{product_id}/{idx}.jpg\">"
+            for idx in range(paragraphs)
+        )
+        return f"<div class=\"detail\">{body}</div>"
+
+    def generate_products(self):
+        print("products")
+        products = self.loader('products', [
+            'id', 'seller_id', 'property_id', 'category_id', 'sub_category_id', 'is_selling', 'is_displayed', 'title',
+            'simple_description', 'content', 'product_code', 'manufacturer', 'date_of_manufacture', 'origin', 'price',
+            'discount_rate', 'discount_start_date', 'discount_end_date', 'effective_discount_rate', 'effective_price',
+            'min_amount', 'max_amount', 'created_at'
+        ])
+        product_history = self.loader('product_history', [
+            'product_id', 'modify_account_id', 'is_selling', 'is_displayed', 'title', 'simple_description', 'content',
+            'price', 'discount_rate', 'discount_start_date', 'discount_end_date', 'min_amount', 'max_amount', 'created_at'
+        ])
+        options = self.loader('options', ['id', 'product_id', 'color_id', 'size_id', 'price', 'stock', 'option_code', 'created_at'])
+        options_history = self.loader('options_history', ['option_id', 'price', 'modify_account_id', 'created_at'])
+        product_images = self.loader('product_images', ['product_id', 'image_url', 'is_represent', 'created_account_id', 'created_at'])
+
+        seller_weights = zipf_cum_weights(self.sellers, 1.1)
+        self.product_prices = array('i', [0]) * (self.products + 1)
+        # 주문 시점 할인율 계산용 {상품 id: (할인율 bp, 할인 시작일, 할인 종료일)}, 할인 상품만
+        self.product_discounts = dict()
+        option_id = 0
+
+        for product_id in range(1, self.products + 1):
+            seller_id = pick(self.rng, seller_weights)
+            account_id = self.seller_account_id(seller_id)
+            property_id = self.seller_properties[seller_id]
+            category_id = self.rng.choice(self.categories[property_id])
+            sub_category_id, sub_category_name = self.rng.choice(self.sub_categories[category_id])
+
+            title = f"{self.rng.choice(ADJECTIVES)} {self.rng.choice(MATERIALS)} {sub_category_name}"
+            content = self.product_content(product_id, title)
+            price = self.rng.randrange(9900, 150000, 100)
+            self.product_prices[product_id] = price
+
+            # 상품 등록일은 id 순서대로 증가
+            created_at = self.now - timedelta(days=self.days) + timedelta(seconds=int(self.days * 86400 * product_id / self.products))
+
+            # 30% 는 할인 상품, 그 중 일부는 할인 기간이 현재와 겹침
+            if self.rng.random() < 0.3:
+                discount_rate = self.rng.choice(['0.05', '0.10', '0.15', '0.20', '0.30', '0.50'])
+                discount_start_date = created_at + timedelta(days=self.rng.randint(0, 30))
+                discount_end_date = discount_start_date + timedelta(days=self.rng.randint(3, 60))
+            else:
+                discount_rate = '0'
+                discount_start_date = START_DATE
+                discount_end_date = END_DATE
+
+            if discount_rate != '0':
+                self.product_discounts[product_id] = (rate_to_bp(discount_rate), discount_start_date, discount_end_date)
+
+            # 현재 적용 중인 할인율, 할인가 (migration 006의 backfill, discount scheduler와 같은 계산)
+            if discount_start_date <= self.now <= discount_end_date:
+                effective_discount_rate = discount_rate
+            else:
+                effective_discount_rate = '0'
+            effective_price = discounted_price(price, rate_to_bp(effective_discount_rate))
+
+            is_selling = int(self.rng.random() < 0.9)
+            is_displayed = int(self.rng.random() < 0.85)
+            product_code = unique_code(self.rng, product_id, 20)
+
+            products.add((
+                product_id, seller_id, property_id, category_id, sub_category_id, is_selling, is_displayed, title,
+                f"{title} 한정 특가", content, product_code, PRODUCT_INFO_NOTICE, PRODUCT_INFO_NOTICE, PRODUCT_INFO_NOTICE,
+                price, discount_rate, discount_start_date, discount_end_date, effective_discount_rate, effective_price,
+                1, 20, created_at
+            ))
+            product_history.add((
+                product_id, account_id, is_selling, is_displayed, title, f"{title} 한정 특가", content, price,
+                discount_rate, discount_start_date, discount_end_date, 1, 20, created_at
+            ))
+
+            colors = self.rng.sample(self.colors, self.rng.randint(1, 3))
+            sizes = self.rng.sample(self.sizes, self.rng.randint(1, 4))
+            for color_id in colors:
+                for size_id in sizes:
+                    option_id += 1
+                    options.add((
+                        option_id, product_id, color_id, size_id, price, self.rng.randint(0, 500),
+                        unique_code(self.rng, option_id, 25), created_at
+                    ))
+                    options_history.add((option_id, price, account_id, created_at))
+
+            for idx in range(self.rng.randint(1, 5)):
+                product_images.add((
+                    product_id, f"https://images.brandi.local/product-images/{account_id}/{product_id}/{idx}.jpg",
+                    int(idx == 0), account_id, created_at
+                ))
+
+        self.finish(products, product_history, options, options_history, product_images)
+
+    def order_status(self, created_at):
+        # 2주 지난 주문은 대부분 구매확정, 최근 주문은 상품준비~배송완료
+        if self.now - created_at > timedelta(days=14):
+            return self.rng.choices([4, 7, 9], weights=[90, 6, 4])[0]
+        return self.rng.choices([1, 2, 3, 6, 8, 11], weights=[40, 25, 20, 5, 3, 7])[0]
+
+    def order_discount_rate_bp(self, product_id, created_at):
+        # 주문일이 상품 할인 기간 안이면 할인율 (migration 012 trigger가 주문 입력 시점에 저장하는 값)
+        discount = self.product_discounts.get(product_id)
+        if discount and discount[1] <= created_at <= discount[2]:
+            return discount[0]
+        return 0
+
+    def generate_orders(self):
+        print("orders")
+        orders = self.loader('orders', [
+            'id', 'user_id', 'order_number', 'order_username', 'delivery_memo_id', 'delivery_memo_request', 'created_at'
+        ])
+        orders_detail = self.loader('orders_detail', [
+            'id', 'order_id', 'product_id', 'address_id', 'order_status_type_id', 'detail_order_number', 'quantity',
+            'price', 'discount_rate_bp', 'created_at', 'updated_at'
+        ])
+        order_detail_history = self.loader('order_detail_history', [
+            'order_detail_id', 'order_status_type_id', 'address_id', 'modify_account_id', 'price', 'updated_at'
+        ])
+
+        product_weights = zipf_cum_weights(self.products, 0.8)
+        user_weights = zipf_cum_weights(self.users, 0.5)
+        detail_id = 0
+
+        for order_id in range(1, self.orders + 1):
+            user_id = pick(self.rng, user_weights)
+            # 주문일은 id 순서대로 증가
+            created_at = self.now - timedelta(days=self.days) + timedelta(seconds=int(self.days * 86400 * order_id / self.orders))
+            memo_request = '공동현관 비밀번호 1234#' if self.rng.random() < 0.05 else None
+
+            orders.add((
+                order_id, user_id, f"{created_at:%Y%m%d}{order_id:010d}", self.person_name(),
+                self.rng.choice(self.delivery_memos), memo_request, created_at
+            ))
+
+            for _ in range(self.rng.choices([1, 2, 3, 4], weights=[40, 30, 20, 10])[0]):
+                detail_id += 1
+                product_id = pick(self.rng, product_weights)
+                status = self.order_status(created_at)
+                price = self.product_prices[product_id]
+                discount_rate_bp = self.order_discount_rate_bp(product_id, created_at)
+                updated_at = min(self.now, created_at + timedelta(days=self.rng.randint(0, 14)))
+
+                orders_detail.add((
+                    detail_id, order_id, product_id, user_id, status, f"{created_at:%Y%m%d}{detail_id:012d}",
+                    self.rng.choices([1, 2, 3], weights=[80, 15, 5])[0], price, discount_rate_bp, created_at, updated_at
+                ))
+                order_detail_history.add((detail_id, status, user_id, self.user_account_id(user_id), price, updated_at))
+
+        self.finish(orders, orders_detail, order_detail_history)
+
+    def run(self):
+        self.load_reference()
+        self.generate_accounts()
+        self.generate_sellers()
+        self.generate_products()
+        self.generate_orders()
+
+
+def apply_schema(conn):
+    with open(SCHEMA_PATH, encoding='utf-8') as f:
+        statements = [statement.strip() for statement in f.read().split(';\n')]
+
+    with conn.cursor() as cursor:
+        for statement in statements:
+            lines = [line for line in statement.splitlines() if not line.startswith('--')]
+            if ''.join(lines).strip():
+                cursor.execute('\n'.join(lines))
+    conn.commit()
+
+
+def seed(args):
+    if not args.database.endswith(DISPOSABLE_DATABASE_SUFFIXES) and not args.yes:
+        raise SystemExit(
+            f"'{args.database}' 의 모든 테이블을 삭제하고 다시 만듭니다. "
+            f"이름이 {', '.join(DISPOSABLE_DATABASE_SUFFIXES)} 로 끝나는 database를 사용하거나 --yes 를 함께 지정하세요."
+        )
+
+    for key, value in SCALES[args.scale].items():
+        if getattr(args, key) is None:
+            setattr(args, key, value)
+
+    conn = pymysql.connect(
+        host=DB["HOST"],
+        user=DB["USER"],
+        password=DB["PASSWORD"],
+        charset='utf8mb4'
+    )
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{args.database}` DEFAULT CHARACTER SET utf8mb4")
+    finally:
+        conn.close()
+
+    conn = pymysql.connect(
+        host=DB["HOST"],
+        user=DB["USER"],
+        password=DB["PASSWORD"],
+        database=args.database,
+        cursorclass=pymysql.cursors.DictCursor,
+        charset='utf8mb4',
+        local_infile=args.method == 'load-data',
+        autocommit=False
+    )
+
+    start = time.perf_counter()
+    try:
+        apply_schema(conn)
+
+        with conn.cursor() as cursor:
+            cursor.execute("SET foreign_key_checks = 0, unique_checks = 0")
+
+        generator = DataGenerator(conn, args)
+        generator.run()
+
+        with conn.cursor() as cursor:
+            cursor.execute("SET foreign_key_checks = 1, unique_checks = 1")
+
+        total = sum(loader.count for loader in generator.loaders)
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"loaded {total:,} rows into {args.database} in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+
+
+def add_arguments(parser):
+    parser.add_argument('--database', required=True, help='데이터를 만들 database (모든 테이블을 삭제 후 다시 생성)')
+    parser.add_argument('--yes', action='store_true', help='이름이 _bench, _test 로 끝나지 않는 database도 사용')
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--sellers', type=int)
+    parser.add_argument('--products', type=int)
+    parser.add_argument('--users', type=int)
+    parser.add_argument('--orders', type=int, help='주문 수 (주문 상세는 주문당 평균 2개)')
+    parser.add_argument('--days', type=int, default=365, help='상품 등록일, 주문일 분포 기간')
+    parser.add_argument('--method', choices=['load-data', 'insert'], default='load-data')
+    parser.add_argument('--batch-size', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=20210501, help='random seed (같은 값이면 같은 데이터 생성)')
@@ -0,0 +1,320 @@
+"""endpoint benchmark
+
+create_app()의 test client로 주요 어드민 API를 반복 호출하고
+latency percentile, 요청당 쿼리 수, 요청당 peak memory를 측정해 JSON으로 저장합니다.
+로컬 MySQL(config.DB, --database 로 database 변경)에 데이터가 준비되어 있어야 합니다.
+
+    cd backend
+    python -m benchmarks run --database brandi_bench --iterations 50 --output before.json
+    python -m benchmarks run --database brandi_bench --iterations 50 --output after.json
+    python -m benchmarks compare before.json after.json
+"""
+import json
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from io import BytesIO
+
+import jwt
+
+from config import DB, SECRET_KEY
+from connection import get_connection
+from utils.constant import MASTER
+from utils.query_detector import QueryRecorder
+
+EXCEL_HEADER = {'Content-Type': 'application/vnd.ms-excel'}
+
+# 상품 등록 시 업로드할 이미지 (1x1 GIF)
+SAMPLE_IMAGE = (
+    b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00'
+    b',\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+)
+
+# 데이터 규모 기록용 테이블
+SCALE_TABLES = ('sellers', 'products', 'options', 'product_images', 'orders', 'orders_detail')
+
+
+def create_token(account_id):
+    return jwt.encode({'account_id': account_id}, SECRET_KEY, algorithm='HS256')
+
+
+def load_fixtures(conn, seller_account_id=None):
+    """benchmark 요청에 사용할 계정, 상품, 주문 데이터를 DB에서 가져온다."""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT id FROM account WHERE account_type_id = %s ORDER BY id LIMIT 1", MASTER)
+        master = cursor.fetchone()
+
+        # 셀러 계정을 지정하지 않으면 상품이 가장 많은 셀러를 사용
+        if seller_account_id:
+            cursor.execute("SELECT id AS seller_id, account_id FROM sellers WHERE account_id = %s", seller_account_id)
+        else:
+            cursor.execute("""
+                SELECT
+                    s.id AS seller_id,
+                    s.account_id
+                FROM
+                    sellers AS s
+                INNER JOIN
+                    products AS p ON p.seller_id = s.id
+                GROUP BY
+                    s.id
+                ORDER BY
+                    COUNT(*) DESC
+                LIMIT 1
+            """)
+        seller = cursor.fetchone()
+
+        cursor.execute("""
+            SELECT
+                s.id AS seller_id,
+                s.property_id,
+                c.id AS category_id,
+                sc.id AS sub_category_id
+            FROM
+                sellers AS s
+            INNER JOIN
+                category AS c ON c.property_id = s.property_id
+            INNER JOIN
+                sub_category AS sc ON sc.category_id = c.id
+            WHERE
+                s.id = %(seller_id)s
+            LIMIT 1
+        """, seller)
+        product_meta = cursor.fetchone()
+
+        cursor.execute("SELECT id FROM color ORDER BY id LIMIT 1")
+        color = cursor.fetchone()
+        cursor.execute("SELECT id FROM size ORDER BY id LIMIT 1")
+        size = cursor.fetchone()
+
+        cursor.execute("SELECT product_code FROM products ORDER BY id DESC LIMIT 1")
+        product = cursor.fetchone()
+
+        cursor.execute("""
+            SELECT
+                id AS orders_detail_id,
+                order_status_type_id
+            FROM
+                orders_detail
+            WHERE
+                order_status_type_id = 1
+            ORDER BY
+                id DESC
+            LIMIT 50
+        """)
+        order_details = cursor.fetchall()
+
+        scale = dict()
+        for table in SCALE_TABLES:
+            cursor.execute(f"SELECT COUNT(*) AS count FROM {table}")
+            scale[table] = cursor.fetchone()['count']
+
+    return {
+        'master_token' : create_token(master['id']),
+        'seller_token' : create_token(seller['account_id']),
+        'product_meta' : product_meta,
+        'color_id' : color['id'],
+        'size_id' : size['id'],
+        'product_code' : product['product_code'],
+        'order_details' : order_details,
+        'scale' : scale
+    }
+
+
+def product_payload(fixtures):
+    meta = fixtures['product_meta']
+    payload = {
+        'basic_info': {
+            'seller_id' : meta['seller_id'],
+            'property_id' : meta['property_id'],
+            'category_id' : meta['category_id'],
+            'sub_category_id' : meta['sub_category_id'],
+            'is_selling' : 1,
+            'is_displayed' : 1,
+            'title' : '벤치마크 상품',
+            'content' : '<p>벤치마크 상품 상세</p>'
+        },
+        'selling_info': {
+            'price' : 39000
+        },
+        'option_info': [
+            {
+                'color_id' : fixtures['color_id'],
+                'size_id' : fixtures['size_id'],
+                'price' : 39000,
+                'stock' : 100
+            }
+        ]
+    }
+    return {
+        'payload' : json.dumps(payload),
+        'file' : (BytesIO(SAMPLE_IMAGE), 'benchmark.gif')
+    }
+
+
+def scenarios(fixtures):
+    """(이름, 쓰기 여부, 요청 함수) 목록
+
+    쓰기 시나리오는 DB와 S3에 실제로 데이터를 남기므로 --include-writes 를 줄 때만 실행한다.
+    """
+    master = {'Authorization': fixtures['master_token']}
+    seller = {'Authorization': fixtures['seller_token']}
+    end_date = date.today()
+    start_date = end_date - timedelta(days=7)
+    order_params = {
+        'start_date' : start_date.strftime('%Y-%m-%d'),
+        'end_date' : end_date.strftime('%Y-%m-%d'),
+        'order_status_type_id' : 1,
+        'limit' : 50
+    }
+
+    return [
+        ('products_list', False, lambda client: client.get(
+            '/products', query_string={'limit': 50}, headers=master)),
+        ('products_filter', False, lambda client: client.get(
+            '/products', query_string={'limit': 50, 'selling': 1, 'displayed': 1, 'discount': 1,
+                                       'start_date': start_date.strftime('%Y-%m-%d')}, headers=master)),
+        ('products_export', False, lambda client: client.get(
+            '/products', query_string={'limit': 50}, headers={**master, **EXCEL_HEADER})),
+        ('product_detail', False, lambda client: client.get(
+            f"/products/{fixtures['product_code']}", headers=master)),
+        ('orders_list', False, lambda client: client.get(
+            '/orders', query_string=order_params, headers=master)),
+        ('sellers_list', False, lambda client: client.get(
+            '/sellers', query_string={'limit': 50}, headers=master)),
+        ('dashboard_seller', False, lambda client: client.get(
+            '/dashboard/seller', headers=seller)),
+        ('orders_patch_bulk', True, lambda client: client.patch(
+            '/orders', json=fixtures['order_details'], headers=master)),
+        ('product_create', True, lambda client: client.post(
+            '/products', data=product_payload(fixtures), headers=master, content_type='multipart/form-data')),
+    ]
+
+
+def percentile(values, percent):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(client, request, iterations, warmup):
+    for _ in range(warmup):
+        request(client)
+
+    latencies = list()
+    queries = list()
+    peaks = list()
+    errors = 0
+
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            with QueryRecorder() as recorder:
+                start = time.perf_counter()
+                response = request(client)
+                latencies.append((time.perf_counter() - start) * 1000)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            queries.append(len(recorder))
+            if response.status_code >= 400:
+                errors += 1
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'iterations' : iterations,
+        'errors' : errors,
+        'latency_ms' : {
+            'p50' : percentile(latencies, 50),
+            'p90' : percentile(latencies, 90),
+            'p99' : percentile(latencies, 99),
+            'max' : max(latencies),
+            'mean' : statistics.mean(latencies)
+        },
+        'queries_per_request' : {
+            'mean' : statistics.mean(queries),
+            'max' : max(queries)
+        },
+        'peak_memory_kb' : max(peaks) / 1024
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except Exception:
+        return None
+
+
+def run(args):
+    from admin.app import create_app
+
+    if args.database:
+        DB['DATABASE'] = args.database
+
+    app = create_app()
+    client = app.test_client()
+
+    conn = get_connection()
+    try:
+        fixtures = load_fixtures(conn, args.seller_account_id)
+    finally:
+        conn.close()
+
+    results = {
+        'meta': {
+            'created_at' : datetime.now().isoformat(timespec='seconds'),
+            'revision' : git_revision(),
+            'iterations' : args.iterations,
+            'scale' : fixtures['scale']
+        },
+        'scenarios': dict()
+    }
+
+    for name, is_write, request in scenarios(fixtures):
+        if args.only and name not in args.only:
+            continue
+        if is_write and not args.include_writes:
+            continue
+
+        result = measure(client, request, args.iterations, args.warmup)
+        results['scenarios'][name] = result
+        print(f"{name:<20} p50 {result['latency_ms']['p50']:>8.1f}ms  p99 {result['latency_ms']['p99']:>8.1f}ms  "
+              f"queries {result['queries_per_request']['mean']:>6.1f}  peak {result['peak_memory_kb']:>9.1f}KB  "
+              f"errors {result['errors']}")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"saved {args.output}")
+
+
+def compare(args):
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+
+    def delta(old, new):
+        if not old:
+            return '     n/a'
+        return f"{(new - old) / old * 100:>+7.1f}%"
+
+    print(f"before: {before['meta']['revision']} {before['meta']['created_at']}")
+    print(f"after : {after['meta']['revision']} {after['meta']['created_at']}")
+    print(f"{'scenario':<20} {'p50 ms':>18} {'p99 ms':>18} {'queries':>16} {'peak KB':>18}")
+
+    for name, new in after['scenarios'].items():
+        old = before['scenarios'].get(name)
+        if not old:
+            print(f"{name:<20} (new)")
+            continue
+
+        columns = (
+            (old['latency_ms']['p50'], new['latency_ms']['p50']),
+            (old['latency_ms']['p99'], new['latency_ms']['p99']),
+            (old['queries_per_request']['mean'], new['queries_per_request']['mean']),
+            (old['peak_memory_kb'], new['peak_memory_kb'])
+        )
+        print(f"{name:<20} " + ' '.join(f"{new_value:>9.1f} {delta(old_value, new_value)}" for old_value, new_value in columns))
@@ -0,0 +1,309 @@
+"""어드민 API 부하 테스트
+
+실제 어드민 사용 패턴을 섞어서 HTTP로 요청하고, interval 마다 처리량, 에러율, latency percentile을 출력합니다.
+
+- dashboard : 셀러가 /dashboard/seller 새로고침
+- orders    : 마스터가 날짜 조건으로 /orders 페이지 이동
+- patch     : 주문 상태 일괄 변경 (PATCH /orders)
+- create    : 이미지를 포함한 multipart 상품 등록 (POST /products)
+- products  : 상품 리스트 조회
+
+상품 등록은 S3에 업로드하므로 config.S3_ENDPOINT_URL 로 로컬 S3 호환 서버(moto_server, MinIO 등)를 지정해서 실행합니다.
+DB 데이터는 python -m benchmarks seed 로 준비합니다.
+
+    cd backend
+    # 이미 떠 있는 서버에 요청
+    python -m benchmarks loadtest --base-url http://127.0.0.1:5000 --concurrency 50 --duration 120
+    # gunicorn worker 수를 바꿔가며 실행
+    python -m benchmarks loadtest --gunicorn-workers 4 --concurrency 50 --duration 120 --output w4.json
+"""
+import json
+import random
+import socket
+import statistics
+import subprocess
+import threading
+import time
+import uuid
+from datetime import date, timedelta
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode, urlparse
+from urllib.request import Request, urlopen
+
+from benchmarks import BASE_DIR
+from benchmarks.endpoints import SAMPLE_IMAGE, create_token, load_fixtures, percentile, product_payload
+from connection import get_connection
+
+DEFAULT_MIX = 'dashboard=40,orders=30,products=15,patch=10,create=5'
+
+
+def parse_mix(value):
+    mix = dict()
+    for item in value.split(','):
+        name, weight = item.split('=')
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def load_seller_tokens(conn, count):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT account_id FROM sellers WHERE is_deleted = 0 ORDER BY id LIMIT %s", count)
+        return [create_token(row['account_id']) for row in cursor.fetchall()]
+
+
+def load_patch_targets(conn, count):
+    # 상품준비(1), 배송중(2) 상태의 주문 상세만 사용해 두 상태를 오가며 변경
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT
+                id AS orders_detail_id
+            FROM
+                orders_detail
+            WHERE
+                order_status_type_id IN (1, 2)
+            ORDER BY
+                id DESC
+            LIMIT %s
+        """, count)
+        return [row['orders_detail_id'] for row in cursor.fetchall()]
+
+
+def encode_multipart(fields):
+    boundary = uuid.uuid4().hex
+    body = bytearray()
+    for name, value in fields.items():
+        body += f'--{boundary}\r\n'.encode()
+        if isinstance(value, tuple):
+            filename, content = value
+            body += f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'.encode()
+            body += b'Content-Type: application/octet-stream\r\n\r\n'
+            body += content
+        else:
+            body += f'Content-Disposition: form-data; name="{name}"\r\n\r\n'.encode()
+            body += value.encode('utf-8')
+        body += b'\r\n'
+    body += f'--{boundary}--\r\n'.encode()
+    return bytes(body), f'multipart/form-data; boundary={boundary}'
+
+
+class Workload:
+    """시나리오별 요청(method, path, body, headers)을 만든다."""
+    def __init__(self, fixtures, seller_tokens, patch_targets, rng):
+        self.fixtures = fixtures
+        self.master = {'Authorization': fixtures['master_token']}
+        self.seller_tokens = seller_tokens
+        self.patch_targets = patch_targets
+        self.rng = rng
+
+    def dashboard(self):
+        return 'GET', '/dashboard/seller', None, {'Authorization': self.rng.choice(self.seller_tokens)}
+
+    def orders(self):
+        end_date = date.today() - timedelta(days=self.rng.randint(0, 30))
+        start_date = end_date - timedelta(days=self.rng.choice([1, 7, 30]))
+        query = {
+            'start_date' : start_date.strftime('%Y-%m-%d'),
+            'end_date' : end_date.strftime('%Y-%m-%d'),
+            'order_status_type_id' : self.rng.choice([1, 2, 3, 4]),
+            'page' : self.rng.randint(1, 5),
+            'limit' : 50
+        }
+        return 'GET', f'/orders?{urlencode(query)}', None, self.master
+
+    def products(self):
+        query = {'page': self.rng.randint(1, 10), 'limit': 50}
+        if self.rng.random() < 0.5:
+            query['selling'] = 1
+        return 'GET', f'/products?{urlencode(query)}', None, self.master
+
+    def patch(self):
+        targets = self.rng.sample(self.patch_targets, min(20, len(self.patch_targets)))
+        status = self.rng.choice([1, 2])
+        body = json.dumps([{'orders_detail_id': target, 'order_status_type_id': status} for target in targets])
+        return 'PATCH', '/orders', body.encode('utf-8'), {**self.master, 'Content-Type': 'application/json'}
+
+    def create(self):
+        fields = product_payload(self.fixtures)
+        body, content_type = encode_multipart({
+            'payload' : fields['payload'],
+            'file' : (f'loadtest-{uuid.uuid4().hex}.gif', SAMPLE_IMAGE)
+        })
+        return 'POST', '/products', body, {**self.master, 'Content-Type': content_type}
+
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = list()
+
+    def add(self, timestamp, scenario, latency, ok):
+        with self.lock:
+            self.events.append((timestamp, scenario, latency, ok))
+
+    def snapshot(self, since):
+        with self.lock:
+            return [event for event in self.events if event[0] >= since]
+
+
+def summarize(events, seconds):
+    if not events:
+        return {'requests': 0, 'throughput': 0, 'error_rate': 0}
+
+    latencies = [event[2] for event in events]
+    errors = sum(1 for event in events if not event[3])
+    return {
+        'requests' : len(events),
+        'throughput' : len(events) / seconds,
+        'error_rate' : errors / len(events),
+        'latency_ms' : {
+            'p50' : percentile(latencies, 50),
+            'p95' : percentile(latencies, 95),
+            'p99' : percentile(latencies, 99),
+            'mean' : statistics.mean(latencies)
+        }
+    }
+
+
+def virtual_user(base_url, workload, mix, think_time, stop_at, stats, timeout):
+    names = list(mix)
+    weights = list(mix.values())
+    while time.time() < stop_at:
+        scenario = workload.rng.choices(names, weights=weights)[0]
+        method, path, body, headers = getattr(workload, scenario)()
+
+        start = time.perf_counter()
+        try:
+            with urlopen(Request(base_url + path, data=body, headers=headers, method=method), timeout=timeout) as response:
+                response.read()
+                ok = response.status < 400
+        except HTTPError as e:
+            e.read()
+            ok = False
+        except (URLError, socket.timeout, ConnectionError):
+            ok = False
+        stats.add(time.time(), scenario, (time.perf_counter() - start) * 1000, ok)
+
+        # think time은 평균값을 갖는 지수분포
+        if think_time:
+            time.sleep(workload.rng.expovariate(1 / think_time))
+
+
+def start_gunicorn(base_url, workers, threads):
+    host, port = urlparse(base_url).hostname, urlparse(base_url).port
+    process = subprocess.Popen([
+        'gunicorn', '--chdir', f'{BASE_DIR}/admin', '--workers', str(workers), '--threads', str(threads),
+        '--bind', f'{host}:{port}', 'app:create_app()'
+    ])
+
+    # 서버가 뜰 때까지 대기
+    for _ in range(100):
+        try:
+            socket.create_connection((host, port), timeout=0.1).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+
+    process.terminate()
+    raise RuntimeError('gunicorn did not start')
+
+
+def loadtest(args):
+    mix = parse_mix(args.mix)
+
+    conn = get_connection()
+    try:
+        fixtures = load_fixtures(conn)
+        seller_tokens = load_seller_tokens(conn, 200)
+        patch_targets = load_patch_targets(conn, 5000)
+    finally:
+        conn.close()
+
+    if not patch_targets:
+        mix.pop('patch', None)
+
+    process = None
+    if args.gunicorn_workers:
+        process = start_gunicorn(args.base_url, args.gunicorn_workers, args.gunicorn_threads)
+
+    stats = Stats()
+    started_at = time.time()
+    stop_at = started_at + args.duration
+    threads = [
+        threading.Thread(
+            target=virtual_user,
+            args=(args.base_url, Workload(fixtures, seller_tokens, patch_targets, random.Random(idx)),
+                  mix, args.think_time, stop_at, stats, args.timeout),
+            daemon=True
+        )
+        for idx in range(args.concurrency)
+    ]
+
+    timeline = list()
+    try:
+        for thread in threads:
+            thread.start()
+
+        print(f"{'time':>6} {'req/s':>8} {'errors':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        window_start = started_at
+        while time.time() < stop_at:
+            time.sleep(min(args.interval, max(0, stop_at - time.time())))
+            now = time.time()
+            window = summarize([event for event in stats.snapshot(window_start) if event[0] < now], now - window_start)
+            window['elapsed'] = round(now - started_at)
+            timeline.append(window)
+            window_start = now
+
+            if window['requests']:
+                print(f"{window['elapsed']:>5}s {window['throughput']:>8.1f} {window['error_rate']:>7.1%} "
+                      f"{window['latency_ms']['p50']:>8.1f} {window['latency_ms']['p95']:>8.1f} {window['latency_ms']['p99']:>8.1f}")
+
+        for thread in threads:
+            thread.join()
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+    elapsed = time.time() - started_at
+    events = stats.snapshot(started_at)
+    result = {
+        'meta' : {
+            'base_url' : args.base_url,
+            'concurrency' : args.concurrency,
+            'think_time' : args.think_time,
+            'duration' : args.duration,
+            'gunicorn_workers' : args.gunicorn_workers,
+            'mix' : mix,
+            'scale' : fixtures['scale']
+        },
+        'total' : summarize(events, elapsed),
+        'scenarios' : {
+            name: summarize([event for event in events if event[1] == name], elapsed) for name in mix
+        },
+        'timeline' : timeline
+    }
+
+    print()
+    for name, summary in [('total', result['total'])] + list(result['scenarios'].items()):
+        if summary['requests']:
+            print(f"{name:<10} {summary['requests']:>8} req  {summary['throughput']:>8.1f} req/s  "
+                  f"errors {summary['error_rate']:>6.1%}  p50 {summary['latency_ms']['p50']:>8.1f}ms  "
+                  f"p99 {summary['latency_ms']['p99']:>8.1f}ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"saved {args.output}")
+
+
+def add_arguments(parser):
+    parser.add_argument('--base-url', default='http://127.0.0.1:5000')
+    parser.add_argument('--concurrency', type=int, default=20, help='동시 가상 사용자 수')
+    parser.add_argument('--duration', type=int, default=60, help='실행 시간(초)')
+    parser.add_argument('--think-time', type=float, default=1.0, help='요청 사이 평균 대기 시간(초), 0이면 대기 없음')
+    parser.add_argument('--interval', type=int, default=5, help='중간 결과 출력 주기(초)')
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'시나리오 비율 (기본: {DEFAULT_MIX})')
+    parser.add_argument('--gunicorn-workers', type=int, help='지정하면 base-url 주소로 gunicorn을 띄워서 실행')
+    parser.add_argument('--gunicorn-threads', type=int, default=1)
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
@@ -0,0 +1,112 @@
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+# admin/app.py 와 같은 import 경로(backend, backend/admin)를 사용
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(1, BASE_DIR)
+sys.path.insert(1, os.path.join(BASE_DIR, 'admin'))
+
+from utils.constant import N_PLUS_ONE_THRESHOLD
+from utils.query_detector import QueryRecorder
+
+
+# endpoint별 요청 1회당 허용 쿼리 수 (LoginRequired의 계정 조회, ConditionalGet의 version 조회 포함)
+# 요청 데이터 개수와 상관없이 일정해야 하는 값이므로, 반복 쿼리가 생기면 테스트가 실패한다. (tests/test_query_budgets.py)
+QUERY_BUDGETS = {
+    ('product_view', 'GET')             : 4,
+    ('product_detail_view', 'GET')      : 3,
+    ('order_list_view', 'GET')          : 4,
+    ('order_delivery_view', 'PATCH')    : 7,
+    ('order_view', 'GET')               : 4,
+    ('dashboard_seller', 'GET')         : 4,
+    ('seller_list_view', 'GET')         : 5,
+    ('seller_view', 'GET')              : 3,
+}
+
+# 테스트 database에 생성할 데이터 규모 (benchmarks.datagen)
+TEST_DB_SCALE = {'sellers': 5, 'products': 200, 'users': 50, 'orders': 300}
+
+
+@pytest.fixture(scope='session')
+def seeded_db():
+    """config.DB의 database 이름에 _test를 붙인 database를 db/schema.sql로 다시 만들고 benchmark 데이터(TEST_DB_SCALE)로 채움
+
+    테스트 동안 get_connection이 이 database를 사용하고, benchmarks.endpoints.load_fixtures 결과(token, 상품, 주문 등)를 반환
+    config.py가 없거나 MySQL에 접속할 수 없으면 DB를 사용하는 테스트는 건너뜀
+    """
+    from argparse import Namespace
+
+    import pymysql
+
+    try:
+        from config import DB
+        from connection import get_connection
+        from benchmarks.datagen import seed
+        from benchmarks.endpoints import load_fixtures
+
+        conn = pymysql.connect(host=DB['HOST'], user=DB['USER'], password=DB['PASSWORD'])
+    except (ImportError, KeyError, pymysql.err.OperationalError) as e:
+        pytest.skip(f'테스트 database를 사용할 수 없습니다: {e!r}')
+    conn.close()
+
+    database = f"{DB['DATABASE']}_test"
+    seed(Namespace(database=database, yes=False, scale='small', days=30, method='insert', batch_size=1000, seed=1,
+                   **TEST_DB_SCALE))
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setitem(DB, 'DATABASE', database)
+
+        conn = get_connection()
+        try:
+            fixtures = load_fixtures(conn)
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT detail_order_number FROM orders_detail ORDER BY id LIMIT 1")
+                fixtures['detail_order_number'] = cursor.fetchone()['detail_order_number']
+        finally:
+            conn.close()
+
+        yield fixtures
+
+
+@pytest.fixture
+def app():
+    from admin.app import create_app
+
+    app = create_app()
+    app.testing = True
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def query_budget():
+    """요청 1회에 실행되는 쿼리 수를 검사하는 fixture
+
+        def test_patch_products(client, query_budget):
+            with query_budget('product_view', 'PATCH'):
+                client.patch('/products', json=[...])
+
+    endpoint, method 대신 max_queries에 숫자를 직접 넘길 수도 있다.
+    전체 쿼리 수가 budget을 넘거나, 같은 형태의 쿼리가 N_PLUS_ONE_THRESHOLD 이상 반복되면 실패한다.
+    """
+    @contextmanager
+    def budget(endpoint=None, method='GET', max_queries=None, threshold=N_PLUS_ONE_THRESHOLD):
+        if max_queries is None:
+            max_queries = QUERY_BUDGETS[(endpoint, method)]
+
+        with QueryRecorder(threshold) as recorder:
+            yield recorder
+
+        repeated = recorder.repeated()
+        assert not repeated, f"N+1 query detected\n{recorder.report()}"
+        assert len(recorder) <= max_queries, \
+            f"{len(recorder)} queries executed (budget {max_queries})\n" + '\n'.join(recorder.queries)
+
+    return budget
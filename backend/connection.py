@@ -3,6 +3,13 @@ from boto3 import client
 from botocore.exceptions import ClientError
 
 from config import DB, AWS_ACCESS_KEY, AWS_SECRET_KEY, BUCKET_NAME, REGION
+from utils.query_detector import QueryCountingCursor
+
+# 로컬 S3 호환 서버(moto_server, MinIO 등)를 사용할 때 config에 S3_ENDPOINT_URL 지정
+try:
+    from config import S3_ENDPOINT_URL
+except ImportError:
+    S3_ENDPOINT_URL = None
 
 def get_connection():
     return pymysql.connect(
@@ -10,7 +17,7 @@ def get_connection():
         user=DB["USER"],
         password=DB["PASSWORD"],
         database=DB["DATABASE"],
-        cursorclass=pymysql.cursors.DictCursor,
+        cursorclass=QueryCountingCursor,
         autocommit=False
     )
 
@@ -18,7 +25,8 @@ def get_s3_connection():
     try:
         result = client('s3',
                         aws_access_key_id = AWS_ACCESS_KEY, 
-                        aws_secret_access_key = AWS_SECRET_KEY
+                        aws_secret_access_key = AWS_SECRET_KEY,
+                        endpoint_url = S3_ENDPOINT_URL
                         )
         
         return result
@@ -0,0 +1,17 @@
+-- 상품 파일(csv, xlsx) import 작업 진행 상태
+CREATE TABLE product_import_jobs (
+    id INT NOT NULL AUTO_INCREMENT,
+    account_id INT NOT NULL,
+    filename VARCHAR(200) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'PENDING',
+    total_rows INT NULL,
+    processed_rows INT NOT NULL DEFAULT 0,
+    success_count INT NOT NULL DEFAULT 0,
+    fail_count INT NOT NULL DEFAULT 0,
+    error_file_key VARCHAR(500) NULL,
+    error_message VARCHAR(500) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at DATETIME NULL,
+    PRIMARY KEY (id),
+    KEY ix_product_import_jobs_account_id (account_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -0,0 +1,6 @@
+-- 상품 이미지 사이즈별(thumbnail, list, detail) 변환 이미지 URL
+-- 변환 전에 등록된 이미지는 NULL이고 원본(image_url)을 사용한다.
+ALTER TABLE product_images
+    ADD COLUMN thumbnail_url VARCHAR(500) NULL AFTER image_url,
+    ADD COLUMN list_url VARCHAR(500) NULL AFTER thumbnail_url,
+    ADD COLUMN detail_url VARCHAR(500) NULL AFTER list_url;
@@ -0,0 +1,4 @@
+-- 상품 이미지 내용의 sha256 hash (같은 이미지는 s3에 한 번만 저장하고 url 재사용)
+ALTER TABLE product_images
+    ADD COLUMN content_hash CHAR(64) NULL AFTER detail_url,
+    ADD KEY ix_product_images_content_hash (content_hash);
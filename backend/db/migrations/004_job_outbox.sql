@@ -0,0 +1,19 @@
+-- 요청 transaction이 commit 된 후 worker(admin/worker.py)에서 실행할 작업
+-- 요청 transaction 안에서 insert 하므로 rollback 되면 작업도 생성되지 않음
+CREATE TABLE job_outbox (
+    id BIGINT NOT NULL AUTO_INCREMENT,
+    job_type VARCHAR(50) NOT NULL,
+    payload MEDIUMTEXT NOT NULL,
+    idempotency_key VARCHAR(200) NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'PENDING',
+    attempts INT NOT NULL DEFAULT 0,
+    max_attempts INT NOT NULL,
+    run_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    locked_at DATETIME NULL,
+    last_error VARCHAR(1000) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at DATETIME NULL,
+    PRIMARY KEY (id),
+    UNIQUE KEY uk_job_outbox_idempotency_key (idempotency_key),
+    KEY ix_job_outbox_status_run_at (status, run_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
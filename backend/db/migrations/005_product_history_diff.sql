@@ -0,0 +1,5 @@
+-- 상품 history를 변경된 컬럼만 저장 (utils/history.py)
+-- is_checkpoint = 1: 전체 컬럼 저장 (기존 데이터), 0: changes에 {컬럼: 변경 후 값} JSON만 저장
+ALTER TABLE product_history
+    ADD COLUMN is_checkpoint TINYINT NOT NULL DEFAULT 1 AFTER modify_account_id,
+    ADD COLUMN changes MEDIUMTEXT NULL AFTER is_checkpoint;
@@ -0,0 +1,14 @@
+-- 현재 적용 중인 할인율, 할인가 (할인 기간 시작, 종료 시점에 discount scheduler가 갱신)
+-- 상품 리스트의 할인 여부 필터, 가격 필터, 가격 정렬에 index 사용
+ALTER TABLE products
+    ADD COLUMN effective_discount_rate DECIMAL(3, 2) NOT NULL DEFAULT 0 AFTER discount_end_date,
+    ADD COLUMN effective_price INT NOT NULL DEFAULT 0 AFTER effective_discount_rate,
+    ADD KEY ix_products_effective_price (effective_price),
+    ADD KEY ix_products_effective_discount_rate (effective_discount_rate),
+    ADD KEY ix_products_discount_start_date (discount_start_date),
+    ADD KEY ix_products_discount_end_date (discount_end_date);
+
+UPDATE products AS p
+SET
+    p.effective_discount_rate = IF(p.discount_start_date <= NOW() AND p.discount_end_date >= NOW(), p.discount_rate, 0),
+    p.effective_price = IF(p.discount_start_date <= NOW() AND p.discount_end_date >= NOW(), FLOOR(p.price * (1 - p.discount_rate)), p.price);
@@ -0,0 +1,10 @@
+-- 테이블별 수정 version (목록, 상세 응답 ETag 용)
+-- scope_id = 0은 테이블 전체, 그 외는 셀러 계정(account_id)별 version
+-- 수정하는 transaction 안에서 올리므로 rollback 되면 version도 올라가지 않음
+CREATE TABLE table_versions (
+    table_name VARCHAR(50) NOT NULL,
+    scope_id INT NOT NULL DEFAULT 0,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (table_name, scope_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
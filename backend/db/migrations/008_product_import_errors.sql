@@ -0,0 +1,11 @@
+-- 상품 파일 import에서 등록에 실패한 행 (원본 값, 오류 내용)
+-- 등록한 상품, 진행률과 같은 transaction으로 저장하므로 worker가 다시 실행해도 중복되거나 빠지지 않음
+CREATE TABLE product_import_errors (
+    id BIGINT NOT NULL AUTO_INCREMENT,
+    job_id INT NOT NULL,
+    line_number INT NOT NULL,
+    row_values TEXT NOT NULL,
+    message VARCHAR(500) NOT NULL,
+    PRIMARY KEY (id),
+    KEY ix_product_import_errors_job_id (job_id, line_number)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
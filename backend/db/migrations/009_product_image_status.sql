@@ -0,0 +1,4 @@
+-- 상품 이미지 변환 작업(job_outbox product_images) 상태
+-- PENDING: 업로드 경로의 원본 이미지로 등록된 상태, DONE: 변환 이미지로 교체됨, FAILED: 작업이 최대 시도 횟수를 넘어 실패
+ALTER TABLE products
+    ADD COLUMN image_status VARCHAR(20) NOT NULL DEFAULT 'DONE' AFTER is_displayed;
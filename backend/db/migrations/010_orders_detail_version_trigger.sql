@@ -0,0 +1,24 @@
+-- 주문 상세가 입력되면 상품을 가진 셀러의 주문 version(table_versions, table_name = 'orders')을 올림
+-- store 주문처럼 admin 서비스(VersionService.bump_orders)를 거치지 않는 입력도 주문 리스트, 상세 ETag에 반영
+-- 마스터 계정의 version은 셀러 version의 합이라 기존 scope 0 row는 지우지 않음 (합이 줄어들면 이전 ETag와 같아질 수 있음)
+CREATE TRIGGER tr_orders_detail_bump_version
+AFTER INSERT ON orders_detail
+FOR EACH ROW
+    INSERT INTO
+    table_versions (
+        table_name,
+        scope_id,
+        version
+    )
+    SELECT
+        'orders',
+        s.account_id,
+        1
+    FROM
+        products AS p
+    INNER JOIN
+        sellers AS s ON s.id = p.seller_id
+    WHERE
+        p.id = NEW.product_id
+    ON DUPLICATE KEY UPDATE
+        version = table_versions.version + 1;
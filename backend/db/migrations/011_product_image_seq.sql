@@ -0,0 +1,5 @@
+-- 상품 이미지 변환 작업(job_outbox product_images) 순번
+-- 작업을 추가할 때마다 1 증가하고 작업 payload에 저장, 작업은 상품의 현재 순번과 같을 때만 이미지를 교체
+-- (재시도로 늦게 실행된 이전 수정의 작업이 최신 이미지를 덮어쓰거나 image_status를 DONE으로 바꾸지 않도록)
+ALTER TABLE products
+    ADD COLUMN image_seq INT NOT NULL DEFAULT 0 AFTER image_status;
@@ -0,0 +1,32 @@
+-- 주문 상세에 주문 시점에 적용된 할인율(basis point) 저장
+-- 주문 금액은 주문 당시 가격(price)과 이 할인율로 계산하므로, 이후 상품 할인율, 할인 기간을 수정해도 지난 주문 금액은 바뀌지 않음
+ALTER TABLE orders_detail
+    ADD COLUMN discount_rate_bp INT NULL AFTER price;
+
+-- 기존 주문은 주문 당시 할인 정보가 남아 있지 않아 현재 상품 할인 기간에 주문일이 포함되는지로 추정
+UPDATE orders_detail AS d
+INNER JOIN
+    orders AS o ON o.id = d.order_id
+INNER JOIN
+    products AS p ON p.id = d.product_id
+SET
+    d.discount_rate_bp = CAST(IF(o.created_at BETWEEN p.discount_start_date AND p.discount_end_date, p.discount_rate, 0) * 10000 AS SIGNED)
+WHERE
+    d.discount_rate_bp IS NULL;
+
+-- 할인율을 지정하지 않은 주문 상세(store 주문 등)는 입력 시점의 상품 할인율을 저장
+CREATE TRIGGER tr_orders_detail_discount_rate
+BEFORE INSERT ON orders_detail
+FOR EACH ROW
+    SET NEW.discount_rate_bp = COALESCE(
+        NEW.discount_rate_bp,
+        (
+            SELECT
+                CAST(IF(NOW() BETWEEN p.discount_start_date AND p.discount_end_date, p.discount_rate, 0) * 10000 AS SIGNED)
+            FROM
+                products AS p
+            WHERE
+                p.id = NEW.product_id
+        ),
+        0
+    );
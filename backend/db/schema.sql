@@ -0,0 +1,529 @@
+-- 로컬 개발, benchmark 용 스키마
+-- admin/model 의 DAO 쿼리에서 사용하는 테이블과 컬럼을 기준으로 작성
+-- 이후 변경 사항은 db/migrations 에 추가하고 이 파일에도 반영한다.
+
+SET NAMES utf8mb4;
+SET FOREIGN_KEY_CHECKS = 0;
+
+DROP TABLE IF EXISTS account_type, account, master, users, property, sub_property, category, sub_category,
+    color, size, seller_status_type, seller_status_button, seller_status_type_button, sellers, sellers_history,
+    managers, managers_history, products, product_history, options, options_history, product_images,
+    delivery_memo, address, order_status_type, orders, orders_detail, order_detail_history, product_import_jobs,
+    product_import_errors, job_outbox, table_versions;
+
+SET FOREIGN_KEY_CHECKS = 1;
+
+CREATE TABLE account_type (
+    id INT NOT NULL AUTO_INCREMENT,
+    name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE account (
+    id INT NOT NULL AUTO_INCREMENT,
+    account_type_id INT NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    CONSTRAINT fk_account_account_type FOREIGN KEY (account_type_id) REFERENCES account_type (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE master (
+    id INT NOT NULL AUTO_INCREMENT,
+    account_id INT NOT NULL,
+    email VARCHAR(100) NOT NULL,
+    password VARCHAR(200) NOT NULL,
+    is_deleted TINYINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (id),
+    UNIQUE KEY uk_master_email (email),
+    CONSTRAINT fk_master_account FOREIGN KEY (account_id) REFERENCES account (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE users (
+    id INT NOT NULL AUTO_INCREMENT,
+    account_id INT NOT NULL,
+    name VARCHAR(50) NOT NULL,
+    phone VARCHAR(20) NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    CONSTRAINT fk_users_account FOREIGN KEY (account_id) REFERENCES account (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE property (
+    id INT NOT NULL AUTO_INCREMENT,
+    name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE sub_property (
+    id INT NOT NULL AUTO_INCREMENT,
+    property_id INT NOT NULL,
+    name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT fk_sub_property_property FOREIGN KEY (property_id) REFERENCES property (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE category (
+    id INT NOT NULL AUTO_INCREMENT,
+    property_id INT NOT NULL,
+    name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT fk_category_property FOREIGN KEY (property_id) REFERENCES property (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE sub_category (
+    id INT NOT NULL AUTO_INCREMENT,
+    category_id INT NOT NULL,
+    name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT fk_sub_category_category FOREIGN KEY (category_id) REFERENCES category (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE color (
+    id INT NOT NULL AUTO_INCREMENT,
+    name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE size (
+    id INT NOT NULL AUTO_INCREMENT,
+    name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE seller_status_type (
+    id INT NOT NULL AUTO_INCREMENT,
+    name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE seller_status_button (
+    id INT NOT NULL AUTO_INCREMENT,
+    name VARCHAR(20) NOT NULL,
+    to_status_type_id INT NOT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT fk_seller_status_button_type FOREIGN KEY (to_status_type_id) REFERENCES seller_status_type (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE seller_status_type_button (
+    id INT NOT NULL AUTO_INCREMENT,
+    seller_status_type_id INT NOT NULL,
+    seller_status_button_id INT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT fk_sstb_type FOREIGN KEY (seller_status_type_id) REFERENCES seller_status_type (id),
+    CONSTRAINT fk_sstb_button FOREIGN KEY (seller_status_button_id) REFERENCES seller_status_button (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE sellers (
+    id INT NOT NULL AUTO_INCREMENT,
+    account_id INT NOT NULL,
+    property_id INT NOT NULL,
+    sub_property_id INT NOT NULL,
+    seller_status_type_id INT NOT NULL DEFAULT 1,
+    seller_identification VARCHAR(20) NOT NULL,
+    password VARCHAR(200) NOT NULL,
+    korean_brand_name VARCHAR(50) NOT NULL,
+    english_brand_name VARCHAR(50) NOT NULL,
+    customer_center VARCHAR(50) NULL,
+    customer_center_number VARCHAR(20) NOT NULL,
+    profile_image_url VARCHAR(500) NULL,
+    background_image_url VARCHAR(500) NULL,
+    description VARCHAR(200) NULL,
+    detail_description TEXT NULL,
+    zip_code VARCHAR(10) NULL,
+    address VARCHAR(200) NULL,
+    detail_address VARCHAR(200) NULL,
+    open_at TIME NULL,
+    close_at TIME NULL,
+    delivery_info VARCHAR(500) NULL,
+    exchange_refund_info VARCHAR(500) NULL,
+    is_deleted TINYINT NOT NULL DEFAULT 0,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    UNIQUE KEY uk_sellers_identification (seller_identification),
+    KEY ix_sellers_account_id (account_id),
+    KEY ix_sellers_korean_brand_name (korean_brand_name),
+    KEY ix_sellers_created_at (created_at),
+    CONSTRAINT fk_sellers_account FOREIGN KEY (account_id) REFERENCES account (id),
+    CONSTRAINT fk_sellers_property FOREIGN KEY (property_id) REFERENCES property (id),
+    CONSTRAINT fk_sellers_sub_property FOREIGN KEY (sub_property_id) REFERENCES sub_property (id),
+    CONSTRAINT fk_sellers_status_type FOREIGN KEY (seller_status_type_id) REFERENCES seller_status_type (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE sellers_history (
+    id INT NOT NULL AUTO_INCREMENT,
+    seller_id INT NOT NULL,
+    modify_account_id INT NULL,
+    is_deleted TINYINT NOT NULL DEFAULT 0,
+    property_id INT NULL,
+    sub_property_id INT NULL,
+    seller_status_type_id INT NULL,
+    zip_code VARCHAR(10) NULL,
+    address VARCHAR(200) NULL,
+    detail_address VARCHAR(200) NULL,
+    korean_brand_name VARCHAR(50) NULL,
+    english_brand_name VARCHAR(50) NULL,
+    customer_center_number VARCHAR(20) NULL,
+    profile_image_url VARCHAR(500) NULL,
+    background_image_url VARCHAR(500) NULL,
+    description VARCHAR(200) NULL,
+    detail_description TEXT NULL,
+    open_at TIME NULL,
+    close_at TIME NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    KEY ix_sellers_history_seller_id (seller_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE managers (
+    id INT NOT NULL AUTO_INCREMENT,
+    seller_id INT NOT NULL,
+    name VARCHAR(50) NULL,
+    phone VARCHAR(20) NOT NULL,
+    email VARCHAR(100) NULL,
+    is_deleted TINYINT NOT NULL DEFAULT 0,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    KEY ix_managers_seller_id (seller_id),
+    CONSTRAINT fk_managers_seller FOREIGN KEY (seller_id) REFERENCES sellers (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE managers_history (
+    id INT NOT NULL AUTO_INCREMENT,
+    manager_id INT NOT NULL,
+    name VARCHAR(50) NULL,
+    phone VARCHAR(20) NULL,
+    email VARCHAR(100) NULL,
+    is_deleted TINYINT NOT NULL DEFAULT 0,
+    modify_account_id INT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    KEY ix_managers_history_manager_id (manager_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE products (
+    id INT NOT NULL AUTO_INCREMENT,
+    seller_id INT NOT NULL,
+    property_id INT NOT NULL,
+    category_id INT NOT NULL,
+    sub_category_id INT NOT NULL,
+    is_selling TINYINT NOT NULL DEFAULT 1,
+    is_displayed TINYINT NOT NULL DEFAULT 1,
+    image_status VARCHAR(20) NOT NULL DEFAULT 'DONE',
+    image_seq INT NOT NULL DEFAULT 0,
+    title VARCHAR(100) NOT NULL,
+    simple_description VARCHAR(200) NULL,
+    content MEDIUMTEXT NOT NULL,
+    product_code VARCHAR(30) NOT NULL,
+    manufacturer VARCHAR(50) NULL,
+    date_of_manufacture VARCHAR(30) NULL,
+    origin VARCHAR(50) NULL,
+    price INT NOT NULL,
+    discount_rate DECIMAL(3, 2) NOT NULL DEFAULT 0,
+    discount_start_date DATETIME NULL,
+    discount_end_date DATETIME NULL,
+    effective_discount_rate DECIMAL(3, 2) NOT NULL DEFAULT 0,
+    effective_price INT NOT NULL DEFAULT 0,
+    min_amount INT NOT NULL DEFAULT 1,
+    max_amount INT NOT NULL DEFAULT 20,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    UNIQUE KEY uk_products_product_code (product_code),
+    KEY ix_products_seller_id (seller_id),
+    KEY ix_products_created_at (created_at),
+    KEY ix_products_effective_price (effective_price),
+    KEY ix_products_effective_discount_rate (effective_discount_rate),
+    KEY ix_products_discount_start_date (discount_start_date),
+    KEY ix_products_discount_end_date (discount_end_date),
+    CONSTRAINT fk_products_seller FOREIGN KEY (seller_id) REFERENCES sellers (id),
+    CONSTRAINT fk_products_property FOREIGN KEY (property_id) REFERENCES property (id),
+    CONSTRAINT fk_products_category FOREIGN KEY (category_id) REFERENCES category (id),
+    CONSTRAINT fk_products_sub_category FOREIGN KEY (sub_category_id) REFERENCES sub_category (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE product_history (
+    id INT NOT NULL AUTO_INCREMENT,
+    product_id INT NOT NULL,
+    modify_account_id INT NULL,
+    is_checkpoint TINYINT NOT NULL DEFAULT 1,
+    changes MEDIUMTEXT NULL,
+    is_selling TINYINT NULL,
+    is_displayed TINYINT NULL,
+    title VARCHAR(100) NULL,
+    simple_description VARCHAR(200) NULL,
+    content MEDIUMTEXT NULL,
+    price INT NULL,
+    discount_rate DECIMAL(3, 2) NULL,
+    discount_start_date DATETIME NULL,
+    discount_end_date DATETIME NULL,
+    min_amount INT NULL,
+    max_amount INT NULL,
+    manufacturer VARCHAR(50) NULL,
+    date_of_manufacture VARCHAR(30) NULL,
+    origin VARCHAR(50) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    KEY ix_product_history_product_id (product_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE options (
+    id INT NOT NULL AUTO_INCREMENT,
+    product_id INT NOT NULL,
+    color_id INT NULL,
+    size_id INT NULL,
+    price INT NOT NULL,
+    stock INT NULL,
+    option_code VARCHAR(30) NOT NULL,
+    is_deleted TINYINT NOT NULL DEFAULT 0,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    UNIQUE KEY uk_options_option_code (option_code),
+    KEY ix_options_product_id (product_id),
+    CONSTRAINT fk_options_product FOREIGN KEY (product_id) REFERENCES products (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE options_history (
+    id INT NOT NULL AUTO_INCREMENT,
+    option_id INT NOT NULL,
+    price INT NULL,
+    modify_account_id INT NULL,
+    is_deleted TINYINT NOT NULL DEFAULT 0,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    KEY ix_options_history_option_id (option_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE product_images (
+    id INT NOT NULL AUTO_INCREMENT,
+    product_id INT NOT NULL,
+    image_url VARCHAR(500) NOT NULL,
+    thumbnail_url VARCHAR(500) NULL,
+    list_url VARCHAR(500) NULL,
+    detail_url VARCHAR(500) NULL,
+    content_hash CHAR(64) NULL,
+    is_represent TINYINT NOT NULL DEFAULT 0,
+    is_deleted TINYINT NOT NULL DEFAULT 0,
+    created_account_id INT NULL,
+    deleted_account_id INT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    deleted_at DATETIME NULL,
+    PRIMARY KEY (id),
+    KEY ix_product_images_product_id (product_id),
+    KEY ix_product_images_content_hash (content_hash),
+    CONSTRAINT fk_product_images_product FOREIGN KEY (product_id) REFERENCES products (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE delivery_memo (
+    id INT NOT NULL AUTO_INCREMENT,
+    name VARCHAR(100) NOT NULL,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE address (
+    id INT NOT NULL AUTO_INCREMENT,
+    user_id INT NOT NULL,
+    recipient VARCHAR(50) NOT NULL,
+    phone VARCHAR(20) NOT NULL,
+    zip_code VARCHAR(10) NOT NULL,
+    address VARCHAR(200) NOT NULL,
+    detail_address VARCHAR(200) NOT NULL,
+    PRIMARY KEY (id),
+    KEY ix_address_user_id (user_id),
+    CONSTRAINT fk_address_user FOREIGN KEY (user_id) REFERENCES users (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE order_status_type (
+    id INT NOT NULL AUTO_INCREMENT,
+    name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE orders (
+    id INT NOT NULL AUTO_INCREMENT,
+    user_id INT NOT NULL,
+    order_number VARCHAR(30) NOT NULL,
+    order_username VARCHAR(50) NOT NULL,
+    delivery_memo_id INT NOT NULL,
+    delivery_memo_request VARCHAR(200) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    UNIQUE KEY uk_orders_order_number (order_number),
+    KEY ix_orders_created_at (created_at),
+    CONSTRAINT fk_orders_user FOREIGN KEY (user_id) REFERENCES users (id),
+    CONSTRAINT fk_orders_delivery_memo FOREIGN KEY (delivery_memo_id) REFERENCES delivery_memo (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE orders_detail (
+    id INT NOT NULL AUTO_INCREMENT,
+    order_id INT NOT NULL,
+    product_id INT NOT NULL,
+    address_id INT NOT NULL,
+    order_status_type_id INT NOT NULL,
+    detail_order_number VARCHAR(30) NOT NULL,
+    quantity INT NOT NULL,
+    price INT NOT NULL,
+    discount_rate_bp INT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    UNIQUE KEY uk_orders_detail_number (detail_order_number),
+    KEY ix_orders_detail_order_id (order_id),
+    KEY ix_orders_detail_product_id (product_id),
+    KEY ix_orders_detail_status (order_status_type_id),
+    CONSTRAINT fk_orders_detail_order FOREIGN KEY (order_id) REFERENCES orders (id),
+    CONSTRAINT fk_orders_detail_product FOREIGN KEY (product_id) REFERENCES products (id),
+    CONSTRAINT fk_orders_detail_address FOREIGN KEY (address_id) REFERENCES address (id),
+    CONSTRAINT fk_orders_detail_status FOREIGN KEY (order_status_type_id) REFERENCES order_status_type (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE order_detail_history (
+    id INT NOT NULL AUTO_INCREMENT,
+    order_detail_id INT NOT NULL,
+    order_status_type_id INT NOT NULL,
+    address_id INT NULL,
+    modify_account_id INT NULL,
+    price INT NULL,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    KEY ix_order_detail_history_detail_id (order_detail_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 상품 파일(csv, xlsx) import 작업 진행 상태
+CREATE TABLE product_import_jobs (
+    id INT NOT NULL AUTO_INCREMENT,
+    account_id INT NOT NULL,
+    filename VARCHAR(200) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'PENDING',
+    total_rows INT NULL,
+    processed_rows INT NOT NULL DEFAULT 0,
+    success_count INT NOT NULL DEFAULT 0,
+    fail_count INT NOT NULL DEFAULT 0,
+    error_file_key VARCHAR(500) NULL,
+    error_message VARCHAR(500) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at DATETIME NULL,
+    PRIMARY KEY (id),
+    KEY ix_product_import_jobs_account_id (account_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE product_import_errors (
+    id BIGINT NOT NULL AUTO_INCREMENT,
+    job_id INT NOT NULL,
+    line_number INT NOT NULL,
+    row_values TEXT NOT NULL,
+    message VARCHAR(500) NOT NULL,
+    PRIMARY KEY (id),
+    KEY ix_product_import_errors_job_id (job_id, line_number)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE job_outbox (
+    id BIGINT NOT NULL AUTO_INCREMENT,
+    job_type VARCHAR(50) NOT NULL,
+    payload MEDIUMTEXT NOT NULL,
+    idempotency_key VARCHAR(200) NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'PENDING',
+    attempts INT NOT NULL DEFAULT 0,
+    max_attempts INT NOT NULL,
+    run_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    locked_at DATETIME NULL,
+    last_error VARCHAR(1000) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at DATETIME NULL,
+    PRIMARY KEY (id),
+    UNIQUE KEY uk_job_outbox_idempotency_key (idempotency_key),
+    KEY ix_job_outbox_status_run_at (status, run_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE table_versions (
+    table_name VARCHAR(50) NOT NULL,
+    scope_id INT NOT NULL DEFAULT 0,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (table_name, scope_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 주문 상세가 입력되면 상품을 가진 셀러의 주문 version을 올림 (admin 서비스를 거치지 않는 store 주문 포함)
+CREATE TRIGGER tr_orders_detail_bump_version
+AFTER INSERT ON orders_detail
+FOR EACH ROW
+    INSERT INTO
+    table_versions (
+        table_name,
+        scope_id,
+        version
+    )
+    SELECT
+        'orders',
+        s.account_id,
+        1
+    FROM
+        products AS p
+    INNER JOIN
+        sellers AS s ON s.id = p.seller_id
+    WHERE
+        p.id = NEW.product_id
+    ON DUPLICATE KEY UPDATE
+        version = table_versions.version + 1;
+
+-- 할인율을 지정하지 않은 주문 상세(store 주문 등)는 입력 시점의 상품 할인율(basis point)을 저장
+CREATE TRIGGER tr_orders_detail_discount_rate
+BEFORE INSERT ON orders_detail
+FOR EACH ROW
+    SET NEW.discount_rate_bp = COALESCE(
+        NEW.discount_rate_bp,
+        (
+            SELECT
+                CAST(IF(NOW() BETWEEN p.discount_start_date AND p.discount_end_date, p.discount_rate, 0) * 10000 AS SIGNED)
+            FROM
+                products AS p
+            WHERE
+                p.id = NEW.product_id
+        ),
+        0
+    );
+
+
+-- 기본 데이터
+INSERT INTO account_type (id, name) VALUES (1, '마스터'), (2, '셀러'), (3, '유저');
+
+INSERT INTO order_status_type (id, name) VALUES
+    (1, '상품준비'), (2, '배송중'), (3, '배송완료'), (4, '구매확정'), (5, '반품요청'), (6, '취소요청'),
+    (7, '취소완료'), (8, '환불요청'), (9, '환불완료'), (10, '결제대기'), (11, '결제완료');
+
+INSERT INTO seller_status_type (id, name) VALUES
+    (1, '입점신청'), (2, '입점'), (3, '입점거절'), (4, '휴점'), (5, '퇴점대기'), (6, '퇴점');
+
+INSERT INTO seller_status_button (id, name, to_status_type_id) VALUES
+    (1, '입점 승인', 2), (2, '입점 거절', 3), (3, '휴점 신청', 4), (4, '퇴점 신청 처리', 5),
+    (5, '휴점 해제', 2), (6, '퇴점 확정 처리', 6), (7, '퇴점 철회 처리', 2);
+
+INSERT INTO seller_status_type_button (seller_status_type_id, seller_status_button_id) VALUES
+    (1, 1), (1, 2), (2, 3), (2, 4), (3, NULL), (4, 5), (4, 4), (5, 6), (5, 7), (6, NULL);
+
+INSERT INTO property (id, name) VALUES (1, '쇼핑몰 마켓'), (2, '전문샵 브랜드');
+
+INSERT INTO sub_property (id, property_id, name) VALUES
+    (1, 1, '쇼핑몰'), (2, 1, '마켓'), (3, 1, '로드샵'), (4, 2, '디자이너브랜드'), (5, 2, '제너럴브랜드'),
+    (6, 2, '내셔널브랜드'), (7, 2, '뷰티');
+
+INSERT INTO category (id, property_id, name) VALUES
+    (1, 1, '아우터'), (2, 1, '상의'), (3, 1, '바지'), (4, 1, '원피스'), (5, 1, '스커트'), (6, 1, '신발'),
+    (7, 1, '가방'), (8, 1, '잡화'), (9, 2, '아우터'), (10, 2, '상의'), (11, 2, '바지'), (12, 2, '신발');
+
+INSERT INTO sub_category (category_id, name) VALUES
+    (1, '자켓'), (1, '가디건'), (1, '코트'), (1, '패딩'), (2, '티셔츠'), (2, '셔츠/블라우스'), (2, '니트'),
+    (3, '청바지'), (3, '슬랙스'), (3, '반바지'), (4, '미니원피스'), (4, '롱원피스'), (5, '미니스커트'),
+    (5, '롱스커트'), (6, '스니커즈'), (6, '샌들'), (7, '크로스백'), (7, '토트백'), (8, '모자'), (8, '양말'),
+    (9, '자켓'), (9, '코트'), (10, '티셔츠'), (10, '니트'), (11, '청바지'), (11, '슬랙스'), (12, '스니커즈'),
+    (12, '부츠');
+
+INSERT INTO color (name) VALUES
+    ('블랙'), ('화이트'), ('그레이'), ('네이비'), ('베이지'), ('브라운'), ('레드'), ('핑크'), ('옐로우'),
+    ('그린'), ('블루'), ('퍼플');
+
+INSERT INTO size (name) VALUES ('FREE'), ('XS'), ('S'), ('M'), ('L'), ('XL'), ('XXL');
+
+INSERT INTO delivery_memo (id, name) VALUES
+    (1, '배송 전에 미리 연락 바랍니다.'), (2, '부재시 경비실에 맡겨 주세요.'), (3, '부재시 문 앞에 놓아 주세요.'),
+    (4, '빠른 배송 부탁드립니다.'), (5, '택배함에 보관해 주세요.');
@@ -0,0 +1,86 @@
+"""endpoint별 요청 1회 쿼리 수 테스트
+
+conftest.QUERY_BUDGETS에 지정한 쿼리 수 안에서 요청이 처리되는지, 같은 형태의 쿼리가 반복(N+1)되지 않는지 확인합니다.
+benchmark 데이터를 채운 테스트 database(seeded_db)가 필요하며, MySQL에 접속할 수 없으면 건너뜁니다.
+
+    cd backend
+    python -m pytest -q tests/test_query_budgets.py
+"""
+from datetime import date, timedelta
+
+import pytest
+
+
+def order_params():
+    end_date = date.today()
+    start_date = end_date - timedelta(days=7)
+    return {
+        'start_date' : start_date.strftime('%Y-%m-%d'),
+        'end_date' : end_date.strftime('%Y-%m-%d'),
+        'order_status_type_id' : 1,
+        'limit' : 50
+    }
+
+
+def test_product_list(client, query_budget, seeded_db):
+    with query_budget('product_view', 'GET'):
+        response = client.get('/products', query_string={'limit': 50},
+                              headers={'Authorization': seeded_db['master_token']})
+    assert response.status_code == 200
+
+
+def test_product_detail(client, query_budget, seeded_db):
+    with query_budget('product_detail_view', 'GET'):
+        response = client.get(f"/products/{seeded_db['product_code']}",
+                              headers={'Authorization': seeded_db['master_token']})
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('token', ['master_token', 'seller_token'])
+def test_order_list(client, query_budget, seeded_db, token):
+    with query_budget('order_list_view', 'GET'):
+        response = client.get('/orders', query_string=order_params(),
+                              headers={'Authorization': seeded_db[token]})
+    assert response.status_code == 200
+
+
+def test_order_detail(client, query_budget, seeded_db):
+    with query_budget('order_view', 'GET'):
+        response = client.get(f"/orders/{seeded_db['detail_order_number']}",
+                              headers={'Authorization': seeded_db['master_token']})
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('count, offset', [(1, 0), (20, 1)])
+def test_order_status_patch(client, query_budget, seeded_db, count, offset):
+    # 요청 행 수와 상관없이 쿼리 수가 같아야 한다.
+    body = [
+        {'orders_detail_id': order_detail['orders_detail_id'], 'order_status_type_id': 2}
+        for order_detail in seeded_db['order_details'][offset:offset + count]
+    ]
+    assert len(body) == count
+
+    with query_budget('order_delivery_view', 'PATCH'):
+        response = client.patch('/orders', json=body,
+                                headers={'Authorization': seeded_db['master_token']})
+    assert response.status_code == 200
+
+
+def test_dashboard_seller(client, query_budget, seeded_db):
+    with query_budget('dashboard_seller', 'GET'):
+        response = client.get('/dashboard/seller', headers={'Authorization': seeded_db['seller_token']})
+    assert response.status_code == 200
+
+
+def test_seller_list(client, query_budget, seeded_db):
+    with query_budget('seller_list_view', 'GET'):
+        response = client.get('/sellers', query_string={'limit': 50},
+                              headers={'Authorization': seeded_db['master_token']})
+    assert response.status_code == 200
+
+
+def test_seller_detail(client, query_budget, seeded_db):
+    with query_budget('seller_view', 'GET'):
+        response = client.get(f"/sellers/{seeded_db['product_meta']['seller_id']}",
+                              headers={'Authorization': seeded_db['master_token']})
+    assert response.status_code == 200
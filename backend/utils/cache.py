@@ -0,0 +1,74 @@
+import copy
+import threading
+
+from cachetools import TTLCache
+
+from utils.constant import PRODUCT_DETAIL_CACHE_SIZE, PRODUCT_DETAIL_CACHE_TTL
+
+"""version 기반 캐시 기능입니다.
+    저장된 값마다 원본 데이터의 version(table_versions, 셀러 계정 scope)을 함께 저장하고,
+    꺼낼 때 DB의 현재 version과 같을 때만 사용합니다.
+    version은 수정 transaction 안에서 올라가므로 다른 gunicorn worker, job worker의 수정도 commit 즉시 반영됩니다.
+    프로세스에는 TTLCache에 저장된 값만 유지하므로 저장 개수는 maxsize를 넘지 않습니다.
+"""
+
+class VersionedCache:
+    def __init__(self, maxsize, ttl):
+        self.entries = TTLCache(maxsize, ttl)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def get(self, key, load_versions):
+        """
+        Args:
+            key : 캐시 key
+            load_versions : scope_id -> 현재 version tuple, 저장된 값이 있을 때만 호출 (DB 조회)
+
+        Returns:
+            저장된 값의 복사본, 없거나 저장 후 원본이 수정됐으면 None
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+
+        if entry and load_versions(entry['scope_id']) == entry['versions']:
+            with self.lock:
+                self.hits += 1
+            return copy.deepcopy(entry['value'])
+
+        with self.lock:
+            self.misses += 1
+            if entry:
+                self.stale += 1
+        return None
+
+    def set(self, key, scope_id, versions, value):
+        """
+        Args:
+            key : 캐시 key
+            scope_id : value를 만든 원본 데이터의 version scope (셀러 계정 id)
+            versions (tuple): value와 같은 쿼리에서 읽은 version, 그 이후 수정되면 get에서 사용하지 않음
+            value : 저장할 값 (복사해서 저장)
+        """
+        with self.lock:
+            self.entries[key] = {
+                'scope_id' : scope_id,
+                'versions' : versions,
+                'value' : copy.deepcopy(value)
+            }
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                'size' : len(self.entries),
+                'hits' : self.hits,
+                'misses' : self.misses,
+                'hit_rate' : round(self.hits / total, 4) if total else 0,
+                'stale' : self.stale
+            }
+
+
+# 상품 상세 (GET /products/<product_code>) 캐시
+product_detail_cache = VersionedCache(PRODUCT_DETAIL_CACHE_SIZE, PRODUCT_DETAIL_CACHE_TTL)
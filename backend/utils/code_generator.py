@@ -0,0 +1,93 @@
+import os
+import random
+import threading
+import time
+
+"""상품, 옵션 코드 생성 기능입니다.
+    코드는 16자리 Crockford base32 문자열로 ms 단위 시간(10자리) + worker id(2자리) + sequence(4자리) 입니다.
+    시간 순서대로 증가하기 때문에 product_code, option_code unique index의 오른쪽 끝에 계속 추가되고,
+    random 코드처럼 index 전체에 흩어져서 page split이 생기지 않습니다.
+
+    한 프로세스 안에서는 같은 ms에 sequence를 1씩 올려서 중복되지 않고,
+    프로세스끼리는 worker id로 구분합니다. config.CODE_WORKER_ID(0 ~ 1023)를 프로세스마다 다르게 지정하면
+    중복이 생기지 않고, 지정하지 않으면 프로세스마다 random worker id와 ms마다 random sequence 시작값을 사용합니다.
+    이 경우 드물게 중복될 수 있어서 상품, 옵션 입력(ProductDao)은 코드 unique index 중복이면 새 코드로 다시 입력합니다.
+"""
+
+try:
+    from config import CODE_WORKER_ID
+except ImportError:
+    CODE_WORKER_ID = None
+
+# 숫자 -> 문자 순서가 ASCII 순서와 같아서 문자열 정렬 = 생성 순서
+CROCKFORD_BASE32 = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+
+TIMESTAMP_LENGTH = 10
+WORKER_LENGTH = 2
+SEQUENCE_LENGTH = 4
+
+WORKER_SIZE = 32 ** WORKER_LENGTH
+SEQUENCE_SIZE = 32 ** SEQUENCE_LENGTH
+
+# ms마다 sequence 시작값의 범위, 나머지는 같은 ms 안에서 증가하는 데 사용
+SEQUENCE_START_SIZE = SEQUENCE_SIZE // 16
+
+
+def encode_base32(value, length):
+    chars = list()
+    for _ in range(length):
+        chars.append(CROCKFORD_BASE32[value & 31])
+        value >>= 5
+    return ''.join(reversed(chars))
+
+
+class CodeGenerator:
+    def __init__(self, worker_id=None):
+        self.fixed_worker_id = worker_id
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """worker id, sequence 초기화 (fork 된 자식 프로세스에서 부모와 다른 값을 쓰도록 다시 호출)"""
+        self.random = random.Random(os.urandom(16))
+
+        worker_id = self.fixed_worker_id
+        if worker_id is None:
+            worker_id = self.random.randrange(WORKER_SIZE)
+
+        if not 0 <= worker_id < WORKER_SIZE:
+            raise ValueError(f'worker id must be between 0 and {WORKER_SIZE - 1}')
+
+        self.worker = encode_base32(worker_id, WORKER_LENGTH)
+        self.last_timestamp = 0
+        self.sequence = 0
+
+    def generate(self):
+        with self.lock:
+            # 시스템 시계가 뒤로 가도 코드가 작아지지 않도록 마지막 시간보다 작으면 마지막 시간 사용
+            timestamp = max(int(time.time() * 1000), self.last_timestamp)
+
+            if timestamp == self.last_timestamp:
+                self.sequence += 1
+
+                # 같은 ms에 sequence를 모두 쓰면 다음 ms로 넘김
+                if self.sequence >= SEQUENCE_SIZE:
+                    timestamp += 1
+                    self.sequence = self.random.randrange(SEQUENCE_START_SIZE)
+            else:
+                self.sequence = self.random.randrange(SEQUENCE_START_SIZE)
+
+            self.last_timestamp = timestamp
+
+            return encode_base32(timestamp, TIMESTAMP_LENGTH) + self.worker + encode_base32(self.sequence, SEQUENCE_LENGTH)
+
+
+code_generator = CodeGenerator(CODE_WORKER_ID)
+
+# gunicorn --preload 처럼 import 후 fork 하는 경우 worker마다 다른 worker id 사용
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=code_generator.reset)
+
+
+def generate_code():
+    return code_generator.generate()
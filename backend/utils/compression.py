@@ -0,0 +1,135 @@
+import zlib
+
+from flask import request
+from werkzeug.wsgi import ClosingIterator
+
+from utils.constant import (
+    COMPRESS_MIN_SIZE,
+    COMPRESS_GZIP_LEVEL,
+    COMPRESS_BROTLI_QUALITY,
+    COMPRESS_MIMETYPES
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+"""응답 압축 기능입니다.
+    요청의 Accept-Encoding(q 값 포함)으로 br, gzip 중 하나를 골라 응답 body를 압축합니다.
+    같은 q 값이면 br을 우선하고, brotli 패키지가 없으면 gzip만 사용합니다.
+    일반 응답은 COMPRESS_MIN_SIZE byte 이상일 때만 압축하고,
+    stream 응답(파일 다운로드, chunked 응답)은 chunk 단위로 압축해서 전체 body를 메모리에 올리지 않습니다.
+    level 기본값은 benchmarks/bench_compression.py 결과로 정했습니다.
+"""
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def choose_encoding(accept_encodings, encodings):
+    """Accept-Encoding에서 q 값이 가장 높은 encoding (같으면 encodings 순서 우선)
+
+    Args:
+        accept_encodings : request.accept_encodings
+        encodings (tuple): 서버가 지원하는 encoding, 우선순위 순서
+
+    Returns:
+        str: 선택된 encoding, 사용할 수 있는 encoding이 없으면 None
+    """
+    result, best_quality = None, 0
+    for encoding in encodings:
+        quality = accept_encodings.quality(encoding)
+        if quality > best_quality:
+            result, best_quality = encoding, quality
+    return result
+
+
+def make_compressor(encoding, config):
+    """(chunk 압축 함수, 마지막 출력 함수)"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=config['COMPRESS_BROTLI_QUALITY'])
+        return compressor.process, compressor.finish
+
+    compressor = zlib.compressobj(config['COMPRESS_GZIP_LEVEL'], zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress, compressor.flush
+
+
+def compress_stream(chunks, encoding, config):
+    """stream 응답 chunk를 순서대로 압축 (압축기가 출력한 byte가 있을 때만 전송)"""
+    compress, finish = make_compressor(encoding, config)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = compress(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+def init_compression(app):
+    """after_request에서 응답 body를 Accept-Encoding에 맞게 압축
+
+    압축하지 않는 응답: 2xx가 아니거나 204, 206인 응답, HEAD 요청, 이미 Content-Encoding이 있는 응답,
+    COMPRESS_MIMETYPES에 없는 mimetype(이미지, xlsx 등 이미 압축된 파일), COMPRESS_MIN_SIZE 미만인 응답
+
+    Args:
+        app : create_app에서 생성한 Flask app
+    """
+    app.config.setdefault('COMPRESS_MIN_SIZE', COMPRESS_MIN_SIZE)
+    app.config.setdefault('COMPRESS_GZIP_LEVEL', COMPRESS_GZIP_LEVEL)
+    app.config.setdefault('COMPRESS_BROTLI_QUALITY', COMPRESS_BROTLI_QUALITY)
+    app.config.setdefault('COMPRESS_MIMETYPES', COMPRESS_MIMETYPES)
+
+    encodings = ('br', 'gzip') if brotli else ('gzip',)
+
+    @app.after_request
+    def compress_response(response):
+        config = app.config
+
+        if (
+            response.mimetype not in config['COMPRESS_MIMETYPES']
+            or not 200 <= response.status_code < 300
+            or response.status_code in (204, 206)
+            or request.method == 'HEAD'
+            or 'Content-Encoding' in response.headers
+        ):
+            return response
+
+        # 압축 여부가 Accept-Encoding에 따라 달라지므로 cache가 구분하도록 항상 추가
+        response.vary.add('Accept-Encoding')
+
+        encoding = choose_encoding(request.accept_encodings, encodings)
+        if not encoding:
+            return response
+
+        if response.is_streamed or response.direct_passthrough:
+            content_length = response.content_length
+            if content_length is not None and content_length < config['COMPRESS_MIN_SIZE']:
+                return response
+
+            # 전송 전에 연결이 끊겨도 원래 응답의 close(파일, DB 연결 정리)가 호출되도록 ClosingIterator 사용
+            response.response = ClosingIterator(
+                compress_stream(response.response, encoding, config),
+                getattr(response.response, 'close', None)
+            )
+            response.direct_passthrough = False
+            del response.headers['Content-Length']
+        else:
+            data = response.get_data()
+            if len(data) < config['COMPRESS_MIN_SIZE']:
+                return response
+
+            if encoding == 'br':
+                response.set_data(brotli.compress(data, quality=config['COMPRESS_BROTLI_QUALITY']))
+            else:
+                compressor = zlib.compressobj(config['COMPRESS_GZIP_LEVEL'], zlib.DEFLATED, _GZIP_WBITS)
+                response.set_data(compressor.compress(data) + compressor.flush())
+
+        response.headers['Content-Encoding'] = encoding
+
+        # 압축된 body는 원본과 byte가 다르므로 strong ETag는 weak로 변경
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+
+        return response
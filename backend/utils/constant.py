@@ -19,4 +19,93 @@ STORE_OUT = 6 # 퇴점
 
 START_DATE = datetime(1111, 1, 1, 0, 0)
 END_DATE = datetime(9999, 12, 31, 23, 59)
-PRODUCT_INFO_NOTICE = "상품 상세 참조"
\ No newline at end of file
+PRODUCT_INFO_NOTICE = "상품 상세 참조"
+
+# 한 요청 안에서 같은 형태의 쿼리가 이 횟수 이상 실행되면 N+1로 판단
+N_PLUS_ONE_THRESHOLD = 5
+
+# 상품 상세 캐시 최대 개수, 유지 시간(초)
+PRODUCT_DETAIL_CACHE_SIZE = 1024
+PRODUCT_DETAIL_CACHE_TTL = 300
+
+# 상품 일괄 등록 최대 개수, 한 트랜잭션에서 등록할 상품 수
+BULK_PRODUCT_MAX_COUNT = 1000
+BULK_PRODUCT_CHUNK_SIZE = 100
+
+# 상품, 옵션 코드가 다른 프로세스의 코드와 중복되었을 때 새 코드로 다시 입력하는 횟수
+CODE_COLLISION_RETRIES = 3
+
+# 상품 파일 import 가능한 확장자
+PRODUCT_IMPORT_EXTENSIONS = ('csv', 'xlsx')
+
+# 상품 이미지 사이즈별 긴 변 길이(px), 저장 품질, 변환 process 수
+IMAGE_SIZES = {
+    'thumbnail' : 150,
+    'list' : 400,
+    'detail' : 1000
+}
+IMAGE_QUALITY = 80
+IMAGE_PROCESS_WORKERS = 2
+
+# presigned url 직접 업로드: url 유효 시간(초), 한 번에 요청할 수 있는 파일 수, 이미지 최대 크기(byte)
+PRESIGNED_UPLOAD_EXPIRES = 600
+PRESIGNED_UPLOAD_MAX_FILES = 20
+UPLOAD_IMAGE_MAX_SIZE = 20 * 1024 * 1024
+
+# 상품 파일 import의 이미지 URL: 허용 scheme, 내려받기 timeout(초)
+IMPORT_IMAGE_SCHEMES = ('http', 'https')
+IMPORT_IMAGE_TIMEOUT = 10
+
+# job_outbox 작업 최대 시도 횟수, 재시도 대기 시간(초, 시도마다 2배), 실행 중 상태 유지 시간(초, 넘으면 worker 종료로 보고 다시 실행)
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_BASE_DELAY = 10
+JOB_RETRY_MAX_DELAY = 3600
+JOB_LOCK_TIMEOUT = 600
+JOB_POLL_INTERVAL = 1
+
+# job_outbox 작업 종류
+PRODUCT_IMAGES_JOB = 'product_images'
+PRODUCT_IMPORT_JOB = 'product_import'
+
+# product_history에 기록하는 products 컬럼, diff 몇 개마다 전체 컬럼 checkpoint를 저장할지
+PRODUCT_HISTORY_COLUMNS = (
+    'is_selling',
+    'is_displayed',
+    'title',
+    'simple_description',
+    'content',
+    'price',
+    'discount_rate',
+    'discount_start_date',
+    'discount_end_date',
+    'min_amount',
+    'max_amount',
+    'manufacturer',
+    'date_of_manufacture',
+    'origin'
+)
+PRODUCT_HISTORY_CHECKPOINT_INTERVAL = 20
+
+# discount scheduler: 미리 읽어 둘 할인 시작, 종료 시점 범위(초), 범위를 다시 읽는 간격(초)
+DISCOUNT_SCHEDULER_HORIZON = 3600
+DISCOUNT_SCHEDULER_RELOAD_INTERVAL = 60
+
+# 응답 압축: 압축할 최소 body 크기(byte), gzip level, brotli quality, 압축할 mimetype
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_GZIP_LEVEL = 6
+COMPRESS_BROTLI_QUALITY = 5
+COMPRESS_MIMETYPES = (
+    'application/json',
+    'text/html',
+    'text/csv',
+    'text/plain'
+)
+
+# table_versions 테이블 이름 (목록, 상세 응답 ETag)
+PRODUCTS_VERSION = 'products'
+ORDERS_VERSION = 'orders'
+SELLERS_VERSION = 'sellers'
+
+# 주문 파일 export: 파일로 내보낼 때 한 번에 쓰는 행 수, 느린 다운로드 중 MySQL이 연결을 끊지 않도록 늘리는 net_write_timeout(초)
+EXPORT_CHUNK_ROWS = 1000
+ORDER_EXPORT_NET_WRITE_TIMEOUT = 600
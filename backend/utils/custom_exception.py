@@ -187,4 +187,17 @@ class DataCannotBeConverted(CustomUserError):
         status_code = 400
         if not dev_error_message:
             dev_error_message = "Data cannot be converted"
-        super().__init__(status_code, dev_error_message, error_message)
\ No newline at end of file
+        super().__init__(status_code, dev_error_message, error_message)
+class InvalidFields(CustomUserError):
+    def __init__(self, error_message, dev_error_message=None):
+        status_code = 400
+        if not dev_error_message:
+            dev_error_message = "Invalid fields"
+        super().__init__(status_code, dev_error_message, error_message)
+
+class DuplicateFileName(CustomUserError):
+    def __init__(self, error_message, dev_error_message=None):
+        status_code = 400
+        if not dev_error_message:
+            dev_error_message = "Duplicate file name"
+        super().__init__(status_code, dev_error_message, error_message)
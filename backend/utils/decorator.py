@@ -1,13 +1,13 @@
-import jwt
+import jwt, hashlib
 
-from flask import g, request
+from flask import g, request, current_app, make_response
 from functools import wraps
 
 
 from config import SECRET_KEY
 from connection import get_connection
 
-from admin.model import AccountDao
+from admin.model import AccountDao, VersionDao
 
 from utils.custom_exception import (
     TokenIsEmptyError,
@@ -18,6 +18,7 @@ from utils.custom_exception import (
     MasterLoginRequired,
     SellerLoginRequired
 )
+from utils.constant import SELLER
 
 
 class LoginRequired:
@@ -27,6 +28,7 @@ class LoginRequired:
         seller, master, user의 권한이 필요한 경우를 처리
         
         계정과 권한이 맞으면 g 객체에 account_id와 account_type을 담음
+        계정 조회에 사용한 connection은 view가 끝날 때까지 g.login_conn으로 다른 decorator(ConditionalGet)가 사용
     """
     def __init__(self, *a, **kw):
         if len(a) > 0:
@@ -62,6 +64,7 @@ class LoginRequired:
 
                 g.account_id = result['id']
                 g.account_type_id = result['account_type_id']
+                g.login_conn = conn
 
                 return func(target, *args, **kwargs)
 
@@ -78,4 +81,63 @@ class LoginRequired:
                     except Exception:
                         raise DatabaseCloseFail('서버와 연결을 종료하는 중 에러가 발생했습니다.')
 
-        return wrapper
\ No newline at end of file
+        return wrapper
+
+
+class ConditionalGet:
+    """ 조건부 GET Decorator
+
+        요청 경로, query parameter, Content-Type header(엑셀 요청), 계정과
+        view가 사용하는 테이블의 version(table_versions)으로 ETag를 만들고,
+        If-None-Match가 같으면 view(조회 쿼리)를 실행하지 않고 304를 반환
+
+        version을 view 실행 전에 조회하므로 조회 도중 수정되면 이전 version의 ETag가 붙고
+        다음 요청에서 새 ETag로 다시 조회함 (수정된 데이터에 304를 반환하지 않음)
+
+        per_seller=True 이면 셀러 계정은 자신의 데이터 version만 사용 (셀러 계정의 데이터만 조회하는 view)
+        LoginRequired 아래에 작성 (g.account_id, version 조회는 LoginRequired의 connection(g.login_conn) 사용)
+
+            @LoginRequired('seller')
+            @ConditionalGet(PRODUCTS_VERSION, SELLERS_VERSION, per_seller=True)
+            def get(self, valid):
+    """
+    def __init__(self, *table_names, per_seller=False):
+        self.table_names = table_names
+        self.per_seller = per_seller
+
+    def make_etag(self, versions):
+        key = (
+            request.path,
+            sorted(request.args.items(multi=True)),
+            request.headers.get('Content-Type'),
+            g.account_id,
+            g.account_type_id,
+            versions
+        )
+        return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+    def __call__(self, func):
+        @wraps(func)
+        def wrapper(target, *args, **kwargs):
+            scope_id = g.account_id if self.per_seller and g.account_type_id == SELLER else 0
+
+            versions = VersionDao().get_versions(g.login_conn, {'table_names': self.table_names, 'scope_id': scope_id})
+
+            etag = self.make_etag(tuple(versions.get(table_name, 0) for table_name in self.table_names))
+
+            # 응답 압축으로 weak ETag가 된 경우도 같은 값으로 비교하고, 304에도 받은 형태(weak)로 반환
+            weak = False
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+                weak = not request.if_none_match.contains(etag)
+            else:
+                response = make_response(func(target, *args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak)
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
+
+        return wrapper
@@ -1,5 +1,15 @@
-from io import BytesIO
-from openpyxl import Workbook
+import csv
+import os
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from io import BytesIO, StringIO, TextIOWrapper
+from xml.sax.saxutils import escape
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from utils.constant import EXPORT_CHUNK_ROWS
 
 def export_excel_file(title, result):
     output = BytesIO()
@@ -16,4 +26,197 @@ def export_excel_file(title, result):
 
     write_wb.save(output)
     output.seek(0)
-    return output
\ No newline at end of file
+    return output
+
+def read_file_rows(path, extension, info=None):
+    """csv, xlsx 파일을 한 행씩 읽는 generator
+
+    첫 행을 header로 사용하고, 파일 전체를 메모리에 올리지 않는다. (xlsx는 read-only 모드)
+    진행률 계산을 위해 행 수를 세는 별도 읽기 없이, 읽는 동안 info에 파일 정보를 기록한다.
+
+    Args:
+        path (str): 파일 경로
+        extension (str): 'csv' 또는 'xlsx'
+        info (dict): csv는 {'size': 파일 크기, 'position': 지금까지 읽은 byte},
+            xlsx는 {'total_rows': 파일에 기록된 범위 기준 header를 제외한 행 수, 없으면 None}
+
+    Yields:
+        (int, dict): (파일에서의 행 번호, {header: 값}), 빈 행은 건너뜀
+    """
+    if info is None:
+        info = dict()
+
+    if extension == 'csv':
+        # 엑셀에서 저장한 csv의 BOM 제거
+        with open(path, 'rb') as raw, TextIOWrapper(raw, encoding='utf-8-sig', newline='') as f:
+            info['size'] = os.fstat(raw.fileno()).st_size
+            reader = csv.reader(f)
+            header = [name.strip() for name in next(reader, [])]
+            for row_number, values in enumerate(reader, start=2):
+                # TextIOWrapper가 미리 읽은 만큼 포함한 위치 (진행률 추정용)
+                info['position'] = raw.tell()
+                if any(value.strip() for value in values):
+                    yield row_number, dict(zip(header, values))
+        return
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        max_row = wb.active.max_row
+        info['total_rows'] = max_row - 1 if max_row else None
+
+        rows = wb.active.iter_rows(values_only=True)
+        header = [str(name).strip() if name is not None else '' for name in next(rows, ())]
+        for row_number, values in enumerate(rows, start=2):
+            if any(value is not None and str(value).strip() for value in values):
+                yield row_number, dict(zip(header, values))
+    finally:
+        wb.close()
+
+def stream_csv_file(title, rows, chunk_rows=EXPORT_CHUNK_ROWS):
+    """행을 읽는 대로 csv로 변환하는 generator (엑셀에서 한글이 깨지지 않도록 BOM 포함)
+
+    Args:
+        title (dict): {행의 key: 열 제목}, 열 순서
+        rows (iterable): dict 행
+        chunk_rows (int): 한 번에 내보낼 행 수
+
+    Yields:
+        bytes: csv chunk
+    """
+    buffer = StringIO()
+    buffer.write('\ufeff')
+    writer = csv.writer(buffer)
+    writer.writerow(title.values())
+    yield _drain(buffer).encode()
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow([row[key] for key in title])
+        if count % chunk_rows == 0:
+            yield _drain(buffer).encode()
+
+    yield _drain(buffer).encode()
+
+def _drain(buffer):
+    """StringIO에 쌓인 내용을 꺼내고 비움"""
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+_XLSX_PARTS = {
+    '[Content_Types].xml' : (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels' : (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml' : (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels' : (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    )
+}
+
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_END = '</sheetData></worksheet>'
+
+
+class _StreamWriter:
+    """zipfile이 쓴 byte를 모아 두었다가 꺼내는 write-only 파일 객체
+
+    tell, seek이 없으므로 zipfile은 파일마다 크기, crc를 파일 뒤(data descriptor)에 기록하고 앞으로 돌아가 고쳐 쓰지 않음
+    """
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+def _xlsx_cell(value):
+    if value is None:
+        return '<c/>'
+
+    if isinstance(value, bool):
+        value = int(value)
+
+    if isinstance(value, (int, float, Decimal)):
+        return f'<c><v>{value}</v></c>'
+
+    if isinstance(value, datetime):
+        value = value.strftime('%Y-%m-%d %H:%M:%S')
+    elif isinstance(value, date):
+        value = value.strftime('%Y-%m-%d')
+
+    # 엑셀이 읽지 못하는 제어 문자 제거
+    value = escape(ILLEGAL_CHARACTERS_RE.sub('', str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{value}</t></is></c>'
+
+def _xlsx_row(values):
+    return '<row>' + ''.join(_xlsx_cell(value) for value in values) + '</row>'
+
+def stream_xlsx_file(title, rows, chunk_rows=EXPORT_CHUNK_ROWS):
+    """행을 읽는 대로 xlsx로 변환하는 generator
+
+    openpyxl write-only 모드도 행을 임시 파일에 모은 뒤 save 할 때 zip을 만들기 때문에 다운로드가 바로 시작되지 않아,
+    시트 XML을 zip에 압축하면서 chunk_rows 행마다 만들어진 byte를 바로 내보냄
+    셀 값은 inline 문자열과 숫자만 사용 (날짜는 'YYYY-MM-DD HH:MM:SS' 문자열)
+
+    Args:
+        title (dict): {행의 key: 열 제목}, 열 순서
+        rows (iterable): dict 행
+        chunk_rows (int): 한 번에 내보낼 행 수
+
+    Yields:
+        bytes: xlsx(zip) chunk
+    """
+    output = _StreamWriter()
+
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, xml in _XLSX_PARTS.items():
+            archive.writestr(name, xml)
+
+        with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            sheet.write((_SHEET_START + _xlsx_row(title.values())).encode())
+            yield output.drain()
+
+            lines = list()
+            for row in rows:
+                lines.append(_xlsx_row(row[key] for key in title))
+                if len(lines) == chunk_rows:
+                    sheet.write(''.join(lines).encode())
+                    lines.clear()
+                    yield output.drain()
+
+            sheet.write((''.join(lines) + _SHEET_END).encode())
+
+    yield output.drain()
@@ -1,6 +1,9 @@
+from flask import current_app, has_app_context
 from flask.json import JSONEncoder
+from werkzeug.http import http_date
 from decimal import Decimal
 import datetime, json
+import orjson
 
 """JSON format 변환하는 기능입니다.
     serialize가 불가능한 테이터 타입을 변환하거나,
@@ -31,4 +34,56 @@ class CustomJSONEncoder(JSONEncoder):
         if isinstance(obj, datetime.timedelta):
             return str(obj)
 
-        return JSONEncoder.default(self, obj)
\ No newline at end of file
+        return JSONEncoder.default(self, obj)
+
+
+def format_datetime(obj):
+    # obj.strftime('%Y-%m-%d %I:%M:%S')와 같은 결과 (strftime보다 2배 정도 빠름)
+    return '%04d-%02d-%02d %02d:%02d:%02d' % (obj.year, obj.month, obj.day, obj.hour % 12 or 12, obj.minute, obj.second)
+
+
+def format_date(obj):
+    return http_date(obj.timetuple())
+
+
+# 타입별 변환 함수 (CustomJSONEncoder, flask JSONEncoder와 같은 형태로 변환)
+ORJSON_FORMATTERS = {
+    Decimal : float,
+    datetime.datetime : format_datetime,
+    datetime.date : format_date,
+    datetime.timedelta : str
+}
+
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def orjson_default(obj):
+    """orjson이 변환하지 못하는 값 변환
+
+    type으로 변환 함수를 바로 찾고, 등록되지 않은 타입(subclass 등)은 CustomJSONEncoder로 변환
+    """
+    formatter = ORJSON_FORMATTERS.get(type(obj))
+    if formatter:
+        return formatter(obj)
+
+    return CustomJSONEncoder().default(obj)
+
+
+def dumps(obj):
+    """CustomJSONEncoder와 같은 결과를 orjson으로 직렬화
+
+    datetime은 '%Y-%m-%d %I:%M:%S', date는 http date, Decimal은 float, timedelta는 str로 변환하고
+    flask 설정(JSON_SORT_KEYS)에 따라 key를 정렬합니다.
+    orjson이 처리하지 못하는 값(64bit 범위를 넘는 정수 등)은 기존 CustomJSONEncoder로 직렬화합니다.
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    options = ORJSON_OPTIONS
+    if not has_app_context() or current_app.config.get('JSON_SORT_KEYS', True):
+        options |= orjson.OPT_SORT_KEYS
+
+    try:
+        return orjson.dumps(obj, default=orjson_default, option=options)
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, cls=CustomJSONEncoder, sort_keys=bool(options & orjson.OPT_SORT_KEYS), ensure_ascii=False).encode()
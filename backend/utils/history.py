@@ -0,0 +1,76 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+"""상품 history diff 기능입니다.
+    product_history는 변경된 컬럼만 {컬럼: 변경 후 값} JSON(changes)으로 저장하고,
+    일정 횟수마다 전체 컬럼을 저장한 checkpoint를 남깁니다.
+    특정 시점의 상품 정보는 그 시점 이전 마지막 checkpoint에 이후 diff를 순서대로 적용해서 복원합니다.
+"""
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def encode_value(value):
+    if isinstance(value, datetime):
+        return {'datetime': value.strftime(DATETIME_FORMAT)}
+
+    if isinstance(value, Decimal):
+        return {'decimal': str(value)}
+
+    return value
+
+
+def decode_value(value):
+    if isinstance(value, dict):
+        if 'datetime' in value:
+            return datetime.strptime(value['datetime'], DATETIME_FORMAT)
+
+        if 'decimal' in value:
+            return Decimal(value['decimal'])
+
+    return value
+
+
+def make_diff(before: dict, after: dict, columns):
+    """before -> after 에서 값이 바뀐 컬럼
+
+    Returns:
+        dict: {컬럼: 변경 후 값}, 바뀐 컬럼이 없으면 빈 dict
+    """
+    return {column: after[column] for column in columns if before.get(column) != after[column]}
+
+
+def encode_changes(changes: dict):
+    return json.dumps({column: encode_value(value) for column, value in changes.items()}, ensure_ascii=False, separators=(',', ':'))
+
+
+def decode_changes(changes: str):
+    return {column: decode_value(value) for column, value in json.loads(changes).items()}
+
+
+def apply_history(rows, columns):
+    """checkpoint부터 순서대로 조회한 history row에 diff를 적용
+
+    Args:
+        rows (list): id 순서의 history row, 첫 row는 checkpoint
+        columns: 복원할 컬럼
+
+    Yields:
+        (row, state, changes): history row, 그 row 적용 후 전체 컬럼 값, 그 row에서 바뀐 컬럼
+    """
+    state = None
+    for row in rows:
+        if row['is_checkpoint']:
+            changes = {column: row[column] for column in columns}
+            if state is not None:
+                changes = make_diff(state, changes, columns)
+            state = {column: row[column] for column in columns}
+        else:
+            # 이전 checkpoint가 없는 diff는 복원할 수 없으므로 건너뜀
+            if state is None:
+                continue
+            changes = decode_changes(row['changes'])
+            state.update(changes)
+
+        yield row, dict(state), changes
@@ -0,0 +1,152 @@
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from urllib.error import URLError
+from urllib.parse import urlparse
+from urllib.request import HTTPRedirectHandler, Request, build_opener
+import ipaddress
+import socket
+import threading
+
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from utils.constant import (
+                            IMAGE_SIZES,
+                            IMAGE_QUALITY,
+                            IMAGE_PROCESS_WORKERS,
+                            IMPORT_IMAGE_SCHEMES,
+                            IMPORT_IMAGE_TIMEOUT,
+                            UPLOAD_IMAGE_MAX_SIZE
+)
+from utils.custom_exception import DataNotExists, DataTypeDoesNotMatch, TooMuchDataRequests
+
+"""상품 이미지 사이즈별 변환 기능입니다.
+    원본 이미지로 IMAGE_SIZES의 사이즈(긴 변 기준, 원본보다 크게 늘리지 않음)별 이미지를 만들고
+    WebP(지원하지 않는 환경에서는 JPEG)로 저장합니다.
+    변환은 CPU 작업이라 요청 thread에서 GIL을 잡지 않도록 process pool에서 실행합니다.
+    파일 import의 외부 이미지 URL은 download_image로 내려받아 같은 변환, 저장 과정을 거칩니다.
+"""
+
+if features.check('webp'):
+    IMAGE_FORMAT, IMAGE_EXTENSION, IMAGE_CONTENT_TYPE = 'WEBP', 'webp', 'image/webp'
+else:
+    IMAGE_FORMAT, IMAGE_EXTENSION, IMAGE_CONTENT_TYPE = 'JPEG', 'jpg', 'image/jpeg'
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_image_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=IMAGE_PROCESS_WORKERS)
+        return _pool
+
+
+def resize_image(data: bytes):
+    """원본 이미지 bytes로 사이즈별 이미지 생성 (process pool에서 실행)
+
+    Args:
+        data (bytes): 원본 이미지
+
+    Returns:
+        dict: {사이즈 이름: 변환된 이미지 bytes}, 이미지가 아니면 None
+    """
+    try:
+        image = Image.open(BytesIO(data))
+        # 휴대폰 사진의 회전 정보 적용
+        image = ImageOps.exif_transpose(image)
+    except (UnidentifiedImageError, OSError):
+        return None
+
+    # 투명도가 있는 이미지는 WebP만 그대로 저장할 수 있음
+    mode = 'RGBA' if IMAGE_FORMAT == 'WEBP' and image.mode in ('RGBA', 'LA', 'P') else 'RGB'
+    image = image.convert(mode)
+
+    results = dict()
+    for name, max_size in IMAGE_SIZES.items():
+        resized = image.copy()
+        resized.thumbnail((max_size, max_size), Image.LANCZOS)
+
+        output = BytesIO()
+        resized.save(output, IMAGE_FORMAT, quality=IMAGE_QUALITY)
+        results[name] = output.getvalue()
+
+    return results
+
+
+def resize_images(images_data: list):
+    """여러 이미지를 process pool에서 동시에 변환
+
+    Args:
+        images_data (list): 원본 이미지 bytes list
+
+    Raises:
+        DataTypeDoesNotMatch: 이미지 파일이 아닌 경우
+
+    Returns:
+        list: images_data 순서대로 resize_image 결과
+    """
+    results = list(get_image_pool().map(resize_image, images_data))
+
+    if any(result is None for result in results):
+        raise DataTypeDoesNotMatch('이미지 파일만 업로드할 수 있습니다.')
+
+    return results
+
+
+class NoRedirectHandler(HTTPRedirectHandler):
+    """redirect를 따라가지 않음 (확인한 host가 아닌 곳으로 요청하지 않도록)"""
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+def check_image_url(url: str):
+    """이미지 URL이 http(s) 주소인지 확인
+
+    Raises:
+        DataTypeDoesNotMatch: http, https 주소가 아닌 경우
+    """
+    parsed = urlparse(url)
+    if parsed.scheme.lower() not in IMPORT_IMAGE_SCHEMES or not parsed.hostname:
+        raise DataTypeDoesNotMatch('이미지 URL은 http, https 주소만 입력할 수 있습니다.')
+    return url
+
+
+def download_image(url: str):
+    """외부 이미지 URL 내려받기 (worker에서 실행)
+
+    내부망(사설, loopback, link-local 등) 주소로 요청하지 않도록 host가 공인 IP로만 변환되는 경우에만 요청
+
+    Raises:
+        DataTypeDoesNotMatch: http(s) 주소가 아니거나 내부망 주소, 이미지가 아닌 응답인 경우
+        DataNotExists: 접속할 수 없거나 응답이 실패한 경우
+        TooMuchDataRequests: 이미지 크기가 UPLOAD_IMAGE_MAX_SIZE 보다 큰 경우
+
+    Returns:
+        tuple: (이미지 bytes, content type)
+    """
+    parsed = urlparse(check_image_url(url))
+
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(parsed.hostname, parsed.port or 443)}
+    except (socket.gaierror, ValueError):
+        raise DataNotExists('이미지 URL에 접속할 수 없습니다.')
+
+    if not all(ipaddress.ip_address(address.split('%')[0]).is_global for address in addresses):
+        raise DataTypeDoesNotMatch('이미지 URL 주소가 올바르지 않습니다.')
+
+    try:
+        with build_opener(NoRedirectHandler).open(Request(url), timeout=IMPORT_IMAGE_TIMEOUT) as response:
+            content_type = response.headers.get_content_type()
+            data = response.read(UPLOAD_IMAGE_MAX_SIZE + 1)
+    except (URLError, OSError, ValueError):
+        raise DataNotExists('이미지 URL에서 이미지를 내려받을 수 없습니다.')
+
+    if not content_type.startswith('image/'):
+        raise DataTypeDoesNotMatch('이미지 URL이 이미지 파일이 아닙니다.')
+
+    if len(data) > UPLOAD_IMAGE_MAX_SIZE:
+        raise TooMuchDataRequests('이미지 파일 크기가 너무 큽니다.')
+
+    return data, content_type
@@ -0,0 +1,46 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+"""금액 계산 기능입니다.
+    금액은 원 단위 int, 할인율은 basis point(1% = 100) int로 계산합니다.
+    DB의 DECIMAL 할인율은 조회할 때 한 번만 basis point로 바꾸고 (SQL에서 CAST(rate * 10000 AS SIGNED)),
+    이후 계산은 int 연산만 사용하므로 행마다 Decimal, float 변환이 생기지 않고 반올림 오차도 없습니다.
+    할인가, 주문 금액은 기존 계산(int(가격 * (1 - 할인율) * 수량)), DB의 effective_price와 같이 원 단위 버림입니다.
+"""
+
+RATE_SCALE = 10000
+
+
+def rate_to_bp(rate):
+    """DECIMAL, float, str 할인율(0.15) -> basis point(1500)"""
+    if rate is None:
+        return 0
+
+    return int((Decimal(str(rate)) * RATE_SCALE).to_integral_value(ROUND_HALF_UP))
+
+
+def bp_to_percent(rate_bp: int):
+    """basis point -> 정수 % (1500 -> 15)"""
+    return rate_bp // 100
+
+
+def discounted_price(price: int, rate_bp: int):
+    """할인가 (원 단위 버림)"""
+    return price * (RATE_SCALE - rate_bp) // RATE_SCALE
+
+
+def line_total(price: int, rate_bp: int, quantity: int):
+    """주문 금액 = 가격 * (1 - 할인율) * 수량 (원 단위 버림)"""
+    return price * (RATE_SCALE - rate_bp) * quantity // RATE_SCALE
+
+
+def line_totals(rows, price_key='price', rate_key='discount_rate_bp', quantity_key='quantity'):
+    """DAO 조회 결과 여러 행의 주문 금액을 한 번에 계산 (export 등 많은 행에서 행마다 함수 호출 없이 계산)
+
+    Args:
+        rows (list): DAO 조회 결과 dict list
+        price_key, rate_key, quantity_key (str): 가격, 할인율(basis point), 수량 key
+
+    Returns:
+        list: 행 순서대로 주문 금액
+    """
+    return [row[price_key] * (RATE_SCALE - row[rate_key]) * row[quantity_key] // RATE_SCALE for row in rows]
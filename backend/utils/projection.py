@@ -0,0 +1,75 @@
+from utils.custom_exception import InvalidFields
+
+"""리스트 조회 field projection 기능입니다.
+    DAO마다 출력 field -> (SELECT 컬럼, 필요한 join) map과 join 이름 -> (JOIN 절, 먼저 필요한 join) map을 두고
+    요청한 fields와 검색 조건에 필요한 컬럼, join만으로 SQL을 만듭니다.
+    fields는 컬럼만 고르고 행 수는 바꾸지 않아야 하므로, 행이 늘거나(1:N) 빠질 수 있는(FK 없는 INNER JOIN) join은
+    DAO의 BASE_JOINS에 두고 fields와 관계없이 항상 extra_joins로 넘깁니다.
+    개수(COUNT) 쿼리는 fields 없이 BASE_JOINS와 검색 조건 join만으로 만듭니다.
+
+        LIST_FIELDS = {
+            'order_number' : (('o.order_number',), ()),
+            'brand_name' : (('s.korean_brand_name AS brand_name',), ('sellers',))
+        }
+        LIST_JOINS = {
+            'products' : ("INNER JOIN products AS p ON p.id = d.product_id", ()),
+            'sellers' : ("INNER JOIN sellers AS s ON s.id = p.seller_id", ('products',))
+        }
+"""
+
+
+def parse_fields(fields, field_map):
+    """query parameter fields('id,title') -> 출력 field tuple
+
+    Args:
+        fields (str): 콤마로 구분한 field 이름, 없으면 field_map 전체
+        field_map (dict): 출력 field -> (SELECT 컬럼 tuple, join 이름 tuple)
+
+    Returns:
+        tuple: 요청 순서대로 중복을 제거한 field 이름
+
+    Raises:
+        InvalidFields: field_map에 없는 field를 요청했을 때
+    """
+    if not fields:
+        return tuple(field_map)
+
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(',') if name.strip()))
+    unknown = [name for name in names if name not in field_map]
+
+    if not names or unknown:
+        raise InvalidFields(
+            '조회할 수 없는 항목입니다.',
+            f"unknown fields: {', '.join(unknown)} (allowed: {', '.join(field_map)})"
+        )
+
+    return names
+
+
+def select_columns(fields, field_map):
+    """요청한 field의 SELECT 컬럼 (여러 field가 같은 컬럼을 쓰면 한 번만)"""
+    columns = dict.fromkeys(column for field in fields for column in field_map[field][0])
+    return ',\n                '.join(columns)
+
+
+def join_clause(fields, field_map, join_map, extra_joins=()):
+    """요청한 field와 검색 조건(extra_joins)에 필요한 join만 join_map 순서대로 이어 붙인 JOIN 절
+
+    Args:
+        fields (tuple): parse_fields 결과
+        field_map (dict): 출력 field -> (SELECT 컬럼 tuple, join 이름 tuple)
+        join_map (dict): join 이름 -> (JOIN 절, 먼저 필요한 join 이름 tuple), 앞의 join에만 의존하도록 순서대로 작성
+        extra_joins (iterable): 검색 조건에 필요한 join 이름
+
+    Returns:
+        str: JOIN 절
+    """
+    needed = set()
+    stack = [join for field in fields for join in field_map[field][1]] + list(extra_joins)
+    while stack:
+        join = stack.pop()
+        if join not in needed:
+            needed.add(join)
+            stack.extend(join_map[join][1])
+
+    return '\n            '.join(sql for join, (sql, _) in join_map.items() if join in needed)
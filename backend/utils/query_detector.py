@@ -0,0 +1,154 @@
+import logging
+import re
+import threading
+import traceback
+from collections import Counter
+
+from flask import g
+from pymysql.cursors import DictCursor, SSDictCursor
+
+from utils.constant import N_PLUS_ONE_THRESHOLD
+
+"""N+1 쿼리 감지 기능입니다.
+    커서가 실행하는 모든 SQL을 fingerprint(값을 제거한 SQL 형태)로 기록하고,
+    한 요청 안에서 같은 fingerprint가 threshold 이상 반복되면 stack trace와 함께 경고합니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_LIST = re.compile(r"\bvalues\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql):
+    """SQL에서 값을 제거해 같은 형태의 쿼리를 하나로 묶기 위한 문자열을 만든다.
+
+    Args:
+        sql (str): 실행된 SQL
+
+    Returns:
+        str: 소문자, 값은 ?, IN/VALUES 목록은 하나로 축약된 SQL
+    """
+    result = _STRING_LITERAL.sub('?', sql)
+    result = _NUMBER_LITERAL.sub('?', result)
+    result = _WHITESPACE.sub(' ', result).strip().lower()
+    result = _IN_LIST.sub('in (...)', result)
+    result = _VALUES_LIST.sub(r'values \1', result)
+    return result
+
+
+def _active_recorders():
+    if not hasattr(_local, 'recorders'):
+        _local.recorders = list()
+    return _local.recorders
+
+
+class QueryRecorder:
+    """현재 스레드에서 실행되는 쿼리를 기록
+
+        with QueryRecorder() as recorder:
+            ...
+        recorder.repeated() 로 threshold 이상 반복된 쿼리를 확인
+    """
+    def __init__(self, threshold=N_PLUS_ONE_THRESHOLD):
+        self.threshold = threshold
+        self.queries = list()
+        self.counts = Counter()
+        self.stacks = dict()
+
+    def __enter__(self):
+        _active_recorders().append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _active_recorders().remove(self)
+
+    def __len__(self):
+        return len(self.queries)
+
+    def record(self, sql):
+        key = fingerprint(sql)
+        self.queries.append(sql)
+        self.counts[key] += 1
+
+        # stack trace는 threshold에 도달한 시점에 한 번만 저장
+        if self.counts[key] == self.threshold:
+            self.stacks[key] = ''.join(traceback.format_stack()[:-2])
+
+    def repeated(self, threshold=None):
+        """threshold 이상 반복된 쿼리 목록
+
+        Returns:
+            [list]:
+                [
+                    {'fingerprint' : 쿼리 형태, 'count' : 실행 횟수, 'stack' : 반복이 감지된 위치},
+                    ...
+                ]
+        """
+        threshold = threshold or self.threshold
+        return [
+            {
+                'fingerprint' : key,
+                'count' : count,
+                'stack' : self.stacks.get(key, '')
+            }
+            for key, count in self.counts.most_common() if count >= threshold
+        ]
+
+    def report(self, threshold=None):
+        return '\n'.join(
+            f"{item['count']}x {item['fingerprint']}\n{item['stack']}"
+            for item in self.repeated(threshold)
+        )
+
+
+class QueryCountingMixin:
+    """실제 DB로 전송되는 쿼리(_query)를 활성화된 QueryRecorder에 기록"""
+    def _query(self, q):
+        for recorder in _active_recorders():
+            recorder.record(q)
+        return super()._query(q)
+
+
+class QueryCountingCursor(QueryCountingMixin, DictCursor):
+    pass
+
+
+class QueryCountingSSCursor(QueryCountingMixin, SSDictCursor):
+    """결과를 한 번에 받지 않고 iterate 할 때 한 행씩 읽는 unbuffered cursor (파일 export 용)"""
+    pass
+
+
+def init_query_detector(app):
+    """요청마다 QueryRecorder를 열고 요청이 끝나면 반복된 쿼리를 경고
+
+    app.config['QUERY_DETECTOR'] 가 True 이거나 debug, testing 모드일 때 동작한다.
+
+    Args:
+        app : create_app에서 생성한 Flask app
+    """
+    app.config.setdefault('QUERY_DETECTOR', False)
+    app.config.setdefault('N_PLUS_ONE_THRESHOLD', N_PLUS_ONE_THRESHOLD)
+
+    def is_enabled():
+        return app.config['QUERY_DETECTOR'] or app.debug or app.testing
+
+    @app.before_request
+    def start_query_recorder():
+        if is_enabled():
+            g.query_recorder = QueryRecorder(app.config['N_PLUS_ONE_THRESHOLD']).__enter__()
+
+    @app.teardown_request
+    def check_query_recorder(e=None):
+        recorder = g.pop('query_recorder', None)
+        if not recorder:
+            return
+
+        recorder.__exit__()
+        if recorder.repeated():
+            logger.warning("N+1 query detected (%d queries in request)\n%s", len(recorder), recorder.report())
@@ -1,3 +1,8 @@
+from flask import Response
+from werkzeug.wsgi import ClosingIterator
+
+from utils.formatter import dumps
+
 def error_response(user_error_message, dev_error_message, status_code=500):
     response = {
                     "user_error_message" : user_error_message,
@@ -21,12 +26,36 @@ def post_response(data, status_code=200):
                 
     return response
 
+def json_response(data, status_code=200):
+    """dict를 orjson으로 직렬화한 JSON Response로 반환 (flask jsonify 대신 사용)"""
+    return Response(dumps(data), status=status_code, mimetype='application/json')
+
+def file_response(chunks, filename, mimetype, conn=None):
+    """파일 chunk를 받는 대로 보내는 다운로드 Response
+
+    Args:
+        chunks (iterable): 파일 byte chunk (generator)
+        filename (str): 다운로드 파일명
+        mimetype (str): 파일 mimetype
+        conn (Connection): chunks가 읽는 DB 커넥션, 전송이 끝나거나 연결이 끊기면 닫음
+
+    Returns:
+        Response: stream 응답
+    """
+    response = Response(
+        ClosingIterator(chunks, conn.close if conn else None),
+        mimetype=mimetype,
+        direct_passthrough=True
+    )
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    return response
+
 def get_response(result, status_code=200):
     response = {
                     "result" : result,
                     "status_code": status_code
                 }
-    return response
+    return json_response(response)
 
 def post_response_with_return(message, fail_return, status_code=200):
     response = {
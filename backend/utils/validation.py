@@ -1,5 +1,5 @@
 from datetime import datetime
-from utils.custom_exception import DataTypeDoesNotMatch
+from utils.custom_exception import DataTypeDoesNotMatch, RequiredDataError
 
 # seller_id, property_id, category_id, sub_category_id, color_id, size_id, stock, min_amount, max_amount, price
 def validate_integer(value):
@@ -53,4 +53,62 @@ def validate_date(value):
         return dt_obj
     
     except ValueError:
-        raise DataTypeDoesNotMatch('날짜 입력값의 형태가 올바르지 않습니다.')
\ No newline at end of file
+        raise DataTypeDoesNotMatch('날짜 입력값의 형태가 올바르지 않습니다.')
+
+# 상품 등록 (단건, 일괄, 파일 import)
+def check_product_required_data(body: dict):
+    """상품 등록 필수 입력값 확인
+
+    Args:
+        body (dict): {'basic_info': 상품 기본 정보, 'selling_info': 상품 판매 정보, 'option_info': 옵션 상품 리스트}
+
+    Raises:
+        RequiredDataError: 필수 데이터가 없을 시 발생하는 에러
+
+    Returns:
+        tuple: (basic_info, selling_info, option_info)
+    """
+    if 'basic_info' not in body:
+        raise RequiredDataError('상품 기본 정보를 입력하세요.')
+
+    if 'selling_info' not in body:
+        raise RequiredDataError('상품 판매 정보를 입력하세요.')
+    
+    basic_info = body['basic_info']
+    selling_info = body['selling_info']
+    option_info = body.get('option_info', None)
+
+    # 필수 입력값 확인
+    if 'seller_id' not in basic_info:
+        raise RequiredDataError('판매자 정보를 입력하세요.')
+
+    if 'is_selling' not in basic_info:
+        raise RequiredDataError('판매여부를 선택하세요.')
+
+    if 'is_displayed' not in basic_info:
+        raise RequiredDataError('진열여부를 선택하세요.')
+
+    if 'property_id' not in basic_info:
+        raise RequiredDataError('판매자 속성을 선택하세요.')
+
+    if 'category_id' not in basic_info:
+        raise RequiredDataError('1차 카테고리를 선택하세요.')
+
+    if 'sub_category_id' not in basic_info:
+        raise RequiredDataError('2차 카테고리를 선택하세요.')
+
+    if 'title' not in basic_info:
+        raise RequiredDataError('상품명을 입력하세요.')
+
+    if 'content' not in basic_info:
+        raise RequiredDataError('상품 상세 정보를 입력하세요.')
+
+    if 'price' not in selling_info:
+        raise RequiredDataError('상품 가격을 입력하세요.')
+
+    for option in option_info or list():
+
+        if 'price' not in option:
+            raise RequiredDataError('옵션 상품 가격을 입력하세요.')
+
+    return basic_info, selling_info, option_info